@@ -0,0 +1,77 @@
+"""
+Benchmark: requests/sec through ``APIClient.request`` with and without connection pooling.
+
+Runs against the in-process stub API (:mod:`server.stub_api_server`) so the numbers only
+reflect client-side overhead (TCP handshakes, pool reuse), not the real API server.
+
+Usage:
+    python -m benchmarks.bench_connection_pooling --requests 2000 --threads 8
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import requests
+import yaml
+
+from sdk.api_client import APIClient
+from server.stub_api_server import StubAPI, StubAPIServer
+
+
+def make_client(base_url, maxsize):
+    """
+    Creates an APIClient pointed at ``base_url`` through a temporary config file.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as file:
+        yaml.safe_dump({"api_key": "bench", "base_url": base_url, "pool": {"maxsize": maxsize}}, file)
+    try:
+        return APIClient(config_path=file.name)
+    finally:
+        os.unlink(file.name)
+
+
+def _run(client, endpoint, total, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: client.request("GET", endpoint), range(total)))
+    return total / (time.perf_counter() - start)
+
+
+def run(total=2000, threads=8):
+    """
+    Measures requests/sec for the pooled client and for one fresh connection per call.
+    :return: A dictionary with ``pooled_rps``, ``unpooled_rps`` and ``speedup``.
+    """
+    api = StubAPI()
+    endpoint = f"contacts/{api.add_contacts(1)[0]}"
+    with StubAPIServer(api) as server:
+        with make_client(server.url, maxsize=threads) as client:
+            pooled = _run(client, endpoint, total, threads)
+
+            # Baseline: the pre-pooling behaviour, a module-level request per call.
+            with patch.object(client, "_get_session", return_value=requests):
+                unpooled = _run(client, endpoint, total, threads)
+
+    return {
+        "requests": total,
+        "threads": threads,
+        "pooled_rps": round(pooled, 1),
+        "unpooled_rps": round(unpooled, 1),
+        "speedup": round(pooled / unpooled, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per run.")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent caller threads.")
+    args = parser.parse_args()
+    print(json.dumps(run(args.requests, args.threads), indent=2))
+
+
+if __name__ == "__main__":
+    main()
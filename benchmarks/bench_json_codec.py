@@ -0,0 +1,126 @@
+"""
+Benchmark: JSON encoding and decoding per codec, on large message pages and webhook bursts.
+
+Pages are ``GET /messages`` responses (``GetMessagesResponse``) of ``--page-sizes`` messages.
+They are decoded from bytes by each codec of :mod:`sdk.utils.codec`, and by the path the
+SDK used before, ``response.json()``, which decodes the bytes to ``str`` first. Bursts are
+signed delivery webhooks handed to :func:`server.webhook_core.process_webhook`, so the
+decoding share of the whole request path shows.
+
+Usage:
+    python -m benchmarks.bench_json_codec --page-sizes 100 1000 --events 20000
+"""
+import argparse
+import json
+import time
+import uuid
+
+from sdk.utils import codec
+from sdk.utils.codec import CODECS
+from sdk.utils.signature import get_verifier
+from server.dispatcher import DEFAULT_EVENT_TYPE, EventDispatcher
+from server.webhook_core import process_webhook
+from server.webhook_keys import WebhookKeys
+
+_SECRET = "benchSecret"
+
+
+def available_codecs():
+    names = []
+    for name in CODECS:
+        try:
+            codec.create_codec(name)
+        except RuntimeError:
+            continue
+        names.append(name)
+    return names
+
+
+def messages_page(size):
+    """
+    A ``GetMessagesResponse`` body of ``size`` delivered messages, as the API encodes it.
+    """
+    messages = [{
+        "id": uuid.uuid4().hex,
+        "from": "+14155550000",
+        "to": {"id": uuid.uuid4().hex, "name": f"Contact {number}", "phone": "+34612345678"},
+        "content": f"Hello from the benchmark, message number {number}. Délivré ✓",
+        "status": "delivered",
+        "createdAt": "2024-01-01T12:00:00Z",
+        "deliveredAt": "2024-01-01T12:00:05Z",
+    } for number in range(size)]
+    return json.dumps({"messages": messages, "page": 1, "quantityPerPage": size}).encode("utf-8")
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_pages(page_sizes, repeat=20):
+    results = {}
+    for size in page_sizes:
+        body = messages_page(size)
+        decoded = json.loads(body)
+        row = {"bytes": len(body),
+               # What requests' response.json() does: decode the bytes to str, then parse the str
+               "requests_json_decode_ms": round(best_time(lambda: json.loads(body.decode("utf-8")), repeat) * 1e3, 3)}
+        for name in available_codecs():
+            json_codec = codec.create_codec(name)
+            row[f"{name}_decode_ms"] = round(best_time(lambda: json_codec.loads(body), repeat) * 1e3, 3)
+            row[f"{name}_encode_ms"] = round(best_time(lambda: json_codec.dumps(decoded), repeat) * 1e3, 3)
+        results[f"page={size}"] = row
+    return results
+
+
+def bench_webhooks(count):
+    verifier = get_verifier(_SECRET)
+    bodies = []
+    for number in range(count):
+        body = json.dumps({"id": f"msg-{number}", "status": "delivered",
+                           "deliveredAt": "2024-01-01T12:00:05Z"}).encode("utf-8")
+        bodies.append((body, f"Signature {verifier.sign(body)}"))
+
+    results = {}
+    previous = codec.get_codec()
+    try:
+        for name in available_codecs():
+            codec.set_codec(name)
+            keys = WebhookKeys([_SECRET])
+            dispatcher = EventDispatcher(queue_size=count)  # Not started: events stay queued
+            dispatcher.register(DEFAULT_EVENT_TYPE, lambda event: None)
+            start = time.perf_counter()
+            for body, authorization in bodies:
+                process_webhook(body, authorization, keys, dispatcher)
+            elapsed = time.perf_counter() - start
+            results[name] = {"events_per_sec": round(count / elapsed)}
+    finally:
+        codec.set_codec(previous)
+    return results
+
+
+def run(page_sizes=(100, 1000), events=20000):
+    """
+    :return: A dictionary of page decode/encode times per codec, and webhook burst throughput per codec.
+    """
+    return {
+        "codecs": available_codecs(),
+        "pages": bench_pages(page_sizes),
+        "webhooks": {"events": events, "results": bench_webhooks(events)},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[100, 1000], help="Messages per page.")
+    parser.add_argument("--events", type=int, default=20000, help="Webhooks per burst.")
+    args = parser.parse_args()
+    print(json.dumps(run(args.page_sizes, args.events), indent=2))
+
+
+if __name__ == "__main__":
+    main()
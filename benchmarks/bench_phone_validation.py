@@ -0,0 +1,55 @@
+"""
+Benchmark: phone numbers validated per second by ``Contacts.validate_phone_numbers``
+across 1, 2, 4 and 8 worker processes.
+
+Usage:
+    python -m benchmarks.bench_phone_validation --numbers 200000 --workers 1 2 4 8
+"""
+import argparse
+import json
+import random
+import time
+
+from sdk.utils.phone import normalize_phone_numbers
+
+# Mix of formats and regions, with roughly one invalid number in ten
+_TEMPLATES = ["+1415{:07d}", "+3461{:07d}", "+4420{:08d}", "06{:08d}", "{:05d}"]
+
+
+def generate_numbers(count, seed=42):
+    """
+    Lazily generates ``count`` synthetic phone numbers.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        template = rng.choice(_TEMPLATES)
+        yield template.format(rng.randrange(10 ** 7))
+
+
+def run(count=200000, workers=(1, 2, 4, 8), chunk_size=1000, default_region="FR"):
+    """
+    Measures throughput for each worker count.
+    :return: A dictionary mapping ``workers=<n>`` to numbers per second.
+    """
+    results = {}
+    for worker_count in workers:
+        start = time.perf_counter()
+        valid = 0
+        for result in normalize_phone_numbers(generate_numbers(count), default_region, worker_count, chunk_size):
+            valid += result.ok
+        elapsed = time.perf_counter() - start
+        results[f"workers={worker_count}"] = {"numbers_per_sec": round(count / elapsed), "valid": valid}
+    return {"numbers": count, "chunk_size": chunk_size, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--numbers", type=int, default=200000, help="Phone numbers per run.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to measure.")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Numbers per worker chunk.")
+    args = parser.parse_args()
+    print(json.dumps(run(args.numbers, args.workers, args.chunk_size), indent=2))
+
+
+if __name__ == "__main__":
+    main()
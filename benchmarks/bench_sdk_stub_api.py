@@ -0,0 +1,80 @@
+"""
+Benchmark: SDK throughput, retries and pagination against the stub API under injected faults.
+
+Each scenario sends messages with ``Messages.send_many`` to a fresh
+:class:`server.stub_api_server.StubAPI` whose faults (latency, 500s, 429s, rate limit) are
+set by the scenario, then pages through the contacts. Faults come from a seeded generator,
+so runs are comparable.
+
+Usage:
+    python -m benchmarks.bench_sdk_stub_api --messages 2000 --concurrency 16 --latency 0.005
+"""
+import argparse
+import json
+import time
+
+from benchmarks.bench_connection_pooling import make_client
+from sdk.resources.contacts import Contacts
+from sdk.resources.messages import Messages
+from server.stub_api_server import Faults, StubAPI, StubAPIServer
+
+SCENARIOS = {
+    "clean": {},
+    "errors": {"error_rate": 0.05},
+    "throttled": {"throttle_rate": 0.1, "retry_after": 0},
+    "rate_limited": {"rate_limit": 500, "retry_after": 0.05},
+}
+
+
+def run_scenario(faults, messages=2000, concurrency=16, contacts=1000, page_size=100):
+    """
+    Sends ``messages`` messages, then lists ``contacts`` contacts, against a stub with ``faults``.
+    :return: A dictionary of send throughput, failures, server-side request count and listing time.
+    """
+    api = StubAPI(faults=faults, delivery_delay=3600)
+    recipient = api.add_contacts(contacts)[0]
+    with StubAPIServer(api) as server, make_client(server.url, maxsize=concurrency) as client:
+        batch = ({"recipient_id": recipient, "content": f"Hello {number}", "sender_phone": "+14155550000"}
+                 for number in range(messages))
+        start = time.perf_counter()
+        failed = sum(not result.ok for result in Messages(client).send_many(batch, concurrency))
+        elapsed = time.perf_counter() - start
+        sent_requests = api.requests
+
+        start = time.perf_counter()
+        listed = sum(1 for _ in Contacts(client).iter_contacts(limit=page_size))
+        list_elapsed = time.perf_counter() - start
+
+    return {
+        "messages_per_sec": round(messages / elapsed),
+        "failed": failed,
+        "server_requests": sent_requests,
+        "contacts_listed": listed,
+        "list_ms": round(list_elapsed * 1000, 1),
+    }
+
+
+def run(messages=2000, concurrency=16, latency=0.005, scenarios=tuple(SCENARIOS)):
+    """
+    Runs each scenario in turn.
+    :return: A dictionary mapping scenario names to their :func:`run_scenario` results.
+    """
+    results = {}
+    for name in scenarios:
+        faults = Faults(latency=latency, **SCENARIOS[name])
+        results[name] = run_scenario(faults, messages, concurrency)
+    return {"messages": messages, "concurrency": concurrency, "latency": latency, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000, help="Messages sent per scenario.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight.")
+    parser.add_argument("--latency", type=float, default=0.005, help="Seconds of latency added by the stub.")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    args = parser.parse_args()
+    print(json.dumps(run(args.messages, args.concurrency, args.latency, args.scenarios), indent=2))
+
+
+if __name__ == "__main__":
+    main()
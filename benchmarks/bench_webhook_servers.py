@@ -0,0 +1,145 @@
+"""
+Benchmark: latency (p50/p99) and requests/sec of the Flask and ASGI webhook servers.
+
+Each server is started as a subprocess on a free local port and receives signed delivery
+events from a pool of keep-alive client threads.
+
+Usage:
+    python -m benchmarks.bench_webhook_servers --requests 5000 --threads 16 --processes 2
+"""
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SECRET = "benchSecret"
+
+SERVERS = {
+    "flask": "server.webhook_server",
+    "asgi": "server.asgi_webhook_server",
+}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_listening(port, process, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode} before listening.")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server did not listen on port {port} within {timeout}s.")
+
+
+def start_server(module, port, processes):
+    """
+    Starts one of the webhook servers as a subprocess.
+    :return: The running ``subprocess.Popen``.
+    """
+    env = dict(
+        os.environ,
+        PYTHONPATH=_ROOT,
+        WEBHOOK_PORT=str(port),
+        WEBHOOK_SECRET=_SECRET,
+        WEB_CONCURRENCY=str(processes),
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", module], cwd=_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_until_listening(port, process)
+    except RuntimeError:
+        process.kill()
+        raise
+    return process
+
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def load(url, total, threads):
+    """
+    Sends ``total`` signed webhook events to ``url`` from ``threads`` threads.
+    :return: A dictionary of throughput, latency percentiles (ms) and status counts.
+    """
+    local = threading.local()
+
+    def send(number):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        body = json.dumps({"id": f"msg-{number}", "status": "delivered", "deliveredAt": "2024-01-01T00:00:00Z"})
+        signature = hmac.new(_SECRET.encode(), body.encode(), hashlib.sha256).hexdigest()
+        start = time.perf_counter()
+        response = session.post(
+            url, data=body, headers={"Content-Type": "application/json", "Authorization": f"Signature {signature}"}
+        )
+        return time.perf_counter() - start, response.status_code
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(send, range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    statuses = {}
+    for _, status in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    return {
+        "requests_per_sec": round(total / elapsed),
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2),
+        "statuses": statuses,
+    }
+
+
+def run(total=5000, threads=16, processes=2, servers=("flask", "asgi")):
+    """
+    Benchmarks each server in turn.
+    :return: A dictionary mapping server names to their :func:`load` results.
+    """
+    results = {}
+    for name in servers:
+        port = _free_port()
+        process = start_server(SERVERS[name], port, processes)
+        try:
+            url = f"http://127.0.0.1:{port}/webhooks"
+            load(url, min(200, total), threads)  # Warm-up
+            results[name] = load(url, total, threads)
+        finally:
+            process.terminate()
+            process.wait(10)
+    return {"requests": total, "threads": threads, "asgi_processes": processes, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="Webhook events per server.")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent client threads.")
+    parser.add_argument("--processes", type=int, default=2, help="Worker processes of the ASGI server.")
+    parser.add_argument("--servers", nargs="+", choices=sorted(SERVERS), default=["flask", "asgi"])
+    args = parser.parse_args()
+    print(json.dumps(run(args.requests, args.threads, args.processes, args.servers), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: events/sec written by the webhook sink, per event versus in batches.
+
+Each writer (JSON Lines, SQLite) receives the same synthetic delivery events through a
+:class:`server.sink.BatchingSink`; ``batch_size=1`` is the one-write-per-event baseline.
+
+Usage:
+    python -m benchmarks.bench_webhook_sink --events 20000 --batch-sizes 1 100 1000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from server.sink import BatchingSink, create_writer
+
+
+def generate_events(count):
+    return [{"id": f"msg-{number}", "status": "delivered", "deliveredAt": "2024-01-01T00:00:00Z"}
+            for number in range(count)]
+
+
+def run(count=20000, batch_sizes=(1, 100, 1000), extensions=(".jsonl", ".db")):
+    """
+    Measures throughput for each writer and batch size.
+    :return: A dictionary mapping ``<writer> batch=<n>`` to events per second.
+    """
+    events = generate_events(count)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in extensions:
+            for batch_size in batch_sizes:
+                path = os.path.join(directory, f"events-{batch_size}{extension}")
+                sink = BatchingSink(create_writer(path), batch_size=batch_size, max_latency=0.05)
+                start = time.perf_counter()
+                for event in events:
+                    sink.put(event)
+                sink.close()
+                elapsed = time.perf_counter() - start
+                results[f"{extension.lstrip('.')} batch={batch_size}"] = {
+                    "events_per_sec": round(count / elapsed),
+                    "batches": sink.batches,
+                }
+    return {"events": count, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000, help="Events per run.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 1000], help="Batch sizes to measure.")
+    args = parser.parse_args()
+    print(json.dumps(run(args.events, args.batch_sizes), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark: appends/sec of the webhook write-ahead spool under each fsync policy.
+
+Several threads append the same signed-webhook-sized records concurrently, as the request
+threads of the webhook server do. Run it on the disk the spool will live on: fsync cost
+depends entirely on the storage.
+
+Usage:
+    python -m benchmarks.bench_webhook_spool --events 5000 --threads 16 --directory /var/spool/webhooks
+"""
+import argparse
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from server.spool import FSYNC_POLICIES, Spool
+
+_RECORD = json.dumps({"id": "d1234567-8abc-4def-9012-3456789abcdef", "status": "delivered",
+                      "deliveredAt": "2024-01-01T12:05:00Z"}).encode("utf-8")
+
+
+def run(count=5000, threads=16, policies=FSYNC_POLICIES, directory=None):
+    """
+    Measures append throughput for each fsync policy.
+    :return: A dictionary mapping ``fsync=<policy>`` to appends per second.
+    """
+    results = {}
+    for policy in policies:
+        with tempfile.TemporaryDirectory(dir=directory) as spool_directory:
+            spool = Spool(spool_directory, fsync=policy)
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                for position in executor.map(lambda _: spool.append(_RECORD), range(count)):
+                    spool.ack(position)
+            elapsed = time.perf_counter() - start
+            spool.close()
+            results[f"fsync={policy}"] = {"appends_per_sec": round(count / elapsed)}
+    return {"events": count, "threads": threads, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=5000, help="Records appended per policy.")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent appending threads.")
+    parser.add_argument("--policies", nargs="+", choices=FSYNC_POLICIES, default=list(FSYNC_POLICIES))
+    parser.add_argument("--directory", help="Where to create the spool (default is the system temp dir).")
+    args = parser.parse_args()
+    print(json.dumps(run(args.events, args.threads, args.policies, args.directory), indent=2))
+
+
+if __name__ == "__main__":
+    main()
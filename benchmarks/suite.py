@@ -0,0 +1,283 @@
+"""
+Benchmark suite: the SDK and webhook hot paths, with regression tracking against a baseline.
+
+Every benchmark runs against local stubs (:mod:`server.stub_api_server`, a webhook server
+subprocess) and reports one or more metrics. Results are written as JSON; given a baseline
+written by an earlier run, metrics that got worse by more than ``--threshold`` are reported
+as regressions and the exit status is 1.
+
+Usage:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline baseline.json --threshold 0.1 --output results.json
+    python -m benchmarks.suite --only verify_signature phone_validation --quick
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.bench_connection_pooling import make_client
+from benchmarks.bench_json_codec import messages_page
+from benchmarks.bench_phone_validation import generate_numbers
+from benchmarks.bench_webhook_servers import SERVERS, _free_port, load, start_server
+from sdk.instrumentation import MetricsObserver
+from sdk.resources.contacts import Contacts
+from sdk.resources.messages import Messages
+from sdk.utils.codec import dumps, get_codec, loads
+from sdk.utils.phone import PhoneNumberCache
+from sdk.utils.signature import get_verifier, verify_signature
+from server.stub_api_server import StubAPI, StubAPIServer
+
+_SECRET = "benchSecret"
+
+
+def metric(value, unit, higher_is_better=True):
+    return {"value": round(value, 3), "unit": unit, "higher_is_better": higher_is_better}
+
+
+def measure_rate(fn, min_time=0.5, repeat=3):
+    """
+    Call ``fn`` repeatedly for at least ``min_time`` seconds, ``repeat`` times.
+    :return: The best calls per second, the least disturbed by other activity on the machine.
+    """
+    best = 0.0
+    for _ in range(repeat):
+        count = 0
+        start = time.perf_counter()
+        while True:
+            fn()
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, count / elapsed)
+    return best
+
+
+def bench_api_round_trip(quick):
+    """
+    ``APIClient.request`` round trips to the stub, one at a time over a kept-alive connection,
+    then with a :class:`sdk.instrumentation.MetricsObserver` attached.
+    """
+    api = StubAPI()
+    endpoint = f"contacts/{api.add_contacts(1)[0]}"
+    min_time = 0.2 if quick else 1.0
+    with StubAPIServer(api) as server, make_client(server.url, maxsize=1) as client:
+        rate = measure_rate(lambda: client.request("GET", endpoint), min_time)
+        client.add_observer(MetricsObserver())
+        observed = measure_rate(lambda: client.request("GET", endpoint), min_time)
+    return {
+        "requests_per_sec": metric(rate, "req/s"),
+        "latency_us": metric(1e6 / rate, "us", False),
+        "observed_requests_per_sec": metric(observed, "req/s"),
+    }
+
+
+def bench_send_message(quick, levels=(1, 8, 32)):
+    """
+    ``Messages.send_message`` throughput through ``send_many`` at several concurrency levels.
+    """
+    count = 200 if quick else 2000
+    results = {}
+    api = StubAPI(delivery_delay=3600)
+    recipient = api.add_contacts(1)[0]
+    with StubAPIServer(api) as server:
+        for concurrency in levels:
+            with make_client(server.url, maxsize=concurrency) as client:
+                messages = Messages(client)
+                batch = ({"recipient_id": recipient, "content": "Hello", "sender_phone": "+14155550000"}
+                         for _ in range(count))
+                start = time.perf_counter()
+                failed = sum(not result.ok for result in messages.send_many(batch, concurrency))
+                elapsed = time.perf_counter() - start
+            if failed:
+                raise RuntimeError(f"{failed} messages failed at concurrency {concurrency}.")
+            results[f"concurrency_{concurrency}_per_sec"] = metric(count / elapsed, "msg/s")
+    return results
+
+
+def bench_phone_validation(quick):
+    """
+    Per-call cost of ``Contacts.validate_phone_number``, on cache misses (parsing) and hits.
+    """
+    numbers = list(dict.fromkeys(generate_numbers(2000 if quick else 20000)))
+    contacts = Contacts(client=None, default_region="FR", phone_cache=PhoneNumberCache(maxsize=len(numbers)))
+
+    def validate_all():
+        start = time.perf_counter()
+        for number in numbers:
+            try:
+                contacts.validate_phone_number(number)
+            except ValueError:
+                pass
+        return (time.perf_counter() - start) / len(numbers)
+
+    miss = validate_all()
+    hit = validate_all()
+    return {"miss_us": metric(miss * 1e6, "us", False), "hit_us": metric(hit * 1e6, "us", False)}
+
+
+def bench_verify_signature(quick, sizes=(256, 4096, 65536, 1048576)):
+    """
+    ``verify_signature`` throughput across payload sizes.
+    """
+    results = {}
+    for size in sizes:
+        payload = b"x" * size
+        signature = get_verifier(_SECRET).sign(payload)
+        rate = measure_rate(lambda: verify_signature(payload, signature, _SECRET), 0.1 if quick else 0.5)
+        results[f"{size}B_per_sec"] = metric(rate, "verify/s")
+    return results
+
+
+def bench_pagination(quick, page_size=100):
+    """
+    Listing every contact with ``Contacts.iter_contacts``, with and without prefetching.
+    """
+    total = 1000 if quick else 10000
+    api = StubAPI()
+    api.add_contacts(total)
+    results = {}
+    with StubAPIServer(api) as server, make_client(server.url, maxsize=2) as client:
+        contacts = Contacts(client)
+        for prefetch in (False, True):
+            start = time.perf_counter()
+            listed = sum(1 for _ in contacts.iter_contacts(limit=page_size, prefetch=prefetch))
+            elapsed = time.perf_counter() - start
+            if listed != total:
+                raise RuntimeError(f"Listed {listed} of {total} contacts.")
+            results["prefetch_per_sec" if prefetch else "sequential_per_sec"] = metric(total / elapsed, "contacts/s")
+    return results
+
+
+def bench_json_codec(quick, page_size=1000):
+    """
+    Decoding and encoding a ``GET /messages`` page of ``page_size`` messages with the active
+    codec (see :mod:`sdk.utils.codec`), recorded in the run's environment.
+    """
+    body = messages_page(page_size)
+    page = loads(body)
+    min_time = 0.1 if quick else 0.5
+    return {
+        "decode_pages_per_sec": metric(measure_rate(lambda: loads(body), min_time), "pages/s"),
+        "encode_pages_per_sec": metric(measure_rate(lambda: dumps(page), min_time), "pages/s"),
+    }
+
+
+def bench_webhooks(quick, server="asgi", threads=8):
+    """
+    Requests/sec and latency of signed ``/webhooks`` posts to a webhook server subprocess.
+    """
+    total = 500 if quick else 3000
+    port = _free_port()
+    process = start_server(SERVERS[server], port, processes=1)
+    try:
+        url = f"http://127.0.0.1:{port}/webhooks"
+        load(url, min(200, total), threads)  # Warm-up
+        result = load(url, total, threads)
+    finally:
+        process.terminate()
+        process.wait(10)
+    return {
+        "requests_per_sec": metric(result["requests_per_sec"], "req/s"),
+        "p99_ms": metric(result["p99_ms"], "ms", False),
+    }
+
+
+BENCHMARKS = {
+    "api_round_trip": bench_api_round_trip,
+    "send_message": bench_send_message,
+    "phone_validation": bench_phone_validation,
+    "verify_signature": bench_verify_signature,
+    "pagination": bench_pagination,
+    "json_codec": bench_json_codec,
+    "webhooks": bench_webhooks,
+}
+
+
+def run(names=tuple(BENCHMARKS), quick=False):
+    """
+    Run the selected benchmarks.
+    :return: A dictionary with the run's ``environment`` and the ``metrics`` of each benchmark.
+    """
+    results = {}
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        results[name] = BENCHMARKS[name](quick)
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "json_codec": get_codec().name,
+            "quick": quick,
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "metrics": results,
+    }
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Compare the metrics of a run with those of a baseline run.
+
+    :param threshold: Relative change in the wrong direction above which a metric regressed.
+    :return: A list of ``{"metric", "baseline", "current", "change", "regression"}`` dictionaries,
+             for the metrics present in both runs.
+    """
+    rows = []
+    for name, metrics in results["metrics"].items():
+        for key, current in metrics.items():
+            previous = baseline.get("metrics", {}).get(name, {}).get(key)
+            if previous is None or not previous["value"]:
+                continue
+            change = (current["value"] - previous["value"]) / previous["value"]
+            worse = -change if current["higher_is_better"] else change
+            rows.append({
+                "metric": f"{name}.{key}",
+                "baseline": previous["value"],
+                "current": current["value"],
+                "change": round(change, 4),
+                "regression": worse > threshold,
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS),
+                        help="Benchmarks to run.")
+    parser.add_argument("--quick", action="store_true", help="Smaller runs, for a smoke test.")
+    parser.add_argument("--output", help="File to write the results to; printed when omitted.")
+    parser.add_argument("--baseline", help="Results of an earlier run to compare with.")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Relative slowdown above which a metric counts as a regression.")
+    args = parser.parse_args()
+
+    results = run(args.only, args.quick)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            results["comparison"] = compare(results, json.load(file), args.threshold)
+        regressions = [row for row in results["comparison"] if row["regression"]]
+        for row in results["comparison"]:
+            flag = "REGRESSION" if row["regression"] else "ok"
+            print(f"{row['metric']:45} {row['baseline']:>12} -> {row['current']:>12} "
+                  f"({row['change']:+.1%}) {flag}", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}.", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -105,9 +105,8 @@ def delete_all_contacts(contacts: Contacts):
     """
     logging.info("Deleting all contacts...")
     try:
-        # Fetch all contacts
-        response = contacts.list_contacts()
-        all_contacts = response.get("contacts", [])
+        # Fetch all contacts, across every page, before deleting any of them
+        all_contacts = list(contacts.iter_contacts())
 
         if not all_contacts:
             logging.info("No contacts found for deletion.")
@@ -0,0 +1,39 @@
+import argparse
+import logging
+from sdk.api_client import APIClient
+from sdk.contact_import import ContactImporter, SqlitePhoneIndex, read_contact_rows
+from sdk.resources.contacts import Contacts
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def main():
+    """
+    Imports contacts from a CSV or JSON Lines file.
+
+    Example:
+        python examples/run_example_import_contacts.py contacts.csv --report import_report.jsonl
+    Re-run with --resume after a crash to continue from the report.
+    """
+    parser = argparse.ArgumentParser(description="Import contacts from a CSV or JSON Lines file.")
+    parser.add_argument("path", help="Input .csv (with a name,phone header) or .jsonl file.")
+    parser.add_argument("--report", default="import_report.jsonl", help="JSON Lines report to write.")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests in flight.")
+    parser.add_argument("--region", default=None, help="Default region for national numbers, e.g. US.")
+    parser.add_argument("--index", default=None,
+                        help="SQLite dedup index file, for very large inputs; kept between runs.")
+    parser.add_argument("--resume", action="store_true", help="Continue from an existing report.")
+    args = parser.parse_args()
+
+    with APIClient(config_path="sdk/config.yaml") as client:
+        contacts = Contacts(client, default_region=args.region)
+        index = SqlitePhoneIndex(args.index) if args.index else None
+        importer = ContactImporter(contacts, args.report, args.concurrency, index=index, resume=args.resume)
+        summary = importer.run(read_contact_rows(args.path))
+
+    logging.info(f"Import summary: {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,15 @@
-import time
 import logging
+import os
+from concurrent.futures import TimeoutError
+from sdk.delivery import DeliveryTracker
 from sdk.resources.contacts import Contacts
 from sdk.resources.messages import Messages
 from sdk.api_client import APIClient
+from server import webhook_server
+
+# Port of the webhook endpoint hosted by this script; point the API server's WEBHOOK_URL at it,
+# e.g. http://host.docker.internal:3011/webhooks, for its callbacks to reach the tracker below
+EXAMPLE_WEBHOOK_PORT = int(os.getenv("EXAMPLE_WEBHOOK_PORT", "3011"))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -13,7 +20,8 @@ def delete_all_contacts(contacts: Contacts):
     :param contacts: Instance of the Contacts resource.
     """
     try:
-        all_contacts = contacts.list_contacts().get("contacts", [])
+        # Collect every page first: deleting while paginating would shift the pages
+        all_contacts = list(contacts.iter_contacts())
         if not all_contacts:
             logging.info("No contacts to delete.")
             return
@@ -62,34 +70,38 @@ def main():
 
     logging.info(f"Created contacts: Alice (ID: {alice['id']}), Bob (ID: {bob['id']})")
 
-    # Step 3: Send a message from Alice to Bob
-    try:
-        message = messages.send_message(
-            sender_phone=alice["phone"],
-            recipient_id=bob["id"],
-            content="Hey, Bob! How are you?"
-        )
-        logging.info(f"Message sent: {message}")
-
-    except Exception as e:
-        logging.error(f"An error occurred while sending a message: {e}")
-        return
-
-    # Step 4: Wait for the webhook to process
-    logging.info("Waiting for the webhook server to process the event...")
-    time.sleep(15)
-
-    # Step 5: Fetch and log the updated message status
-    try:
-        messages_list = messages.list_messages()
-        for msg in messages_list.get("messages", []):
-            if msg["id"] == message["id"]:
-                logging.info(f"Updated message status: {msg}")
-                break
-    except Exception as e:
-        logging.error(f"Failed to fetch updated message status: {e}")
-
-    logging.info("Workflow complete. Check the webhook server logs for the message status update.")
+    # The tracker is fed by a webhook endpoint hosted in this process; a message whose callback
+    # does not arrive within webhook_timeout (e.g. sent to the webhook-server container
+    # instead) is polled with backoff
+    with DeliveryTracker(messages, webhook_timeout=10, poll_interval=1, poll_timeout=60) as tracker:
+        tracker.attach(webhook_server.dispatcher)
+        server = webhook_server.serve_in_background(host="0.0.0.0", port=EXAMPLE_WEBHOOK_PORT)
+        logging.info(f"Receiving delivery webhooks on port {server.port}")
+        try:
+            # Step 3: Send a message from Alice to Bob
+            try:
+                message, delivery = tracker.send_message(
+                    sender_phone=alice["phone"],
+                    recipient_id=bob["id"],
+                    content="Hey, Bob! How are you?"
+                )
+                logging.info(f"Message sent: {message}")
+
+            except Exception as e:
+                logging.error(f"An error occurred while sending a message: {e}")
+                return
+
+            # Step 4: Wait for the message to be delivered (or to fail)
+            logging.info("Waiting for the delivery webhook...")
+            try:
+                final = delivery.result(timeout=90)
+                logging.info(f"Updated message status: {final}")
+            except TimeoutError:
+                logging.error("The message did not reach a final status in time.")
+        finally:
+            server.stop()
+
+    logging.info("Workflow complete.")
 
 
 if __name__ == "__main__":
@@ -1,17 +1,101 @@
 import logging
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
 from .config import Config
+from .instrumentation import RequestEvent, body_size, notify
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .utils.codec import dumps, headers_with_content_type, loads
+from .utils.log import Truncated
+
+logger = logging.getLogger(__name__)
+
+
+def _is_connect_error(error):
+    """
+    Tells whether a requests exception happened while connecting, i.e. before anything was sent.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], "reason", None), (NewConnectionError, ConnectTimeoutError))
+    return False
+
 
 class APIClient:
-    def __init__(self, config_path="config.yaml"):
+    def __init__(self, config_path="config.yaml", rate_limiter=None, observers=None):
         """
         Initializes the API client using the configuration file.
+
+        The client owns a pooled, keep-alive HTTP session; call ``close()`` (or use
+        the client as a context manager) to release its connections.
         :param config_path: Path to the configuration file.
+        :param rate_limiter: A :class:`sdk.ratelimit.RateLimiter` to share with other clients;
+                             by default one is built from the ``rate_limit`` configuration, if any.
+        :param observers: :class:`sdk.instrumentation.RequestObserver` instances notified of
+                          every request attempt, e.g. a ``MetricsObserver``.
         """
         self.config = Config(config_path)
         self.api_key = self.config.api_key
         self.base_url = self.config.base_url
         self.timeout = self.config.timeout
+        self.keepalive_timeout = self.config.keepalive_timeout
+        self.retry_policy = RetryPolicy.from_config(self.config.retry)
+        self.rate_limiter = rate_limiter or RateLimiter.from_config(self.config.rate_limit)
+        self.observers = list(observers or [])
+
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()
+        self.session = self._create_session()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _create_session(self):
+        """
+        Builds a requests session whose adapter keeps connections alive between calls.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+            max_retries=0,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get_session(self):
+        """
+        Returns the pooled session, recycling its connections if they sat idle longer
+        than the configured keep-alive timeout (servers usually drop them by then).
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.keepalive_timeout and now - self._last_used > self.keepalive_timeout:
+                logger.debug("Connection pool idle for %.1fs, recycling it", now - self._last_used)
+                self.session.close()
+            self._last_used = now
+        return self.session
+
+    def close(self):
+        """
+        Closes all pooled connections held by the client.
+        """
+        self.session.close()
+
+    def add_observer(self, observer):
+        """
+        Notify ``observer`` of every request attempt from now on.
+        """
+        self.observers = self.observers + [observer]
 
     def _get_headers(self):
         """
@@ -22,36 +106,96 @@ class APIClient:
             "Content-Type": "application/json"  # Ensure this is included
         }
 
-    def request(self, method, endpoint, params=None, json=None, headers=None):
+    def request(self, method, endpoint, params=None, json=None, headers=None, idempotent=None):
         """
         Sends an HTTP request to the API and handles responses.
+
+        Connection errors, timeouts and retryable statuses are retried according to
+        ``self.retry_policy`` (see :class:`sdk.retry.RetryPolicy`). Every attempt first waits
+        for ``self.rate_limiter``, if set.
         :param method: HTTP method (GET, POST, PATCH, DELETE).
         :param endpoint: API endpoint (e.g., "contacts").
         :param params: Query parameters.
         :param json: Request body as JSON.
+        :param idempotent: Set to True to let a POST or PATCH be resent after failures that may
+                           have reached the server; by default only the policy's methods are.
         :return: Decoded JSON response, or None for 204 No Content.
         """
         url = f"{self.base_url}/{endpoint}"
         if not headers:
             headers = self._get_headers()
+        body = None
+        if json is not None:
+            # Encoded once, whatever the number of attempts
+            body = dumps(json)
+            headers = headers_with_content_type(headers)
+
+        policy = self.retry_policy
+        limiter = self.rate_limiter
+        observers = self.observers
+        event = None
+        deadline = policy.start()
+        attempt = 0
 
         try:
-            response = requests.request(
-                method, url, headers=headers, params=params, json=json, timeout=self.timeout
-            )
-            logging.debug("Response content: %s", response.text)
+            while True:
+                attempt += 1
+                timeout = policy.attempt_timeout(deadline, self.timeout)
+                permit = limiter.acquire(endpoint) if limiter else None
+                if observers:
+                    event = RequestEvent(method, endpoint, attempt)
+                    notify(observers, "on_request_start", event)
+                try:
+                    response = self._get_session().request(
+                        method, url, headers=headers, params=params, data=body, timeout=timeout
+                    )
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    if permit:
+                        permit.release(success=False)
+                    if event:
+                        notify(observers, "on_request_error", event.finish(error=e))
+                    delay = policy.retry_delay(attempt, deadline, method, idempotent, connect_error=_is_connect_error(e))
+                    if delay is None:
+                        raise
+                    logger.warning("Request to %s failed (%s), retrying in %.2fs", url, e, delay)
+                    time.sleep(delay)
+                    continue
+                finally:
+                    if permit:
+                        permit.discard()  # Any other exception; no-op once released
+                if permit:
+                    permit.release(success=response.status_code != 429 and response.status_code < 500)
+                if event:
+                    notify(observers, "on_request_end", event.finish(
+                        response.status_code, body_size(body), len(response.content)
+                    ))
+
+                if response.status_code in policy.statuses:
+                    delay = policy.retry_delay(
+                        attempt, deadline, method, idempotent,
+                        status=response.status_code, retry_after=response.headers.get("Retry-After")
+                    )
+                    if delay is not None:
+                        logger.warning("Request to %s returned %s, retrying in %.2fs", url, response.status_code, delay)
+                        response.close()
+                        time.sleep(delay)
+                        continue
+                break
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response content: %s", Truncated(response.text))
             response.raise_for_status()
 
             if response.status_code == 204:  # Handle successful deletion
                 return None
 
-            return response.json()  # Decode JSON for other responses
+            return loads(response.content)  # Decode JSON for other responses, straight from the bytes
         except requests.exceptions.RequestException as e:
-            logging.error(f"Request to {url} failed: {e}")
+            logger.error("Request to %s failed: %s", url, e)
             raise
         except requests.exceptions.HTTPError as e:
-            logging.error(f"Bad Request for  {url} failed: {e}")
+            logger.error("Bad Request for %s failed: %s", url, e)
             raise
         except ValueError as e:
-            logging.error(f"Failed to decode JSON response from {url}: {e}")
+            logger.error("Failed to decode JSON response from %s: %s", url, e)
             raise
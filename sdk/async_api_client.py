@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from .config import Config
+from .instrumentation import RequestEvent, body_size, notify
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .utils.codec import dumps, headers_with_content_type, loads
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAPIClient:
+    def __init__(self, config_path="config.yaml", rate_limiter=None, observers=None):
+        """
+        Initializes the asyncio API client using the configuration file.
+
+        Requests share one pooled ``aiohttp`` session, created on first use and sized
+        from the same ``pool`` settings as :class:`sdk.api_client.APIClient`. Call
+        ``await close()`` (or use ``async with``) to release its connections.
+        :param config_path: Path to the configuration file.
+        :param rate_limiter: A :class:`sdk.ratelimit.RateLimiter`, possibly shared with other
+                             clients; by default one is built from the ``rate_limit`` configuration, if any.
+        :param observers: :class:`sdk.instrumentation.RequestObserver` instances notified of
+                          every request attempt.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncAPIClient requires aiohttp: pip install 'devexp_sdk[async]'")
+
+        self.config = Config(config_path)
+        self.api_key = self.config.api_key
+        self.base_url = self.config.base_url
+        self.timeout = self.config.timeout
+        self.keepalive_timeout = self.config.keepalive_timeout
+        self.retry_policy = RetryPolicy.from_config(self.config.retry)
+        self.rate_limiter = rate_limiter or RateLimiter.from_config(self.config.rate_limit)
+        self.observers = list(observers or [])
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_session(self):
+        """
+        Returns the pooled session, creating it inside the running event loop.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.pool_connections * self.config.pool_maxsize,
+                limit_per_host=self.config.pool_maxsize,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self):
+        """
+        Closes all pooled connections held by the client.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def add_observer(self, observer):
+        """
+        Notify ``observer`` of every request attempt from now on.
+        """
+        self.observers = self.observers + [observer]
+
+    def _get_headers(self):
+        """
+        Prepares the headers for API requests, including the Authorization header.
+        """
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    @staticmethod
+    def _is_connect_error(error):
+        """
+        Tells whether an aiohttp exception happened while connecting, i.e. before anything was sent.
+        """
+        connect_errors = (aiohttp.ClientConnectorError,) + (
+            (aiohttp.ConnectionTimeoutError,) if hasattr(aiohttp, "ConnectionTimeoutError") else ()
+        )
+        return isinstance(error, connect_errors)
+
+    async def request(self, method, endpoint, params=None, json=None, headers=None, idempotent=None):
+        """
+        Sends an HTTP request to the API and handles responses.
+
+        Failures are retried like in :meth:`sdk.api_client.APIClient.request`.
+        :param method: HTTP method (GET, POST, PATCH, DELETE).
+        :param endpoint: API endpoint (e.g., "contacts").
+        :param params: Query parameters.
+        :param json: Request body as JSON.
+        :param idempotent: Set to True to let a POST or PATCH be resent after failures that may
+                           have reached the server.
+        :return: Decoded JSON response, or None for 204 No Content.
+        """
+        url = f"{self.base_url}/{endpoint}"
+        if not headers:
+            headers = self._get_headers()
+        body = None
+        if json is not None:
+            # Encoded once, whatever the number of attempts
+            body = dumps(json)
+            headers = headers_with_content_type(headers)
+
+        policy = self.retry_policy
+        limiter = self.rate_limiter
+        observers = self.observers
+        event = None
+        deadline = policy.start()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            timeout = policy.attempt_timeout(deadline, self.timeout)
+            delay = None
+            permit = await limiter.acquire_async(endpoint) if limiter else None
+            if observers:
+                event = RequestEvent(method, endpoint, attempt)
+                notify(observers, "on_request_start", event)
+            try:
+                async with self._get_session().request(
+                    method, url, headers=headers, params=params, data=body, timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    if permit:
+                        permit.release(success=response.status != 429 and response.status < 500)
+                    content = await response.read()
+                    if event:
+                        notify(observers, "on_request_end", event.finish(
+                            response.status, body_size(body), len(content)
+                        ))
+                    if response.status in policy.statuses:
+                        delay = policy.retry_delay(
+                            attempt, deadline, method, idempotent,
+                            status=response.status, retry_after=response.headers.get("Retry-After")
+                        )
+                    if delay is None:
+                        response.raise_for_status()
+
+                        if response.status == 204:  # Handle successful deletion
+                            return None
+
+                        return loads(content) if content else None  # Like aiohttp, None for an empty body
+                logger.warning("Request to %s returned %s, retrying in %.2fs", url, response.status, delay)
+            except aiohttp.ClientResponseError as e:
+                logger.error("Bad Request for %s failed: %s", url, e)
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if permit:
+                    permit.release(success=False)
+                if event and event.duration is None:
+                    notify(observers, "on_request_error", event.finish(error=e))
+                delay = policy.retry_delay(attempt, deadline, method, idempotent, connect_error=self._is_connect_error(e))
+                if delay is None:
+                    logger.error("Request to %s failed: %s", url, e)
+                    raise
+                logger.warning("Request to %s failed (%s), retrying in %.2fs", url, e, delay)
+            except ValueError as e:
+                logger.error("Failed to decode JSON response from %s: %s", url, e)
+                raise
+            finally:
+                if permit:
+                    permit.discard()  # Cancellation or any other exception; no-op once released
+            await asyncio.sleep(delay)
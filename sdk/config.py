@@ -16,5 +16,20 @@ class Config:
         self.base_url = config.get("base_url", "http://localhost:3000")
         self.timeout = config.get("timeout", 10)
 
+        # Connection pooling (keep-alive) settings
+        pool = config.get("pool") or {}
+        self.pool_connections = pool.get("connections", 10)
+        self.pool_maxsize = pool.get("maxsize", 10)
+        self.pool_block = pool.get("block", False)
+        self.keepalive_timeout = pool.get("keepalive_timeout", 60)
+
+        # Retry policy settings, see sdk.retry.RetryPolicy
+        self.retry = config.get("retry") or {}
+
+        # Rate limiting settings, see sdk.ratelimit.RateLimiter
+        self.rate_limit = config.get("rate_limit") or {}
+
         if not self.api_key:
             raise ValueError("API key is required in the configuration file.")
+        if self.pool_connections < 1 or self.pool_maxsize < 1:
+            raise ValueError("Pool 'connections' and 'maxsize' must be positive integers.")
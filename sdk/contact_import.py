@@ -0,0 +1,244 @@
+import csv
+import json
+import logging
+import os
+import sqlite3
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Iterator, Set, Tuple
+
+from sdk.utils.concurrency import bounded_map
+
+logger = logging.getLogger(__name__)
+
+
+def read_contact_rows(path: str) -> Iterator[Dict[str, str]]:
+    """
+    Stream contact rows from a CSV (with a header line) or JSON Lines file.
+
+    :param path: Path to a ``.csv`` or ``.jsonl`` file with ``name`` and ``phone`` fields.
+    :return: An iterator of row dictionaries, read lazily.
+    :raises ValueError: If the file extension is not supported.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in (".csv", ".jsonl"):
+        raise ValueError(f"Unsupported contact file '{path}': expected .csv or .jsonl.")
+
+    with open(path, "r", newline="", encoding="utf-8") as file:
+        if extension == ".csv":
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class InMemoryPhoneIndex:
+    """
+    Set of already imported E.164 numbers, held in memory.
+    """
+
+    def __init__(self) -> None:
+        self._phones: Set[str] = set()
+
+    def __contains__(self, phone: str) -> bool:
+        return phone in self._phones
+
+    def add(self, phone: str) -> bool:
+        """
+        Record a phone number.
+
+        :return: True if the number was not seen before.
+        """
+        if phone in self._phones:
+            return False
+        self._phones.add(phone)
+        return True
+
+    def discard(self, phone: str) -> None:
+        self._phones.discard(phone)
+
+    def close(self) -> None:
+        pass
+
+
+class SqlitePhoneIndex:
+    """
+    Set of already imported E.164 numbers, stored in a SQLite file for inputs too large for memory.
+    """
+
+    def __init__(self, path: str, commit_every: int = 1000) -> None:
+        """
+        :param path: Path of the SQLite index file; created if missing.
+        :param commit_every: Number of insertions between commits.
+        """
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS phones (phone TEXT PRIMARY KEY)")
+        self._commit_every = commit_every
+        self._uncommitted = 0
+
+    def __contains__(self, phone: str) -> bool:
+        return self._connection.execute("SELECT 1 FROM phones WHERE phone = ?", (phone,)).fetchone() is not None
+
+    def add(self, phone: str) -> bool:
+        """
+        Record a phone number.
+
+        :return: True if the number was not seen before.
+        """
+        cursor = self._connection.execute("INSERT OR IGNORE INTO phones (phone) VALUES (?)", (phone,))
+        self._uncommitted += 1
+        if self._uncommitted >= self._commit_every:
+            self._connection.commit()
+            self._uncommitted = 0
+        return cursor.rowcount == 1
+
+    def discard(self, phone: str) -> None:
+        self._connection.execute("DELETE FROM phones WHERE phone = ?", (phone,))
+
+    def close(self) -> None:
+        self._connection.commit()
+        self._connection.close()
+
+
+@dataclass
+class ImportSummary:
+    """
+    Counts of rows per outcome for one import run.
+    """
+    created: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    failed: int = 0
+    resumed: int = 0
+
+
+class ContactImporter:
+    """
+    Import contacts from a stream of rows: normalize phones, drop duplicates by E.164 and create
+    the rest concurrently, writing one JSON line per row to a report file.
+
+    The report is flushed line by line. Re-running with ``resume=True`` on the same report
+    skips every row already created, deduplicated or rejected, and retries failed ones.
+
+    A number is added to the index only once its contact is reported as created; numbers of
+    rows still in flight are held in memory. So a run that crashes never leaves a number in
+    a persistent index for a contact that was not created.
+
+    A persistent index outlives the report: a run with ``resume=False`` over an existing
+    :class:`SqlitePhoneIndex` file reports the numbers imported by earlier runs as duplicates.
+    Start from a new index file to import them again.
+    """
+
+    def __init__(
+            self,
+            contacts,
+            report_path: str,
+            concurrency: int = 10,
+            index=None,
+            resume: bool = False
+    ) -> None:
+        """
+        :param contacts: A :class:`sdk.resources.contacts.Contacts` instance.
+        :param report_path: Path of the JSON Lines report.
+        :param concurrency: Maximum number of ``create_contact`` requests in flight (default is 10).
+        :param index: Phone index used for deduplication (default is an :class:`InMemoryPhoneIndex`):
+                      any object supporting ``in``, ``add(phone)`` and ``close()``. It is not
+                      cleared when ``resume`` is False.
+        :param resume: Continue from an existing report instead of starting over.
+        """
+        self.contacts = contacts
+        self.report_path = report_path
+        self.concurrency = concurrency
+        self.index = index if index is not None else InMemoryPhoneIndex()
+        self.resume = resume
+
+    def _load_report(self) -> Set[int]:
+        """
+        Read a previous report: return its finished rows and re-seed the index with created phones.
+        """
+        done = set()
+        if not os.path.exists(self.report_path):
+            return done
+
+        with open(self.report_path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Last line cut short by a crash
+                if entry.get("status") == "failed":
+                    done.discard(entry["row"])
+                    continue
+                done.add(entry["row"])
+                if entry.get("status") == "created":
+                    self.index.add(entry["phone"])
+        return done
+
+    def _rows_to_create(self, rows, done, summary, write, in_flight) -> Iterator[Tuple[int, str, str]]:
+        """
+        Yield ``(row number, name, E.164 phone)`` for rows to create, reporting the others.
+
+        :param in_flight: Numbers of the rows yielded and not finished yet, updated here.
+        """
+        for row_number, row in enumerate(rows, start=1):
+            if row_number in done:
+                summary.resumed += 1
+                continue
+            name, phone = row.get("name"), row.get("phone")
+            try:
+                # Checked here as create_contact would fail the row again on every resume
+                if not isinstance(name, str) or not name.strip():
+                    raise ValueError("Parameter 'name' must be a non-empty string.")
+                e164 = self.contacts.validate_phone_number(phone)
+            except (ValueError, TypeError) as e:
+                summary.invalid += 1
+                write({"row": row_number, "status": "invalid", "phone": phone, "error": str(e)})
+                continue
+            if e164 in in_flight or e164 in self.index:
+                summary.duplicates += 1
+                write({"row": row_number, "status": "duplicate", "phone": e164})
+                continue
+            in_flight.add(e164)
+            yield row_number, name, e164
+
+    def run(self, rows: Iterable[Dict[str, str]]) -> ImportSummary:
+        """
+        Import the given rows.
+
+        :param rows: Iterable of dictionaries with ``name`` and ``phone`` keys, e.g. from
+                     :func:`read_contact_rows`. Row numbers start at 1 and must refer to the
+                     same rows when resuming.
+        :return: An :class:`ImportSummary` of this run.
+        """
+        summary = ImportSummary()
+        done = self._load_report() if self.resume else set()
+        in_flight: Set[str] = set()
+
+        try:
+            with open(self.report_path, "a" if self.resume else "w", encoding="utf-8") as report:
+                def write(entry):
+                    report.write(json.dumps(entry) + "\n")
+                    report.flush()
+
+                results = bounded_map(
+                    lambda item: self.contacts.create_contact(item[1], item[2]),
+                    self._rows_to_create(rows, done, summary, write, in_flight),
+                    self.concurrency
+                )
+                for result in results:
+                    row_number, _, e164 = result.item
+                    in_flight.discard(e164)
+                    if result.ok:
+                        summary.created += 1
+                        write({"row": row_number, "status": "created", "phone": e164, "id": result.result.get("id")})
+                        self.index.add(e164)  # Only once the report records it
+                    else:
+                        # Not indexed, so a later row (or a resumed run) with the same number tries again
+                        summary.failed += 1
+                        write({"row": row_number, "status": "failed", "phone": e164, "error": str(result.error)})
+        finally:
+            self.index.close()
+
+        logger.info("Contact import finished: %s", asdict(summary))
+        return summary
@@ -0,0 +1,244 @@
+import asyncio
+import heapq
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Statuses after which a message no longer changes
+TERMINAL_STATUSES = frozenset(["delivered", "failed"])
+
+
+@dataclass
+class _Tracked:
+    future: Future
+    delay: float  # Current polling interval, doubled after every poll
+    give_up_at: float
+
+
+class DeliveryTracker:
+    """
+    Resolve sent messages to their final status (``delivered`` or ``failed``) from the
+    delivery webhooks, polling ``Messages.get_message`` only for messages whose webhook has
+    not arrived within ``webhook_timeout``.
+
+    Feed it the ``message.delivery`` events of a webhook server running in the same process
+    with :meth:`attach`, e.g. :func:`server.webhook_server.serve_in_background`. Only the
+    events handled by this process reach it: behind several worker processes (the ASGI
+    server's ``WEB_CONCURRENCY``), each one sees only its share and the rest are polled. A
+    webhook may arrive before :meth:`track` is called (the API can call back before the send
+    returns), so the final status of the last ``max_recent`` messages is kept, and also
+    answers repeated waits.
+
+    Polling runs on a single background thread, with the interval doubling from
+    ``poll_interval`` to ``max_poll_interval`` until ``poll_timeout`` elapses.
+    """
+
+    def __init__(
+            self,
+            messages,
+            webhook_timeout: float = 10.0,
+            poll_interval: float = 1.0,
+            max_poll_interval: float = 30.0,
+            poll_timeout: float = 300.0,
+            max_recent: int = 10000,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        :param messages: A :class:`sdk.resources.messages.Messages` instance, used to send and to poll.
+        :param webhook_timeout: Seconds to wait for a webhook before polling a message.
+        :param poll_interval: First polling interval, in seconds.
+        :param max_poll_interval: Maximum polling interval, in seconds.
+        :param poll_timeout: Seconds of polling after which the message's future fails with ``TimeoutError``.
+        :param max_recent: Maximum number of final messages remembered.
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+        self.messages = messages
+        self.webhook_timeout = webhook_timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_timeout = poll_timeout
+        self.max_recent = max_recent
+        self._clock = clock
+        self._pending: Dict[str, _Tracked] = {}
+        self._recent: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._schedule: List[Tuple[float, str]] = []  # Heap of (poll time, message id)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def track(self, message_id: str) -> Future:
+        """
+        Start tracking a sent message; tracking the same id again returns the same future.
+
+        :return: A future resolved with the final message (webhook event or polled message),
+                 or failed with ``TimeoutError`` once polling gives up.
+        :raises RuntimeError: If the tracker is closed.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The delivery tracker is closed.")
+            tracked = self._pending.get(message_id)
+            if tracked is not None:
+                return tracked.future
+
+            future = Future()
+            final = self._recent.get(message_id)
+            if final is not None:
+                future.set_result(final)
+                return future
+
+            now = self._clock()
+            self._pending[message_id] = _Tracked(
+                future, self.poll_interval, now + self.webhook_timeout + self.poll_timeout
+            )
+            heapq.heappush(self._schedule, (now + self.webhook_timeout, message_id))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll_loop, name="delivery-tracker", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def send_message(self, recipient_id: str, content: str, sender_phone: str) -> Tuple[Dict[str, Any], Future]:
+        """
+        Send a message with :meth:`Messages.send_message` and track it.
+
+        :return: The created message and the future of its final status.
+        """
+        message = self.messages.send_message(recipient_id, content, sender_phone)
+        return message, self.track(message["id"])
+
+    def attach(self, dispatcher, event_type: str = "message.delivery") -> None:
+        """
+        Register :meth:`handle_event` for the delivery events of ``dispatcher``, e.g.
+        :data:`server.webhook_server.dispatcher`: any object with ``register(event_type, handler)``.
+        """
+        dispatcher.register(event_type, self.handle_event)
+
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """
+        Resolve the tracked message a ``message.delivery`` webhook event refers to.
+        Events with a non-final status are ignored.
+        """
+        message_id, status = event.get("id"), event.get("status")
+        if not message_id or status not in TERMINAL_STATUSES:
+            return
+        with self._condition:
+            self._remember(message_id, event)
+            tracked = self._pending.pop(message_id, None)
+        if tracked is not None:
+            self._resolve(tracked.future, event)
+
+    def wait(self, message_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Block until the message reaches a final status.
+
+        :return: The final message.
+        :raises TimeoutError: If ``timeout`` elapses first (tracking continues) or polling gave up.
+        """
+        return self.track(message_id).result(timeout)
+
+    async def wait_async(self, message_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Asyncio counterpart of :meth:`wait`; a timeout does not stop the tracking.
+        """
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self.track(message_id))), timeout)
+
+    def close(self) -> None:
+        """
+        Stop polling and cancel the futures of messages still being tracked.
+        """
+        with self._condition:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        for tracked in pending.values():
+            tracked.future.cancel()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _remember(self, message_id: str, message: Dict[str, Any]) -> None:
+        """
+        Keep the final status of a message; called with the lock held.
+        """
+        self._recent[message_id] = message
+        self._recent.move_to_end(message_id)
+        if len(self._recent) > self.max_recent:
+            self._recent.popitem(last=False)
+
+    @staticmethod
+    def _resolve(future: Future, message: Optional[Dict[str, Any]], error: Optional[Exception] = None) -> None:
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(message)
+        except Exception:  # InvalidStateError: cancelled by the caller in the meantime
+            pass
+
+    def _next_due(self) -> Optional[str]:
+        """
+        Wait for the next message to poll; return None once closed. Called with the lock held.
+        """
+        while not self._closed:
+            if not self._schedule:
+                self._condition.wait()
+                continue
+            due_at, message_id = self._schedule[0]
+            now = self._clock()
+            if due_at > now:
+                self._condition.wait(due_at - now)
+                continue
+            heapq.heappop(self._schedule)
+            tracked = self._pending.get(message_id)
+            if tracked is None:
+                continue  # Resolved by a webhook
+            if tracked.future.done():
+                del self._pending[message_id]  # Cancelled by the caller
+                continue
+            return message_id
+        return None
+
+    def _poll_loop(self) -> None:
+        while True:
+            with self._condition:
+                message_id = self._next_due()
+            if message_id is None:
+                return
+
+            try:
+                message = self.messages.get_message(message_id)
+            except Exception as e:
+                logger.warning("Polling message %s failed: %s", message_id, e)
+                message = None
+
+            with self._condition:
+                tracked = self._pending.get(message_id)
+                if tracked is None:
+                    continue
+                if message and message.get("status") in TERMINAL_STATUSES:
+                    del self._pending[message_id]
+                    self._remember(message_id, message)
+                elif self._clock() >= tracked.give_up_at:
+                    del self._pending[message_id]
+                    message = None
+                else:
+                    heapq.heappush(self._schedule, (self._clock() + tracked.delay, message_id))
+                    tracked.delay = min(tracked.delay * 2, self.max_poll_interval)
+                    continue
+
+            if message is not None:
+                self._resolve(tracked.future, message)
+            else:
+                self._resolve(tracked.future, None, TimeoutError(f"Message {message_id} has no final status yet."))
@@ -0,0 +1,293 @@
+import bisect
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency histogram buckets, in seconds: 100us to ~105s, sqrt(2) apart
+LATENCY_BUCKETS = tuple(1e-4 * 2 ** (step / 2) for step in range(41))
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Endpoint with its IDs replaced by ``{id}``, e.g. ``contacts/{id}`` for ``contacts/6f1c...``,
+    so metrics are grouped per route rather than per resource.
+
+    Paths alternate between collections and IDs (``collection/{id}/collection/{id}``), so
+    every second segment is an ID.
+    """
+    parts = endpoint.split("?", 1)[0].strip("/").split("/")
+    return "/".join("{id}" if index % 2 else part for index, part in enumerate(parts))
+
+
+class RequestEvent:
+    """
+    One attempt of an API request, passed to the :class:`RequestObserver` hooks.
+
+    ``status``, ``bytes_received`` and ``duration`` are set once a response arrives, ``error``
+    when the attempt fails without one. Retries are separate events with a higher ``attempt``.
+    ``bytes_sent`` is None when the client does not know the encoded body size.
+    """
+    __slots__ = ("method", "endpoint", "attempt", "status", "bytes_sent", "bytes_received", "duration", "error",
+                 "started")
+
+    def __init__(self, method: str, endpoint: str, attempt: int = 1) -> None:
+        self.method = method
+        self.endpoint = endpoint_template(endpoint)
+        self.attempt = attempt
+        self.status: Optional[int] = None
+        self.bytes_sent: Optional[int] = None
+        self.bytes_received: Optional[int] = None
+        self.duration: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self.started = time.perf_counter()
+
+    def finish(
+            self,
+            status: Optional[int] = None,
+            bytes_sent: Optional[int] = None,
+            bytes_received: Optional[int] = None,
+            error: Optional[BaseException] = None
+    ) -> "RequestEvent":
+        self.duration = time.perf_counter() - self.started
+        self.status = status
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.error = error
+        return self
+
+
+class RequestObserver:
+    """
+    Base class of request observers; override the hooks of interest.
+
+    Hooks run on the thread (or event loop) making the request, so keep them fast.
+    Exceptions they raise are logged and do not affect the request.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        pass
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        """
+        Called when a response arrives, whatever its status.
+        """
+
+    def on_request_error(self, event: RequestEvent) -> None:
+        """
+        Called when an attempt fails without a response (connection error, timeout).
+        """
+
+
+def body_size(body: Any) -> Optional[int]:
+    """
+    Size in bytes of a request or response body, or None if unknown (e.g. a stream).
+    """
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return len(body)
+    return 0 if body is None else None
+
+
+def notify(observers: Iterable[RequestObserver], hook: str, event: RequestEvent) -> None:
+    """
+    Call ``hook`` on every observer, logging their exceptions.
+    """
+    for observer in observers:
+        try:
+            getattr(observer, hook)(event)
+        except Exception:
+            logger.exception("Request observer %r failed in %s", observer, hook)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)  # The last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: "_Histogram") -> None:
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.sum += other.sum
+        self.count += other.count
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """
+        Estimate a quantile by interpolating linearly inside its bucket.
+        """
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+                upper = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else LATENCY_BUCKETS[-1]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return LATENCY_BUCKETS[-1]
+
+
+class _Shard:
+    """
+    Metrics recorded by one thread; only that thread writes to it.
+    """
+    __slots__ = ("requests", "errors", "bytes_sent", "bytes_received", "latency")
+
+    def __init__(self) -> None:
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.errors: Dict[Tuple[str, str, str], int] = {}
+        self.bytes_sent: Dict[Tuple[str, str], int] = {}
+        self.bytes_received: Dict[Tuple[str, str], int] = {}
+        self.latency: Dict[Tuple[str, str], _Histogram] = {}
+
+
+def _add(counters: Dict[Any, int], key: Any, value: int = 1) -> None:
+    counters[key] = counters.get(key, 0) + value
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsObserver(RequestObserver):
+    """
+    Counts requests per method, templated endpoint and status, errors per exception type and
+    bytes, and keeps a latency histogram per method and endpoint.
+
+    Each thread records into its own shard, so recording takes no lock; :meth:`snapshot` and
+    :meth:`prometheus` merge the shards. Percentiles are estimated from histogram buckets
+    spaced a factor of sqrt(2) apart, so they are within about 20% of the exact value.
+    """
+
+    def __init__(self, namespace: str = "devexp_sdk") -> None:
+        """
+        :param namespace: Prefix of the Prometheus metric names.
+        """
+        self.namespace = namespace
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._lock = threading.Lock()  # Only taken when a thread records its first request
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        shard = self._shard()
+        route = (event.method, event.endpoint)
+        _add(shard.requests, route + (event.status,))
+        if event.bytes_sent:
+            _add(shard.bytes_sent, route, event.bytes_sent)
+        if event.bytes_received:
+            _add(shard.bytes_received, route, event.bytes_received)
+        histogram = shard.latency.get(route)
+        if histogram is None:
+            histogram = shard.latency[route] = _Histogram()
+        histogram.observe(event.duration)
+
+    def on_request_error(self, event: RequestEvent) -> None:
+        shard = self._shard()
+        _add(shard.errors, (event.method, event.endpoint, type(event.error).__name__))
+        histogram = shard.latency.get((event.method, event.endpoint))
+        if histogram is None:
+            histogram = shard.latency[(event.method, event.endpoint)] = _Histogram()
+        histogram.observe(event.duration)
+
+    def _merged(self) -> _Shard:
+        merged = _Shard()
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for name in ("requests", "errors", "bytes_sent", "bytes_received"):
+                for key, value in list(getattr(shard, name).items()):
+                    _add(getattr(merged, name), key, value)
+            for route, histogram in list(shard.latency.items()):
+                merged.latency.setdefault(route, _Histogram()).merge(histogram)
+        return merged
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        :return: A dictionary of ``requests``, ``errors`` and ``latency`` (count, mean, p50, p95
+                 and p99 in seconds) per method and templated endpoint.
+        """
+        merged = self._merged()
+        return {
+            "requests": [
+                {"method": method, "endpoint": endpoint, "status": status, "count": count}
+                for (method, endpoint, status), count in sorted(merged.requests.items())
+            ],
+            "errors": [
+                {"method": method, "endpoint": endpoint, "error": error, "count": count}
+                for (method, endpoint, error), count in sorted(merged.errors.items())
+            ],
+            "latency": [
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": histogram.count,
+                    "bytes_sent": merged.bytes_sent.get((method, endpoint), 0),
+                    "bytes_received": merged.bytes_received.get((method, endpoint), 0),
+                    "mean": histogram.sum / histogram.count if histogram.count else None,
+                    "p50": histogram.quantile(0.50),
+                    "p95": histogram.quantile(0.95),
+                    "p99": histogram.quantile(0.99),
+                }
+                for (method, endpoint), histogram in sorted(merged.latency.items())
+            ],
+        }
+
+    def prometheus(self) -> str:
+        """
+        :return: The metrics in the Prometheus text exposition format.
+        """
+        merged = self._merged()
+        prefix = self.namespace
+        lines = [
+            f"# HELP {prefix}_requests_total API responses received.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        for (method, endpoint, status), count in sorted(merged.requests.items()):
+            lines.append(f'{prefix}_requests_total{{method="{_escape(method)}",endpoint="{_escape(endpoint)}",'
+                         f'status="{status}"}} {count}')
+        lines += [
+            f"# HELP {prefix}_request_errors_total API requests that failed without a response.",
+            f"# TYPE {prefix}_request_errors_total counter",
+        ]
+        for (method, endpoint, error), count in sorted(merged.errors.items()):
+            lines.append(f'{prefix}_request_errors_total{{method="{_escape(method)}",endpoint="{_escape(endpoint)}",'
+                         f'error="{_escape(error)}"}} {count}')
+        for name, counters, help_text in (
+                ("request_bytes_total", merged.bytes_sent, "Request body bytes sent."),
+                ("response_bytes_total", merged.bytes_received, "Response body bytes received.")
+        ):
+            lines += [f"# HELP {prefix}_{name} {help_text}", f"# TYPE {prefix}_{name} counter"]
+            for (method, endpoint), count in sorted(counters.items()):
+                lines.append(f'{prefix}_{name}{{method="{_escape(method)}",endpoint="{_escape(endpoint)}"}} {count}')
+
+        name = f"{prefix}_request_duration_seconds"
+        lines += [f"# HELP {name} Duration of API request attempts.", f"# TYPE {name} histogram"]
+        for (method, endpoint), histogram in sorted(merged.latency.items()):
+            labels = f'method="{_escape(method)}",endpoint="{_escape(endpoint)}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:.6g}"
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,326 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+def endpoint_key(endpoint: str) -> str:
+    """
+    Rate-limiting group of an endpoint: its first path segment, e.g. ``messages`` for ``messages/123``.
+    """
+    return endpoint.strip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+class TokenBucket:
+    """
+    Allows ``rate`` requests per second on average, with bursts of up to ``burst`` requests.
+
+    Callers reserve a token and are told how long to wait for it, so the same bucket paces
+    threads (``time.sleep``) and asyncio tasks (``asyncio.sleep``) alike. Reservations may
+    drive the balance negative, which queues callers in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param rate: Tokens added per second.
+        :param burst: Maximum number of tokens stored; defaults to ``rate`` (at least 1).
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+        if burst is None:
+            burst = max(1.0, rate)
+        if rate <= 0 or burst < 1:
+            raise ValueError("Parameter 'rate' must be positive and 'burst' at least 1.")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token.
+
+        :return: Seconds to wait before using it (0 if one was available).
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit adjusted with AIMD (additive increase, multiplicative decrease).
+
+    Every successful request under the latency target adds ``1 / limit`` to the limit, i.e.
+    about one slot per round of requests. An error (429, 5xx, network failure) or a request
+    slower than the target multiplies it by ``backoff``, at most once per target interval so
+    one burst of failures counts once. The target is ``latency_target`` seconds, or
+    ``latency_tolerance`` times the fastest latency seen when it is not set.
+
+    Slots are shared by threads (:meth:`acquire`) and asyncio tasks, in any event loop
+    (:meth:`acquire_async`). Waiters are served in arrival order.
+    """
+
+    def __init__(
+            self,
+            initial: int = 10,
+            min_limit: int = 1,
+            max_limit: int = 100,
+            latency_target: Optional[float] = None,
+            latency_tolerance: float = 2.0,
+            backoff: float = 0.5,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        :param initial: Starting concurrency limit.
+        :param min_limit: The limit never goes below this.
+        :param max_limit: The limit never goes above this.
+        :param latency_target: Latency in seconds above which a request counts as congestion.
+        :param latency_tolerance: Multiple of the fastest latency used when ``latency_target`` is None.
+        :param backoff: Factor applied to the limit on congestion, between 0 and 1.
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Parameters must satisfy 1 <= 'min_limit' <= 'initial' <= 'max_limit'.")
+        if not 0 < backoff < 1:
+            raise ValueError("Parameter 'backoff' must be between 0 and 1.")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self._clock = clock
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._min_latency: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._waiters: deque = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _try_take(self) -> bool:
+        """
+        Take a slot if one is free and nobody is queued before us; called with the lock held.
+        """
+        if not self._waiters and self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a slot is free.
+
+        :return: False if ``timeout`` elapsed first.
+        """
+        with self._lock:
+            if self._try_take():
+                return True
+            event = threading.Event()
+            self._waiters.append(event)
+        if event.wait(timeout):
+            return True
+        with self._lock:
+            try:
+                self._waiters.remove(event)
+                return False
+            except ValueError:
+                return True  # Handed a slot just as the wait timed out
+
+    async def acquire_async(self) -> None:
+        """
+        Wait in the running event loop until a slot is free.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_take():
+                return
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, future))
+                    queued = True
+                except ValueError:
+                    queued = False
+            # Dequeued by release(): if the slot was already handed over (the task was cancelled
+            # before resuming), give it back; otherwise _wake gives it back when it finds the
+            # future cancelled
+            if not queued and future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self, latency: Optional[float] = None, success: bool = True) -> None:
+        """
+        Free a slot and adjust the limit from the outcome of its request.
+
+        :param latency: Seconds the request took, or None if it is not to be counted.
+        :param success: False for errors that indicate an overloaded server.
+        """
+        with self._lock:
+            if latency is not None:
+                self._record(latency, success)
+            self._in_flight -= 1
+            handoffs = []
+            while self._waiters and self._in_flight < int(self._limit):
+                self._in_flight += 1
+                handoffs.append(self._waiters.popleft())
+        for waiter in handoffs:
+            self._wake(waiter)
+
+    def _wake(self, waiter: Any) -> None:
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+            return
+        loop, future = waiter
+
+        def hand_over():
+            if future.done():  # The waiting task was cancelled
+                self.release()
+            else:
+                future.set_result(None)
+
+        try:
+            loop.call_soon_threadsafe(hand_over)
+        except RuntimeError:  # The loop is closed
+            self.release()
+
+    def _record(self, latency: float, success: bool) -> None:
+        """
+        Apply AIMD to one completed request; called with the lock held.
+        """
+        if success:
+            self._min_latency = latency if self._min_latency is None else min(self._min_latency, latency)
+        target = self.latency_target
+        if target is None and self._min_latency is not None:
+            target = self._min_latency * self.latency_tolerance
+
+        congested = not success or (target is not None and latency > target)
+        if not congested:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            return
+        now = self._clock()
+        if now - self._last_decrease >= (target or latency):
+            self._limit = max(float(self.min_limit), self._limit * self.backoff)
+            self._last_decrease = now
+
+
+class Permit:
+    """
+    Right to send one request, returned by :meth:`RateLimiter.acquire`. Call :meth:`release`
+    once the request is done.
+    """
+    __slots__ = ("_concurrency", "_started")
+
+    def __init__(self, concurrency: Optional[AdaptiveLimiter]) -> None:
+        self._concurrency = concurrency
+        self._started = time.monotonic()
+
+    def release(self, success: bool = True) -> None:
+        """
+        :param success: False if the request failed with a 429, a 5xx or a network error.
+        """
+        if self._concurrency is not None:
+            self._concurrency.release(time.monotonic() - self._started, success)
+            self._concurrency = None
+
+    def discard(self) -> None:
+        """
+        Give the slot back without counting the request, e.g. when it was cancelled.
+        Does nothing if the permit was already released.
+        """
+        if self._concurrency is not None:
+            self._concurrency.release()
+            self._concurrency = None
+
+
+class RateLimiter:
+    """
+    Paces requests per endpoint with token buckets, and optionally caps the requests in
+    flight with an :class:`AdaptiveLimiter`. One instance can be shared by several
+    :class:`sdk.api_client.APIClient` and :class:`sdk.async_api_client.AsyncAPIClient`.
+    """
+
+    def __init__(
+            self,
+            buckets: Optional[Dict[str, TokenBucket]] = None,
+            default: Optional[TokenBucket] = None,
+            concurrency: Optional[AdaptiveLimiter] = None
+    ) -> None:
+        """
+        :param buckets: Bucket of each endpoint group (see :func:`endpoint_key`).
+        :param default: Bucket shared by the groups without their own; None leaves them unpaced.
+        :param concurrency: Limit on the requests in flight across all endpoints.
+        """
+        self.buckets = dict(buckets or {})
+        self.default = default
+        self.concurrency = concurrency
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> Optional["RateLimiter"]:
+        """
+        Build a limiter from the ``rate_limit`` section of the configuration file.
+
+        :return: None if the section is missing or empty.
+        :raises ValueError: If the section is invalid.
+        """
+        if not settings:
+            return None
+        settings = dict(settings)
+        try:
+            default = settings.pop("default", None)
+            buckets = {name: TokenBucket(**bucket) for name, bucket in (settings.pop("endpoints", None) or {}).items()}
+            concurrency = settings.pop("adaptive", None)
+            if settings:
+                raise ValueError(f"unknown keys {', '.join(sorted(settings))}")
+            return cls(
+                buckets,
+                TokenBucket(**default) if default else None,
+                AdaptiveLimiter(**concurrency) if concurrency else None
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid 'rate_limit' configuration: {e}")
+
+    def _bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        return self.buckets.get(endpoint_key(endpoint), self.default)
+
+    def acquire(self, endpoint: str) -> Permit:
+        """
+        Block until a request to ``endpoint`` may be sent.
+        """
+        bucket = self._bucket(endpoint)
+        if bucket is not None:
+            delay = bucket.reserve()
+            if delay:
+                time.sleep(delay)
+        if self.concurrency is not None:
+            self.concurrency.acquire()
+        return Permit(self.concurrency)
+
+    async def acquire_async(self, endpoint: str) -> Permit:
+        """
+        Asyncio counterpart of :meth:`acquire`.
+        """
+        bucket = self._bucket(endpoint)
+        if bucket is not None:
+            delay = bucket.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        if self.concurrency is not None:
+            await self.concurrency.acquire_async()
+        return Permit(self.concurrency)
@@ -1,3 +1,3 @@
-from .contacts import Contacts
-from .messages import Messages
-__all__ = ['Contacts', 'Messages']
\ No newline at end of file
+from .contacts import Contacts, AsyncContacts
+from .messages import Messages, AsyncMessages
+__all__ = ['Contacts', 'Messages', 'AsyncContacts', 'AsyncMessages']
\ No newline at end of file
@@ -1,6 +1,11 @@
-import phonenumbers
+import asyncio
 import logging
-from typing import Optional, Dict, List, Union
+import queue
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Dict, List, Union
+from sdk.utils.pagination import async_export_pages, async_iterate_pages, export_pages, iterate_pages
+from sdk.utils.cache import TTLCache
+from sdk.utils.concurrency import BatchResult
+from sdk.utils.phone import PhoneNumberCache, default_phone_cache, normalize_phone_numbers
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -11,42 +16,85 @@ class Contacts:
     A class to manage operations related to contacts.
     """
 
-    def __init__(self, client, default_region: Optional[str] = None) -> None:
+    def __init__(
+            self,
+            client,
+            default_region: Optional[str] = None,
+            phone_cache: Optional[PhoneNumberCache] = None,
+            cache: Optional[TTLCache] = None
+    ) -> None:
         """
         Initialize the Contacts class with the provided API client.
 
         :param client: An instance of the API client.
         :param default_region: (Optional) The default region code (e.g., 'US').
+        :param phone_cache: (Optional) Cache for normalized phone numbers; a process-wide
+                            cache is shared by default.
+        :param cache: (Optional) Read-through cache for ``get_contact``, kept up to date by
+                      this instance's creates, lists, updates and deletes.
         """
         self.client = client
         self.default_region = default_region  # For phone number parsing
+        self.phone_cache = phone_cache if phone_cache is not None else default_phone_cache
+        self.cache = cache
+
+    def _remember_contact(self, contact: Optional[Dict[str, str]]) -> None:
+        """
+        Store a copy of a contact returned by the API in the cache, if there is one, so the
+        caller's changes to the returned dictionary do not reach the cache.
+        """
+        if self.cache is not None and contact and contact.get("id"):
+            self.cache.set(contact["id"], dict(contact))
+
+    def _remember_contacts(self, response: Optional[Dict]) -> None:
+        if self.cache is not None and response:
+            for contact in response.get("contacts") or []:
+                self._remember_contact(contact)
+
+    def _forget_contact(self, contact_id: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(contact_id)
 
     def validate_phone_number(self, phone: str) -> str:
         """
         Validate and format a phone number to E.164 format.
 
+        Results, including failures, are memoized in the contacts' phone number cache.
+
         :param phone: The phone number to validate.
         :return: The phone number formatted in E.164 format.
         :raises ValueError: If the phone number is invalid.
         """
-        try:
-            parsed_phone = phonenumbers.parse(phone, self.default_region)
-            if not phonenumbers.is_valid_number(parsed_phone):
-                raise ValueError("Invalid phone number.")
-            formatted_phone = phonenumbers.format_number(
-                parsed_phone, phonenumbers.PhoneNumberFormat.E164
-            )
-            return formatted_phone
-        except phonenumbers.NumberParseException as e:
-            raise ValueError(f"Invalid phone number: {e}")
+        return self.phone_cache.normalize(phone, self.default_region)
 
-    def create_contact(self, name: str, phone: str) -> Dict[str, str]:
+    def validate_phone_numbers(
+            self,
+            phones: Iterable[str],
+            workers: int = 1,
+            chunk_size: int = 1000
+    ) -> Iterator[BatchResult]:
         """
-        Create a new contact.
+        Validate and format many phone numbers to E.164 format, in input order.
+
+        The input is streamed in chunks across ``workers`` processes, which suits imports of
+        millions of numbers. The per-number cache is not used here: each worker parses its
+        chunk directly.
+
+        :param phones: Iterable of phone numbers to validate.
+        :param workers: Number of worker processes (default is 1, no subprocess).
+        :param chunk_size: Number of phone numbers sent to a worker at once (default is 1000).
+        :return: An iterator of :class:`BatchResult` with the E.164 number as ``result``, or
+                 the ``ValueError`` for that number as ``error``.
+        """
+        return normalize_phone_numbers(phones, self.default_region, workers, chunk_size)
+
+    def _prepare_create_contact(self, name: str, phone: str) -> Dict[str, str]:
+        """
+        Validate the parameters of a contact creation and build its payload.
 
         :param name: The name of the contact.
         :param phone: The phone number of the contact.
-        :return: The response from the API, typically the contact ID and details.
+        :return: The request payload, with the phone number in E.164 format.
         """
         if not all([name, phone]):
             raise ValueError("Parameters 'name' and 'phone' are required.")
@@ -62,15 +110,41 @@ class Contacts:
             "name": name,
             "phone": formatted_phone
         }
-        logging.debug("Payload for creating contact: %s", payload)
+        logger.debug("Payload for creating contact: %s", payload)
+        return payload
+
+    def create_contact(self, name: str, phone: str) -> Dict[str, str]:
+        """
+        Create a new contact.
+
+        :param name: The name of the contact.
+        :param phone: The phone number of the contact.
+        :return: The response from the API, typically the contact ID and details.
+        """
+        payload = self._prepare_create_contact(name, phone)
 
         try:
             response = self.client.request("POST", "contacts", json=payload)
         except Exception as e:
             raise RuntimeError(f"Failed to create contact: {e}")
 
+        self._remember_contact(response)
         return response
 
+    def _prepare_list_contacts(self, page: int, limit: int) -> Dict[str, int]:
+        """
+        Validate the pagination parameters and build the query parameters.
+
+        The API names them ``pageIndex`` and ``max`` (see ``docs/openapi.yaml``).
+        """
+        if page < 1 or limit < 1:
+            raise ValueError("Parameters 'page' and 'limit' must be positive integers.")
+
+        return {
+            "pageIndex": page,
+            "max": limit
+        }
+
     def list_contacts(self, page: int = 1, limit: int = 10) -> Dict[str, Union[List[Dict[str, str]], int]]:
         """
         Retrieve a paginated list of contacts.
@@ -79,16 +153,57 @@ class Contacts:
         :param limit: The maximum number of contacts per page (default is 10).
         :return: A dictionary containing the list of contacts and pagination details.
         """
-        if page < 1 or limit < 1:
-            raise ValueError("Parameters 'page' and 'limit' must be positive integers.")
-
-        params = {
-            "page": page,
-            "limit": limit
-        }
+        params = self._prepare_list_contacts(page, limit)
         response = self.client.request("GET", "contacts", params=params)
+        self._remember_contacts(response)
         return response
 
+    def iter_contacts(self, limit: int = 10, prefetch: bool = False, start_page: int = 1) -> Iterator[Dict[str, str]]:
+        """
+        Iterate over every contact, fetching pages lazily until a short or empty page.
+
+        :param limit: The number of contacts fetched per page (default is 10).
+        :param prefetch: Fetch the next page in the background while the current one is consumed.
+        :param start_page: The first page to fetch (default is 1).
+        :return: An iterator yielding one contact at a time.
+        """
+        for contacts in iterate_pages(self.list_contacts, "contacts", limit, start_page, prefetch):
+            yield from contacts
+
+    def warm_cache(self, limit: int = 100) -> int:
+        """
+        Load every contact into the cache by walking all pages of ``list_contacts``.
+
+        :param limit: The number of contacts fetched per page (default is 100).
+        :return: The number of contacts loaded.
+        :raises ValueError: If the instance has no cache.
+        """
+        if self.cache is None:
+            raise ValueError("No cache configured for these contacts.")
+        return sum(1 for _ in self.iter_contacts(limit=limit))
+
+    def export_contacts(
+            self,
+            callback: Optional[Callable[[int, List[Dict[str, str]]], None]] = None,
+            output: Optional[queue.Queue] = None,
+            concurrency: int = 4,
+            limit: int = 10
+    ) -> int:
+        """
+        Export every contact, fetching ``concurrency`` pages at a time.
+
+        Pages are delivered as they arrive, not in page order. Use a bounded ``output``
+        queue to throttle fetching to the speed of its consumer.
+
+        :param callback: Called with ``(page, contacts)`` for every non-empty page.
+        :param output: Queue receiving ``(page, contacts)`` tuples, then ``None`` at the end.
+        :param concurrency: Maximum number of page requests in flight (default is 4).
+        :param limit: The number of contacts fetched per page (default is 10).
+        :return: The total number of contacts exported.
+        """
+        self._prepare_list_contacts(1, limit)
+        return export_pages(self.list_contacts, "contacts", limit, concurrency, callback, output)
+
     def get_contact(self, contact_id: str) -> Dict[str, str]:
         """
         Retrieve details of a specific contact by its ID.
@@ -99,9 +214,29 @@ class Contacts:
         if not contact_id:
             raise ValueError("The 'contact_id' is required to fetch contact details.")
 
+        if self.cache is not None:
+            return dict(self.cache.get_or_load(
+                contact_id, lambda: self.client.request("GET", f"contacts/{contact_id}")
+            ))
+
         response = self.client.request("GET", f"contacts/{contact_id}")
         return response
 
+    def _prepare_update_contact(self, name: Optional[str], phone: Optional[str]) -> Dict[str, str]:
+        """
+        Validate the fields of a contact update and build its payload.
+        """
+        payload = {}
+        if name:
+            payload["name"] = name
+        if phone:
+            phone = self.validate_phone_number(phone)
+            payload["phone"] = phone
+
+        if not payload:
+            raise ValueError("No fields provided for update")
+        return payload
+
     def update_contact(
             self,
             contact_id: str,
@@ -117,17 +252,14 @@ class Contacts:
         :return: The updated contact details.
         """
         endpoint = f"contacts/{contact_id}"
-        payload = {}
-        if name:
-            payload["name"] = name
-        if phone:
-            phone = self.validate_phone_number(phone)
-            payload["phone"] = phone
-
-        if not payload:
-            raise ValueError("No fields provided for update")
+        payload = self._prepare_update_contact(name, phone)
+        try:
+            response = self.client.request("PATCH", endpoint, json=payload)
+        except Exception:
+            self._forget_contact(contact_id)
+            raise
 
-        response = self.client.request("PATCH", endpoint, json=payload)
+        self._remember_contact(response)
         return response
 
     def delete_contact(self, contact_id: str) -> Optional[Dict[str, Union[str, bool]]]:
@@ -140,5 +272,147 @@ class Contacts:
         if not contact_id:
             raise ValueError("The 'contact_id' is required to delete a contact.")
 
-        response = self.client.request("DELETE", f"contacts/{contact_id}")
+        try:
+            response = self.client.request("DELETE", f"contacts/{contact_id}")
+        finally:
+            self._forget_contact(contact_id)
         return response
+
+
+class AsyncContacts(Contacts):
+    """
+    Asyncio counterpart of :class:`Contacts`, to be used with an ``AsyncAPIClient``.
+
+    Validation is shared with :class:`Contacts`, so both classes reject the same input.
+    """
+
+    async def create_contact(self, name: str, phone: str) -> Dict[str, str]:
+        """
+        Create a new contact.
+
+        :param name: The name of the contact.
+        :param phone: The phone number of the contact.
+        :return: The response from the API, typically the contact ID and details.
+        """
+        payload = self._prepare_create_contact(name, phone)
+
+        try:
+            response = await self.client.request("POST", "contacts", json=payload)
+        except Exception as e:
+            raise RuntimeError(f"Failed to create contact: {e}")
+
+        self._remember_contact(response)
+        return response
+
+    async def list_contacts(self, page: int = 1, limit: int = 10) -> Dict[str, Union[List[Dict[str, str]], int]]:
+        """
+        Retrieve a paginated list of contacts.
+
+        :param page: The page number to fetch (default is 1).
+        :param limit: The maximum number of contacts per page (default is 10).
+        :return: A dictionary containing the list of contacts and pagination details.
+        """
+        params = self._prepare_list_contacts(page, limit)
+        response = await self.client.request("GET", "contacts", params=params)
+        self._remember_contacts(response)
+        return response
+
+    async def iter_contacts(
+            self,
+            limit: int = 10,
+            prefetch: bool = False,
+            start_page: int = 1
+    ) -> AsyncIterator[Dict[str, str]]:
+        """
+        Iterate over every contact, fetching pages lazily until a short or empty page.
+
+        See :meth:`Contacts.iter_contacts`; contacts are yielded from an async generator.
+        """
+        async for contacts in async_iterate_pages(self.list_contacts, "contacts", limit, start_page, prefetch):
+            for contact in contacts:
+                yield contact
+
+    async def warm_cache(self, limit: int = 100) -> int:
+        """
+        Load every contact into the cache by walking all pages of ``list_contacts``.
+
+        See :meth:`Contacts.warm_cache`.
+        """
+        if self.cache is None:
+            raise ValueError("No cache configured for these contacts.")
+        count = 0
+        async for _ in self.iter_contacts(limit=limit):
+            count += 1
+        return count
+
+    async def export_contacts(
+            self,
+            callback: Optional[Callable[[int, List[Dict[str, str]]], Any]] = None,
+            output: Optional[asyncio.Queue] = None,
+            concurrency: int = 4,
+            limit: int = 10
+    ) -> int:
+        """
+        Export every contact, fetching ``concurrency`` pages at a time.
+
+        See :meth:`Contacts.export_contacts`; ``callback`` may be a coroutine function and
+        ``output`` is an :class:`asyncio.Queue`.
+        """
+        self._prepare_list_contacts(1, limit)
+        return await async_export_pages(self.list_contacts, "contacts", limit, concurrency, callback, output)
+
+    async def get_contact(self, contact_id: str) -> Dict[str, str]:
+        """
+        Retrieve details of a specific contact by its ID.
+
+        :param contact_id: The ID of the contact to retrieve.
+        :return: A dictionary containing the contact details.
+        """
+        if not contact_id:
+            raise ValueError("The 'contact_id' is required to fetch contact details.")
+
+        if self.cache is not None:
+            return dict(await self.cache.async_get_or_load(
+                contact_id, lambda: self.client.request("GET", f"contacts/{contact_id}")
+            ))
+
+        return await self.client.request("GET", f"contacts/{contact_id}")
+
+    async def update_contact(
+            self,
+            contact_id: str,
+            name: Optional[str] = None,
+            phone: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Updates a contact's details.
+
+        :param contact_id: ID of the contact to update.
+        :param name: New name of the contact.
+        :param phone: New phone number of the contact.
+        :return: The updated contact details.
+        """
+        payload = self._prepare_update_contact(name, phone)
+        try:
+            response = await self.client.request("PATCH", f"contacts/{contact_id}", json=payload)
+        except Exception:
+            self._forget_contact(contact_id)
+            raise
+
+        self._remember_contact(response)
+        return response
+
+    async def delete_contact(self, contact_id: str) -> Optional[Dict[str, Union[str, bool]]]:
+        """
+        Delete a contact by its ID.
+
+        :param contact_id: The ID of the contact to delete.
+        :return: The response from the API indicating success or failure.
+        """
+        if not contact_id:
+            raise ValueError("The 'contact_id' is required to delete a contact.")
+
+        try:
+            return await self.client.request("DELETE", f"contacts/{contact_id}")
+        finally:
+            self._forget_contact(contact_id)
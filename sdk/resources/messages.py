@@ -1,6 +1,10 @@
-import hmac
-import hashlib
-from typing import Any, Dict, Optional
+import asyncio
+import queue
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Union
+from sdk.utils.concurrency import BatchResult, async_bounded_map, bounded_map
+from sdk.utils.pagination import async_export_pages, async_iterate_pages, export_pages, iterate_pages
+from sdk.utils.phone import PhoneNumberCache, default_phone_cache
+from sdk.utils.signature import get_verifier
 
 
 class Messages:
@@ -10,21 +14,32 @@ class Messages:
     This class also supports webhook signature verification to ensure the messages are authentic.
     """
 
-    def __init__(self, client: 'APIClient', webhook_secret: str = None) -> None:
+    def __init__(
+            self,
+            client: 'APIClient',
+            webhook_secret: str = None,
+            default_region: Optional[str] = None,
+            phone_cache: Optional[PhoneNumberCache] = None
+    ) -> None:
         """
         Initialize the Messages class with the provided API client.
 
         :param client: An instance of the API client.
         :param webhook_secret: The secret used to verify webhook signatures.
+        :param default_region: (Optional) The default region code used to parse recipient phones.
+        :param phone_cache: (Optional) Cache for normalized phone numbers; shared with
+                            :class:`Contacts` by default.
         """
         self.client = client
         self.webhook_secret = webhook_secret
+        self.default_region = default_region
+        self.phone_cache = phone_cache if phone_cache is not None else default_phone_cache
 
-    def generate_signature(self, content: str, secret: Optional[str] = None) -> str:
+    def generate_signature(self, content: Union[str, bytes, memoryview], secret: Optional[str] = None) -> str:
         """
         Generate HMAC signature for the message payload.
 
-        :param content: The raw payload as a string.
+        :param content: The raw payload, as bytes (hashed without copying) or a string.
         :param secret: (Optional) The secret key for HMAC signing. If not provided, the webhook secret will be used.
         :return: The HMAC SHA-256 signature as a hexadecimal string.
         :raises ValueError: If no valid secret key is available.
@@ -33,8 +48,7 @@ class Messages:
         if not secret:
             raise ValueError("A valid secret key must be provided for signature generation.")
 
-        hmac_obj = hmac.new(secret.encode('utf-8'), content.encode('utf-8'), hashlib.sha256)
-        return hmac_obj.hexdigest()
+        return get_verifier(secret).sign(content)
 
     def send_message(self, recipient_id: str, content: str, sender_phone: str) -> Dict[str, any]:
         """
@@ -51,23 +65,123 @@ class Messages:
                  - status (str): The current status of the message.
                  - createdAt (str): The timestamp when the message was created.
                  - deliveredAt (str): The timestamp when the message was delivered.
+        :raises ValueError: If any of the required parameters are missing.
+        """
+        payload = self._prepare_send_message(recipient_id, content, sender_phone)
+        response = self.client.request("POST", "messages", json=payload)
+        return self._check_send_response(response)
+
+    def send_message_to_number(
+            self,
+            recipient_name: str,
+            recipient_phone: str,
+            content: str,
+            sender_phone: str
+    ) -> Dict[str, any]:
+        """
+        Send a new message to a phone number, without creating a contact first.
+
+        The recipient is sent inline as contact details; its phone number is validated and
+        formatted to E.164 locally, like :meth:`Contacts.validate_phone_number` does.
+
+        :param recipient_name: The name of the recipient.
+        :param recipient_phone: The phone number of the recipient.
+        :param content: The text content of the message.
+        :param sender_phone: The sender's phone number.
+        :return: A dictionary representing the created message (see :meth:`send_message`).
+        :raises ValueError: If a parameter is missing or the phone number is invalid.
+        """
+        payload = self._prepare_send_message_to_number(recipient_name, recipient_phone, content, sender_phone)
+        response = self.client.request("POST", "messages", json=payload)
+        return self._check_send_response(response)
+
+    def _send_item(self, message: Dict[str, str]):
+        """
+        Send one entry of a batch, to a contact ID or to inline contact details.
+        """
+        if "recipient_id" in message:
+            return self.send_message(**message)
+        return self.send_message_to_number(**message)
+
+    def send_many(
+            self,
+            messages: Iterable[Dict[str, str]],
+            concurrency: int = 10,
+            ordered: bool = False
+    ) -> Iterator[BatchResult]:
+        """
+        Send many messages with at most ``concurrency`` requests in flight.
+
+        The input is consumed lazily, so a generator over millions of rows keeps memory flat.
+        A failing message (e.g. a 400 from the API) is reported in its result and does not
+        stop the batch. Requests share the client's connection pool, so keep ``concurrency``
+        at or below the pool ``maxsize``.
+
+        :param messages: Iterable of dictionaries with the keyword arguments of :meth:`send_message`
+                         (``recipient_id``, ``content``, ``sender_phone``) or of
+                         :meth:`send_message_to_number` (``recipient_name``, ``recipient_phone``, ...).
+        :param concurrency: Maximum number of requests in flight (default is 10).
+        :param ordered: Yield results in input order instead of completion order.
+        :return: An iterator of :class:`BatchResult`, whose ``result`` is the created message
+                 and ``error`` the exception raised for that message, if any.
+        """
+        return bounded_map(self._send_item, messages, concurrency, ordered)
+
+    def _prepare_send_message(self, recipient_id: str, content: str, sender_phone: str) -> Dict[str, Any]:
+        """
+        Validate the parameters of a message and build its payload.
+
         :raises ValueError: If any of the required parameters are missing.
         """
         if not recipient_id:
             raise ValueError("Parameter 'recipient_id' is required.")
+
+        return self._build_message_payload({"id": recipient_id}, content, sender_phone)
+
+    def _prepare_send_message_to_number(
+            self,
+            recipient_name: str,
+            recipient_phone: str,
+            content: str,
+            sender_phone: str
+    ) -> Dict[str, Any]:
+        """
+        Validate the parameters of a message to inline contact details and build its payload.
+
+        :raises ValueError: If any of the required parameters are missing or the phone is invalid.
+        """
+        if not isinstance(recipient_name, str) or not recipient_name.strip():
+            raise ValueError("Parameter 'recipient_name' must be a non-empty string.")
+        if not isinstance(recipient_phone, str) or not recipient_phone.strip():
+            raise ValueError("Parameter 'recipient_phone' must be a non-empty string.")
+
+        recipient = {
+            "name": recipient_name,
+            "phone": self.phone_cache.normalize(recipient_phone, self.default_region)
+        }
+        return self._build_message_payload(recipient, content, sender_phone)
+
+    def _build_message_payload(self, recipient: Dict[str, str], content: str, sender_phone: str) -> Dict[str, Any]:
+        """
+        Validate the common message fields and assemble the request body.
+        """
         if not content:
             raise ValueError("Parameter 'content' is required.")
         if not sender_phone:
             raise ValueError("Parameter 'sender' is required.")
 
-        payload = {
-            "to": {"id": recipient_id},
+        return {
+            "to": recipient,
             "from": sender_phone,
             "content": content
         }
 
-        response = self.client.request("POST", "messages", json=payload)
+    def _check_send_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Ensure the API answered a message creation with a complete message.
 
+        :raises RuntimeError: If the response is missing expected keys.
+        """
         expected_keys = ["to", "from", "content", "id", "status", "createdAt", "deliveredAt"]
         if not all(key in response for key in expected_keys):
             raise RuntimeError("The response from the API is missing expected keys.")
@@ -82,20 +196,64 @@ class Messages:
         :param limit: The maximum number of messages per page (default is 100).
         :return: A dictionary containing:
                  - 'messages' (list): A list of messages.
-                 - 'pagination' (dict): Pagination details including 'page', 'limit', and 'total'.
+                 - 'page' (int): The page number returned.
+                 - 'quantityPerPage' (int): The number of messages per page.
         :raises ValueError: If 'page' or 'limit' are not valid.
         """
+        params = self._prepare_list_messages(page, limit)
+        response = self.client.request("GET", "messages", params=params)
+        return response
+
+    def iter_messages(self, limit: int = 100, prefetch: bool = False, start_page: int = 1) -> Iterator[Dict]:
+        """
+        Iterate over every sent message, fetching pages lazily until a short or empty page.
+
+        Only one page (two with ``prefetch``) is held in memory, so the full message
+        history can be exported without loading it at once.
+
+        :param limit: The number of messages fetched per page (default is 100).
+        :param prefetch: Fetch the next page in the background while the current one is consumed.
+        :param start_page: The first page to fetch (default is 1).
+        :return: An iterator yielding one message at a time.
+        """
+        for messages in iterate_pages(self.list_messages, "messages", limit, start_page, prefetch):
+            yield from messages
+
+    def export_messages(
+            self,
+            callback: Optional[Callable[[int, List[Dict]], None]] = None,
+            output: Optional[queue.Queue] = None,
+            concurrency: int = 4,
+            limit: int = 100
+    ) -> int:
+        """
+        Export every sent message, fetching ``concurrency`` pages at a time.
+
+        Pages are delivered as they arrive, not in page order. Use a bounded ``output``
+        queue to throttle fetching to the speed of its consumer.
+
+        :param callback: Called with ``(page, messages)`` for every non-empty page.
+        :param output: Queue receiving ``(page, messages)`` tuples, then ``None`` at the end.
+        :param concurrency: Maximum number of page requests in flight (default is 4).
+        :param limit: The number of messages fetched per page (default is 100).
+        :return: The total number of messages exported.
+        """
+        self._prepare_list_messages(1, limit)
+        return export_pages(self.list_messages, "messages", limit, concurrency, callback, output)
+
+    def _prepare_list_messages(self, page: int, limit: int) -> Dict[str, int]:
+        """
+        Validate the pagination parameters and build the query parameters.
+        """
         if page < 1:
             raise ValueError("Parameter 'page' must be greater than or equal to 1.")
         if limit <= 0:
             raise ValueError("Parameter 'limit' must be greater than 0.")
 
-        params = {
+        return {
             "page": page,
             "limit": limit
         }
-        response = self.client.request("GET", "messages", params=params)
-        return response
 
     def get_message(self, message_id: str) -> Dict:
         """
@@ -103,10 +261,118 @@ class Messages:
 
         :param message_id: The ID of the message to retrieve.
         :return: A dictionary containing the message details.
+        :raises ValueError: If 'message_id' is not valid.
+        """
+        self._check_message_id(message_id)
+
+        response = self.client.request("GET", f"messages/{message_id}")
+        return response
+
+    def _check_message_id(self, message_id: str) -> None:
+        """
+        Ensure a message ID can be used in a request path.
+
         :raises ValueError: If 'message_id' is not valid.
         """
         if not isinstance(message_id, str):
             raise ValueError("The 'message_id' must be a non-empty string.")
 
-        response = self.client.request("GET", f"messages/{message_id}")
-        return response
\ No newline at end of file
+
+class AsyncMessages(Messages):
+    """
+    Asyncio counterpart of :class:`Messages`, to be used with an ``AsyncAPIClient``.
+
+    Validation and signature generation are shared with :class:`Messages`.
+    """
+
+    async def send_message(self, recipient_id: str, content: str, sender_phone: str) -> Dict[str, any]:
+        """
+        Send a new message to a contact.
+
+        :param recipient_id: The ID of the contact to send the message to.
+        :param content: The text content of the message.
+        :param sender_phone: The sender's phone number.
+        :return: A dictionary representing the created message (see :meth:`Messages.send_message`).
+        :raises ValueError: If any of the required parameters are missing.
+        """
+        payload = self._prepare_send_message(recipient_id, content, sender_phone)
+        response = await self.client.request("POST", "messages", json=payload)
+        return self._check_send_response(response)
+
+    async def send_message_to_number(
+            self,
+            recipient_name: str,
+            recipient_phone: str,
+            content: str,
+            sender_phone: str
+    ) -> Dict[str, any]:
+        """
+        Send a new message to a phone number, without creating a contact first.
+
+        See :meth:`Messages.send_message_to_number`.
+        """
+        payload = self._prepare_send_message_to_number(recipient_name, recipient_phone, content, sender_phone)
+        response = await self.client.request("POST", "messages", json=payload)
+        return self._check_send_response(response)
+
+    def send_many(
+            self,
+            messages: Iterable[Dict[str, str]],
+            concurrency: int = 100,
+            ordered: bool = False
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Send many messages with at most ``concurrency`` requests in flight.
+
+        See :meth:`Messages.send_many`; results come from an async iterator.
+        """
+        return async_bounded_map(self._send_item, messages, concurrency, ordered)
+
+    async def list_messages(self, page: int = 1, limit: int = 100) -> Dict:
+        """
+        Retrieve a paginated list of sent messages.
+
+        :param page: The page number to fetch (default is 1).
+        :param limit: The maximum number of messages per page (default is 100).
+        :return: A dictionary containing the list of messages and pagination details.
+        :raises ValueError: If 'page' or 'limit' are not valid.
+        """
+        params = self._prepare_list_messages(page, limit)
+        return await self.client.request("GET", "messages", params=params)
+
+    async def iter_messages(self, limit: int = 100, prefetch: bool = False, start_page: int = 1) -> AsyncIterator[Dict]:
+        """
+        Iterate over every sent message, fetching pages lazily until a short or empty page.
+
+        See :meth:`Messages.iter_messages`; messages are yielded from an async generator.
+        """
+        async for messages in async_iterate_pages(self.list_messages, "messages", limit, start_page, prefetch):
+            for message in messages:
+                yield message
+
+    async def export_messages(
+            self,
+            callback: Optional[Callable[[int, List[Dict]], Any]] = None,
+            output: Optional[asyncio.Queue] = None,
+            concurrency: int = 4,
+            limit: int = 100
+    ) -> int:
+        """
+        Export every message, fetching ``concurrency`` pages at a time.
+
+        See :meth:`Messages.export_messages`; ``callback`` may be a coroutine function and
+        ``output`` is an :class:`asyncio.Queue`.
+        """
+        self._prepare_list_messages(1, limit)
+        return await async_export_pages(self.list_messages, "messages", limit, concurrency, callback, output)
+
+    async def get_message(self, message_id: str) -> Dict:
+        """
+        Retrieve details of a specific message by its ID.
+
+        :param message_id: The ID of the message to retrieve.
+        :return: A dictionary containing the message details.
+        :raises ValueError: If 'message_id' is not valid.
+        """
+        self._check_message_id(message_id)
+        return await self.client.request("GET", f"messages/{message_id}")
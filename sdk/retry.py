@@ -0,0 +1,150 @@
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, FrozenSet, Optional
+
+# Methods safe to send twice (RFC 9110); POST and PATCH are not
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"])
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+# The server refused the request without processing it, so with ``resend_rejected`` any method may be resent
+REJECTED_STATUSES = frozenset([429])
+# Seconds an attempt needs at least; no retry is made with less than that left before the deadline
+MIN_ATTEMPT_TIMEOUT = 0.05
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header, given in seconds or as an HTTP date.
+
+    :return: The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before resending a failed request.
+
+    Delays use exponential backoff with full jitter: a random value between 0 and
+    ``min(backoff_cap, backoff_base * 2 ** (attempt - 1))``, replaced by the server's
+    ``Retry-After`` when it sends one. No retry is made unless it would start at least
+    ``MIN_ATTEMPT_TIMEOUT`` before ``deadline`` seconds from the first attempt.
+
+    Failures that may have reached the server (read timeouts, dropped connections, 429, 5xx)
+    are only retried for methods in ``methods``. Requests that never reached it
+    (connect-phase failures) are retried for any method, and so are those refused
+    unprocessed (429) when ``resend_rejected`` is set.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.1
+    backoff_cap: float = 5.0
+    statuses: FrozenSet[int] = RETRY_STATUSES
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    deadline: Optional[float] = 30.0
+    respect_retry_after: bool = True
+    resend_rejected: bool = False
+    rng: random.Random = field(default_factory=random.Random, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("Retry 'max_attempts' must be a positive integer.")
+        if self.backoff_base < 0 or self.backoff_cap < 0 or (self.deadline is not None and self.deadline <= 0):
+            raise ValueError("Retry 'backoff_base' and 'backoff_cap' must be non-negative and 'deadline' positive.")
+        self.statuses = frozenset(self.statuses)
+        self.methods = frozenset(method.upper() for method in self.methods)
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> "RetryPolicy":
+        """
+        Build a policy from the ``retry`` section of the configuration file.
+        """
+        settings = dict(settings or {})
+        if not settings.pop("enabled", True):
+            return cls(max_attempts=1)
+        for key in ("statuses", "methods"):
+            if key in settings:
+                settings[key] = frozenset(settings[key])
+        try:
+            return cls(**settings)
+        except TypeError as e:
+            raise ValueError(f"Invalid 'retry' configuration: {e}")
+
+    def start(self) -> Optional[float]:
+        """
+        :return: The monotonic time at which retrying stops, for a request starting now.
+        """
+        return time.monotonic() + self.deadline if self.deadline is not None else None
+
+    def remaining(self, deadline: Optional[float]) -> Optional[float]:
+        return max(0.0, deadline - time.monotonic()) if deadline is not None else None
+
+    def attempt_timeout(self, deadline: Optional[float], timeout: float) -> float:
+        """
+        :return: The timeout of the next attempt: ``timeout``, cut to what is left before
+                 ``deadline`` but never below ``MIN_ATTEMPT_TIMEOUT``, as urllib3 refuses 0
+                 and aiohttp takes it as no timeout at all.
+        """
+        remaining = self.remaining(deadline)
+        if remaining is None:
+            return timeout
+        return max(MIN_ATTEMPT_TIMEOUT, min(timeout, remaining))
+
+    def backoff(self, attempt: int) -> float:
+        """
+        :return: A full-jitter delay before the attempt following ``attempt`` (starting at 1).
+        """
+        return self.rng.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+
+    def retry_delay(
+            self,
+            attempt: int,
+            deadline: Optional[float],
+            method: str,
+            idempotent: Optional[bool] = None,
+            status: Optional[int] = None,
+            connect_error: bool = False,
+            retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        :param attempt: Number of the attempt that failed, starting at 1.
+        :param deadline: Value returned by :meth:`start` for this request.
+        :param method: HTTP method of the request.
+        :param idempotent: Caller's override of whether the request is safe to resend;
+                           None uses ``methods``.
+        :param status: HTTP status of the response, or None if no response was received.
+        :param connect_error: The failure happened before the request was sent.
+        :param retry_after: Value of the response's ``Retry-After`` header, if any.
+        :return: Seconds to wait before the next attempt, or None to give up.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if status is not None and status not in self.statuses:
+            return None
+
+        safe = idempotent if idempotent is not None else method.upper() in self.methods
+        if not (safe or connect_error or (self.resend_rejected and status in REJECTED_STATUSES)):
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after:
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                delay = server_delay
+
+        remaining = self.remaining(deadline)
+        if remaining is not None and delay + MIN_ATTEMPT_TIMEOUT > remaining:
+            return None
+        return delay
@@ -0,0 +1,216 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a :class:`TTLCache` since creation or the last ``clear()``.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Load:
+    """
+    A load in progress for one key, shared by every caller that missed on it.
+    """
+
+    def __init__(self, future: Optional["asyncio.Future"] = None) -> None:
+        self.done = threading.Event()
+        self.future = future  # set instead of 'done' for asyncio loads
+        self.value = None
+        self.error: Optional[BaseException] = None
+        self.stale = False  # set when the key is written or invalidated during the load
+
+
+class TTLCache:
+    """
+    Thread-safe read-through cache with a maximum size (LRU eviction) and a time to live.
+
+    Concurrent misses on the same key share a single load: the first caller runs the loader
+    and the others wait for its result (or its exception, which is not cached).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param maxsize: Maximum number of entries kept.
+        :param ttl: Seconds an entry stays valid after being stored.
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+        if maxsize < 1 or ttl <= 0:
+            raise ValueError("Parameters 'maxsize' and 'ttl' must be positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._loads: Dict[Hashable, _Load] = {}
+        self._async_loads: Dict[Hashable, _Load] = {}
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Return ``(found, value)`` and update the counters; the caller holds the lock.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True, value
+            del self._entries[key]
+            self._expirations += 1
+        self._misses += 1
+        return False, None
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value; the caller holds the lock.
+        """
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for ``key``, or ``default`` if missing or expired.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+        return value if found else default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store ``value`` for ``key``, replacing any entry and any load in progress.
+        """
+        with self._lock:
+            self._mark_stale(key)
+            self._store(key, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove ``key``; a load in progress for it will not be stored.
+        """
+        with self._lock:
+            self._mark_stale(key)
+            self._entries.pop(key, None)
+
+    def _mark_stale(self, key: Hashable) -> None:
+        for loads in (self._loads, self._async_loads):
+            load = loads.get(key)
+            if load is not None:
+                load.stale = True
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, calling ``loader()`` on a miss.
+
+        :raises Exception: Whatever the loader raised, for every caller waiting on that load.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            load = self._loads.get(key)
+            owner = load is None
+            if owner:
+                load = self._loads[key] = _Load()
+
+        if not owner:
+            load.done.wait()
+            if load.error is not None:
+                raise load.error
+            return load.value
+
+        try:
+            load.value = loader()
+        except BaseException as e:
+            load.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._loads[key]
+                if load.error is None and not load.stale:
+                    self._store(key, load.value)
+            load.done.set()
+        return load.value
+
+    async def async_get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Asyncio counterpart of :meth:`get_or_load`; concurrent tasks missing on the same key
+        share one awaited ``loader()``. Must be used from a single event loop.
+
+        If the task running the shared load is cancelled, the tasks waiting on it load again
+        instead of receiving its ``CancelledError``.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            load = self._async_loads.get(key)
+            owner = load is None
+            if owner:
+                load = self._async_loads[key] = _Load(asyncio.get_running_loop().create_future())
+
+        if not owner:
+            try:
+                return await asyncio.shield(load.future)
+            except asyncio.CancelledError:
+                if not load.future.cancelled():
+                    raise  # This task was cancelled, not the one loading
+            return await self.async_get_or_load(key, loader)
+
+        try:
+            load.value = await loader()
+        except BaseException as e:
+            load.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._async_loads[key]
+                if load.error is None and not load.stale:
+                    self._store(key, load.value)
+            if load.error is None:
+                load.future.set_result(load.value)
+            elif isinstance(load.error, asyncio.CancelledError):
+                load.future.cancel()
+            else:
+                load.future.set_exception(load.error)
+                load.future.exception()  # Mark as retrieved when no other task is waiting
+        return load.value
+
+    def stats(self) -> CacheStats:
+        """
+        Return the hit, miss, eviction and expiration counters.
+        """
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, self._expirations, len(self._entries), self.maxsize
+            )
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the counters.
+        """
+        with self._lock:
+            for key in list(self._loads) + list(self._async_loads):
+                self._mark_stale(key)
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
@@ -0,0 +1,127 @@
+import json
+import os
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Anything the codecs decode: raw bytes straight off the wire, or text
+Data = Union[bytes, bytearray, memoryview, str]
+
+
+class StdlibCodec:
+    """
+    JSON codec built on the standard library ``json`` module.
+
+    Output is compact UTF-8, like :class:`OrjsonCodec`'s. NaN and infinite floats raise
+    ``ValueError``, as with the ``json=`` argument of ``requests``, rather than producing the
+    non-standard ``NaN``/``Infinity`` tokens. Bytes are handed to ``json.loads`` as received; it
+    detects their UTF encoding itself.
+    """
+    name = "json"
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def loads(self, data: Data) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """
+    JSON codec built on ``orjson``, which encodes to and decodes from bytes natively.
+
+    Non-string dictionary keys are converted to strings, as the standard library does. NaN
+    and infinite floats are encoded as ``null``, never as invalid JSON.
+    """
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError("orjson is not installed; install it with 'pip install orjson'.")
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=self._options)
+        except orjson.JSONEncodeError as e:
+            raise TypeError(str(e)) from e  # Same exception as json.dumps for unserializable objects
+
+    def loads(self, data: Data) -> Any:
+        return orjson.loads(data)  # orjson.JSONDecodeError is a ValueError, like json's
+
+
+CODECS = {StdlibCodec.name: StdlibCodec, OrjsonCodec.name: OrjsonCodec}
+
+
+def create_codec(name: Optional[str] = None):
+    """
+    Create a JSON codec.
+
+    :param name: ``"orjson"`` or ``"json"``; by default the ``SDK_JSON_CODEC`` environment
+                 variable, or else the fastest installed one.
+    :raises ValueError: If the name is unknown.
+    :raises RuntimeError: If the codec's library is not installed.
+    """
+    name = name or os.getenv("SDK_JSON_CODEC")
+    if not name:
+        return OrjsonCodec() if orjson is not None else StdlibCodec()
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}'; expected one of {', '.join(sorted(CODECS))}.")
+    return CODECS[name]()
+
+
+_codec = create_codec()
+
+
+def get_codec():
+    """
+    :return: The codec used by :func:`dumps` and :func:`loads`.
+    """
+    return _codec
+
+
+def set_codec(codec) -> None:
+    """
+    Replace the codec used by the SDK clients and the servers of this process.
+
+    :param codec: A codec name (see :func:`create_codec`) or an object with ``dumps(obj) -> bytes``
+                  and ``loads(data) -> object`` methods.
+    """
+    global _codec
+    _codec = create_codec(codec) if isinstance(codec, str) else codec
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode ``obj`` as compact UTF-8 JSON.
+
+    :raises TypeError: If ``obj`` contains a value JSON cannot represent.
+    """
+    return _codec.dumps(obj)
+
+
+def loads(data: Data) -> Any:
+    """
+    Decode JSON from bytes as received (or text). With orjson, bytes are parsed directly,
+    without decoding them to ``str`` first.
+
+    :raises ValueError: If ``data`` is not valid JSON, or not valid UTF-8.
+    """
+    return _codec.loads(data)
+
+
+def headers_with_content_type(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """
+    ``headers`` with a JSON ``Content-Type`` added if it has none, for requests sending an encoded body.
+    """
+    if headers and any(name.lower() == "content-type" for name in headers):
+        return headers
+    return dict(headers or {}, **{"Content-Type": "application/json"})
@@ -0,0 +1,180 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of one item processed by :func:`bounded_map` or :func:`async_bounded_map`.
+
+    :param index: Position of the item in the input.
+    :param item: The input item itself.
+    :param result: The value returned for the item, if it succeeded.
+    :param error: The exception raised for the item, if it failed.
+    """
+    index: int
+    item: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _call(fn: Callable[[Any], Any], index: int, item: Any) -> BatchResult:
+    try:
+        return BatchResult(index, item, result=fn(item))
+    except Exception as e:
+        return BatchResult(index, item, error=e)
+
+
+def bounded_map(
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        concurrency: int,
+        ordered: bool = False
+) -> Iterator[BatchResult]:
+    """
+    Apply ``fn`` to every item on a thread pool, keeping at most ``concurrency`` calls in flight.
+
+    The input is consumed lazily, one item per finished call, so memory stays bounded by
+    ``concurrency`` whatever the size of ``items``. A failing item is reported in its
+    :class:`BatchResult` and does not stop the others.
+
+    :param fn: The function to apply to each item.
+    :param items: Any iterable, including generators.
+    :param concurrency: Maximum number of calls running at the same time.
+    :param ordered: Yield results in input order instead of completion order.
+    :return: An iterator of :class:`BatchResult`.
+    :raises ValueError: If 'concurrency' is not positive, on the call itself.
+    """
+    if concurrency < 1:
+        raise ValueError("Parameter 'concurrency' must be a positive integer.")
+    return _bounded_map(fn, items, concurrency, ordered)
+
+
+def _bounded_map(
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        concurrency: int,
+        ordered: bool
+) -> Iterator[BatchResult]:
+    """
+    Generator behind :func:`bounded_map`, which validates the arguments eagerly.
+    """
+    source = enumerate(items)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        def submit_next():
+            for index, item in source:
+                return executor.submit(_call, fn, index, item)
+            return None
+
+        if ordered:
+            window = deque()
+            for _ in range(concurrency):
+                future = submit_next()
+                if future is None:
+                    break
+                window.append(future)
+            while window:
+                result = window.popleft().result()
+                future = submit_next()
+                if future is not None:
+                    window.append(future)
+                yield result
+        else:
+            pending = set()
+            for _ in range(concurrency):
+                future = submit_next()
+                if future is None:
+                    break
+                pending.add(future)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for finished in done:
+                    future = submit_next()
+                    if future is not None:
+                        pending.add(future)
+                    yield finished.result()
+
+
+def async_bounded_map(
+        fn: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        concurrency: int,
+        ordered: bool = False
+) -> AsyncIterator[BatchResult]:
+    """
+    Asyncio counterpart of :func:`bounded_map`: await ``fn`` for every item with at most
+    ``concurrency`` coroutines in flight.
+
+    :param fn: The coroutine function to apply to each item.
+    :param items: Any iterable, including generators.
+    :param concurrency: Maximum number of coroutines running at the same time.
+    :param ordered: Yield results in input order instead of completion order.
+    :return: An async iterator of :class:`BatchResult`.
+    :raises ValueError: If 'concurrency' is not positive, on the call itself.
+    """
+    if concurrency < 1:
+        raise ValueError("Parameter 'concurrency' must be a positive integer.")
+    return _async_bounded_map(fn, items, concurrency, ordered)
+
+
+async def _async_bounded_map(
+        fn: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        concurrency: int,
+        ordered: bool
+) -> AsyncIterator[BatchResult]:
+    """
+    Async generator behind :func:`async_bounded_map`, which validates the arguments eagerly.
+    """
+    async def call(index, item):
+        try:
+            return BatchResult(index, item, result=await fn(item))
+        except Exception as e:
+            return BatchResult(index, item, error=e)
+
+    source = enumerate(items)
+
+    def submit_next():
+        for index, item in source:
+            return asyncio.ensure_future(call(index, item))
+        return None
+
+    in_flight = deque() if ordered else set()
+    try:
+        for _ in range(concurrency):
+            task = submit_next()
+            if task is None:
+                break
+            if ordered:
+                in_flight.append(task)
+            else:
+                in_flight.add(task)
+
+        if ordered:
+            while in_flight:
+                result = await in_flight[0]
+                in_flight.popleft()
+                task = submit_next()
+                if task is not None:
+                    in_flight.append(task)
+                yield result
+        else:
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                in_flight.difference_update(done)
+                for finished in done:
+                    task = submit_next()
+                    if task is not None:
+                        in_flight.add(task)
+                    yield finished.result()
+    finally:
+        # The consumer stopped early: do not leave orphan calls running
+        for task in in_flight:
+            task.cancel()
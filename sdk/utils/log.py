@@ -0,0 +1,156 @@
+import json
+import logging
+import queue
+import random
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Optional, TextIO, Union
+
+# Characters of a payload kept in log messages by default
+MAX_PAYLOAD_CHARS = 512
+
+# Attributes every LogRecord has; anything else was passed through ``extra=``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class Truncated:
+    """
+    Log argument formatted only if the record is emitted, and cut to ``limit`` characters.
+
+    ``value`` may be a callable, e.g. ``lambda: response.text``, so that even producing the
+    text is deferred: ``logger.debug("Response: %s", Truncated(lambda: response.text))``.
+    """
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Union[Any, Callable[[], Any]], limit: int = MAX_PAYLOAD_CHARS) -> None:
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        value = self.value() if callable(self.value) else self.value
+        text = value if isinstance(value, str) else str(value)
+        if len(text) <= self.limit:
+            return text
+        return f"{text[:self.limit]}... ({len(text) - self.limit} more characters)"
+
+    __repr__ = __str__
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a random fraction ``rate`` of the records at ``max_level`` or below; records above
+    it (warnings and errors by default) are always kept.
+    """
+
+    def __init__(self, rate: float, max_level: int = logging.INFO) -> None:
+        super().__init__()
+        if not 0 <= rate <= 1:
+            raise ValueError("Parameter 'rate' must be between 0 and 1.")
+        self.rate = rate
+        self.max_level = max_level
+        self._random = random.Random()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > self.max_level or self.rate >= 1 or self._random.random() < self.rate
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line, with the fields passed through ``extra=``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that drops records instead of waiting when the queue is full, so logging
+    never blocks the caller on a slow output. Dropped records are counted in ``dropped``.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.listener: Optional["LogListener"] = None
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogListener(QueueListener):
+    """
+    Listener writing the records queued by the root logger's :class:`NonBlockingQueueHandler`.
+    Stopping it writes the records still queued and detaches the handler from the root logger.
+    """
+
+    def __init__(self, queue_handler: NonBlockingQueueHandler, *handlers: logging.Handler) -> None:
+        super().__init__(queue_handler.queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+
+    def enqueue_sentinel(self) -> None:
+        # Blocking: the queue may be full at shutdown, and the listener thread is still draining it
+        self.queue.put(self._sentinel)
+
+    def stop(self) -> None:
+        logging.getLogger().removeHandler(self.queue_handler)
+        if self._thread is not None:
+            super().stop()
+
+
+def configure_logging(
+        level: Union[int, str] = logging.INFO,
+        structured: bool = False,
+        sample_rate: float = 1.0,
+        queue_size: int = 10000,
+        stream: Optional[TextIO] = None
+) -> LogListener:
+    """
+    Route the root logger through a bounded queue to a background thread writing to ``stream``.
+
+    The calling thread only checks the level, formats the message and enqueues the record;
+    writing happens on the listener's thread. Calling it again replaces the previous setup.
+
+    :param level: Minimum level of the root logger.
+    :param structured: Write JSON lines (see :class:`StructuredFormatter`) instead of text.
+    :param sample_rate: Fraction of INFO and DEBUG records kept (see :class:`SamplingFilter`).
+    :param queue_size: Records waiting to be written before new ones are dropped.
+    :param stream: Output stream; standard error by default.
+    :return: The started listener; call ``stop()`` on it at exit so queued records are written.
+    """
+    handler = logging.StreamHandler(stream or sys.stderr)
+    if structured:
+        handler.setFormatter(StructuredFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s"))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    if sample_rate < 1:
+        queue_handler.addFilter(SamplingFilter(sample_rate))
+
+    root = logging.getLogger()
+    for previous in [h for h in root.handlers if isinstance(h, NonBlockingQueueHandler)]:
+        root.removeHandler(previous)
+        if previous.listener is not None:
+            previous.listener.stop()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+    listener = queue_handler.listener = LogListener(queue_handler, handler)
+    listener.start()
+    return listener
@@ -0,0 +1,307 @@
+import asyncio
+import logging
+import queue
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Keys under which list responses report the page size the server applied, which is smaller
+# than the requested one when the server caps it (ListContactsResponse, GetMessagesResponse)
+PAGE_SIZE_KEYS = ("pageSize", "quantityPerPage")
+# Keys under which a list response may report the total number of records
+TOTAL_KEYS = ("total", "totalCount")
+
+
+def _page_items(response: Optional[Dict[str, Any]], items_key: str) -> List[Any]:
+    return (response or {}).get(items_key) or []
+
+
+def _reported_int(response: Optional[Dict[str, Any]], keys) -> Optional[int]:
+    for key in keys:
+        value = (response or {}).get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+            return int(value)
+    return None
+
+
+def _is_last_page(response: Optional[Dict[str, Any]], items: List[Any], limit: int) -> bool:
+    """
+    Tell whether a page is the last one: empty, or shorter than the page size the server
+    reports having applied (the requested ``limit`` when it reports none).
+    """
+    size = _reported_int(response, PAGE_SIZE_KEYS) or limit
+    return len(items) < size
+
+
+def _check_progress(items: List[Any], previous_first: Any, page: int) -> None:
+    """
+    Guard against a server that ignores the page parameter and keeps returning page 1.
+    """
+    if previous_first is not None and items and items[0] == previous_first:
+        raise RuntimeError(
+            f"Page {page} repeats the previous page; the server is ignoring the pagination parameters."
+        )
+
+
+def _check_neighbours(firsts: Dict[int, Any], page: int, items: List[Any]) -> None:
+    """
+    Counterpart of :func:`_check_progress` for pages arriving out of order: compare the
+    first record of ``page`` with those of the pages before and after it received so far.
+    """
+    for neighbour in (page - 1, page + 1):
+        if neighbour in firsts and firsts[neighbour] == items[0]:
+            raise RuntimeError(
+                f"Page {max(page, neighbour)} repeats page {min(page, neighbour)}; "
+                "the server is ignoring the pagination parameters."
+            )
+    firsts[page] = items[0]
+
+
+def _check_total(total: int, reported_total: Optional[int], start_page: int) -> None:
+    """
+    Warn when a whole export does not match the total the server reported: records created
+    or deleted while it ran are enough, and the pages are already delivered by then.
+    """
+    if reported_total is not None and start_page == 1 and total != reported_total:
+        logger.warning(
+            "Exported %d records but the server reported %d; records may have changed during the export.",
+            total, reported_total
+        )
+
+
+def iterate_pages(
+        fetch_page: Callable[[int, int], Dict[str, Any]],
+        items_key: str,
+        limit: int,
+        start_page: int = 1,
+        prefetch: bool = False
+) -> Iterator[List[Any]]:
+    """
+    Walk a paginated listing page by page until a short or empty page is returned.
+
+    A page is short when it holds fewer records than the page size the response reports
+    (``pageSize`` or ``quantityPerPage``), so a server capping the page size below ``limit``
+    is paged through entirely; without a reported size, ``limit`` is the reference.
+
+    At most two pages are held in memory: the one being consumed and, with ``prefetch``,
+    the next one, fetched on a background thread while the caller processes the current one.
+
+    :param fetch_page: Callable taking ``(page, limit)`` and returning the API response.
+    :param items_key: Key of the records list in the response (e.g. ``"contacts"``).
+    :param limit: Number of records requested per page.
+    :param start_page: The first page to fetch (default is 1).
+    :param prefetch: Fetch the next page in the background while the current one is consumed.
+    :return: An iterator over the records list of each page.
+    """
+    page = start_page
+    previous_first = None
+
+    if not prefetch:
+        while True:
+            response = fetch_page(page, limit)
+            items = _page_items(response, items_key)
+            _check_progress(items, previous_first, page)
+            if items:
+                yield items
+            if _is_last_page(response, items, limit):
+                return
+            previous_first = items[0]
+            page += 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fetch_page, page, limit)
+        try:
+            while True:
+                response = future.result()
+                items = _page_items(response, items_key)
+                _check_progress(items, previous_first, page)
+                future = None
+                if not _is_last_page(response, items, limit):
+                    future = executor.submit(fetch_page, page + 1, limit)
+                if items:
+                    yield items
+                if future is None:
+                    return
+                previous_first = items[0]
+                page += 1
+        finally:
+            if future is not None:
+                future.cancel()
+
+
+async def async_iterate_pages(
+        fetch_page: Callable[[int, int], Awaitable[Dict[str, Any]]],
+        items_key: str,
+        limit: int,
+        start_page: int = 1,
+        prefetch: bool = False
+) -> AsyncIterator[List[Any]]:
+    """
+    Asyncio counterpart of :func:`iterate_pages`; ``fetch_page`` is a coroutine function and
+    the prefetch runs as a task on the event loop.
+    """
+    page = start_page
+    previous_first = None
+    task = asyncio.ensure_future(fetch_page(page, limit))
+    try:
+        while True:
+            response = await task
+            items = _page_items(response, items_key)
+            _check_progress(items, previous_first, page)
+            task = None
+            last = _is_last_page(response, items, limit)
+            if not last and prefetch:
+                task = asyncio.ensure_future(fetch_page(page + 1, limit))
+            if items:
+                yield items
+            if last:
+                return
+            if task is None:
+                task = asyncio.ensure_future(fetch_page(page + 1, limit))
+            previous_first = items[0]
+            page += 1
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+def export_pages(
+        fetch_page: Callable[[int, int], Dict[str, Any]],
+        items_key: str,
+        limit: int,
+        concurrency: int = 4,
+        callback: Optional[Callable[[int, List[Any]], None]] = None,
+        output: Optional[queue.Queue] = None,
+        start_page: int = 1
+) -> int:
+    """
+    Fetch a whole paginated listing with ``concurrency`` page requests in flight.
+
+    Pages are requested ahead in order; once a short or empty page comes back (see
+    :func:`iterate_pages`) no further page is requested. When the responses report a total
+    (``total`` or ``totalCount``), an export from the first page delivering a different number
+    of records logs a warning. Each non-empty page is handed over as soon as it arrives (so not
+    necessarily in page order) either to ``callback(page, items)`` or, as a ``(page, items)``
+    tuple, to ``output``. A bounded ``output`` queue applies backpressure: fetching pauses
+    while it is full. ``None`` is put on ``output`` once the export ends, even on error.
+
+    :param fetch_page: Callable taking ``(page, limit)`` and returning the API response.
+    :param items_key: Key of the records list in the response (e.g. ``"messages"``).
+    :param limit: Number of records requested per page.
+    :param concurrency: Maximum number of page requests in flight (default is 4).
+    :param callback: Called with ``(page, items)`` for every non-empty page.
+    :param output: Queue receiving ``(page, items)`` tuples, then ``None``.
+    :param start_page: The first page to fetch (default is 1).
+    :return: The total number of records exported.
+    :raises ValueError: If not exactly one of 'callback' and 'output' is given.
+    :raises RuntimeError: If the server ignores the page parameter.
+    """
+    if (callback is None) == (output is None):
+        raise ValueError("Exactly one of 'callback' and 'output' must be provided.")
+    if concurrency < 1:
+        raise ValueError("Parameter 'concurrency' must be a positive integer.")
+
+    deliver = callback if callback is not None else lambda page, items: output.put((page, items))
+    next_page = start_page
+    last_page = None  # first short page seen; nothing after it is requested
+    firsts = {}  # First record of each page received, to detect repeated pages
+    total = 0
+    reported_total = None
+    pending = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                while True:
+                    while last_page is None and len(pending) < concurrency:
+                        pending[executor.submit(fetch_page, next_page, limit)] = next_page
+                        next_page += 1
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        page = pending.pop(future)
+                        response = future.result()
+                        items = _page_items(response, items_key)
+                        if reported_total is None:
+                            reported_total = _reported_int(response, TOTAL_KEYS)
+                        if _is_last_page(response, items, limit):
+                            last_page = page if last_page is None else min(last_page, page)
+                        if not items or (last_page is not None and page > last_page):
+                            continue
+                        _check_neighbours(firsts, page, items)
+                        deliver(page, items)
+                        total += len(items)
+            finally:
+                for future in pending:
+                    future.cancel()
+    finally:
+        if output is not None:
+            output.put(None)
+
+    _check_total(total, reported_total, start_page)
+    return total
+
+
+async def async_export_pages(
+        fetch_page: Callable[[int, int], Awaitable[Dict[str, Any]]],
+        items_key: str,
+        limit: int,
+        concurrency: int = 4,
+        callback: Optional[Callable[[int, List[Any]], Any]] = None,
+        output: Optional[asyncio.Queue] = None,
+        start_page: int = 1
+) -> int:
+    """
+    Asyncio counterpart of :func:`export_pages`. ``callback`` may be a plain function or a
+    coroutine function, and ``output`` is an :class:`asyncio.Queue`.
+    """
+    if (callback is None) == (output is None):
+        raise ValueError("Exactly one of 'callback' and 'output' must be provided.")
+    if concurrency < 1:
+        raise ValueError("Parameter 'concurrency' must be a positive integer.")
+
+    next_page = start_page
+    last_page = None
+    firsts = {}  # First record of each page received, to detect repeated pages
+    total = 0
+    reported_total = None
+    pending = {}
+
+    try:
+        while True:
+            while last_page is None and len(pending) < concurrency:
+                pending[asyncio.ensure_future(fetch_page(next_page, limit))] = next_page
+                next_page += 1
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                page = pending.pop(task)
+                response = task.result()
+                items = _page_items(response, items_key)
+                if reported_total is None:
+                    reported_total = _reported_int(response, TOTAL_KEYS)
+                if _is_last_page(response, items, limit):
+                    last_page = page if last_page is None else min(last_page, page)
+                if not items or (last_page is not None and page > last_page):
+                    continue
+                _check_neighbours(firsts, page, items)
+                if output is not None:
+                    await output.put((page, items))
+                else:
+                    result = callback(page, items)
+                    if asyncio.iscoroutine(result):
+                        await result
+                total += len(items)
+    finally:
+        for task in pending:
+            task.cancel()
+        if output is not None:
+            await output.put(None)
+
+    _check_total(total, reported_total, start_page)
+    return total
@@ -0,0 +1,186 @@
+import threading
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import phonenumbers
+
+from sdk.utils.concurrency import BatchResult
+
+PhoneCacheInfo = namedtuple("PhoneCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def normalize_phone_number(phone: str, default_region: Optional[str] = None) -> str:
+    """
+    Validate and format a phone number to E.164 format.
+
+    :param phone: The phone number to validate.
+    :param default_region: (Optional) Region code used for numbers without a country prefix.
+    :return: The phone number formatted in E.164 format.
+    :raises ValueError: If the phone number is invalid.
+    """
+    try:
+        parsed_phone = phonenumbers.parse(phone, default_region)
+        if not phonenumbers.is_valid_number(parsed_phone):
+            raise ValueError("Invalid phone number.")
+        return phonenumbers.format_number(parsed_phone, phonenumbers.PhoneNumberFormat.E164)
+    except phonenumbers.NumberParseException as e:
+        raise ValueError(f"Invalid phone number: {e}")
+
+
+class PhoneNumberCache:
+    """
+    Thread-safe, bounded LRU cache in front of :func:`normalize_phone_number`.
+
+    Entries are keyed on ``(phone, default_region)``. Invalid numbers are cached too, so a
+    number rejected once is rejected again without being parsed.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        """
+        :param maxsize: Maximum number of entries kept; the least recently used is evicted first.
+        """
+        if maxsize < 1:
+            raise ValueError("Parameter 'maxsize' must be a positive integer.")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Tuple[bool, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def normalize(self, phone: str, default_region: Optional[str] = None) -> str:
+        """
+        Return the E.164 form of ``phone``, computing it only on a cache miss.
+
+        :raises ValueError: If the phone number is invalid (cached or not).
+        """
+        key = (phone, default_region)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if entry is None:
+            # Parse outside the lock; two threads racing on the same number both compute it
+            try:
+                entry = (True, normalize_phone_number(phone, default_region))
+            except ValueError as e:
+                entry = (False, str(e))
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        valid, value = entry
+        if not valid:
+            raise ValueError(value)
+        return value
+
+    def cache_info(self) -> PhoneCacheInfo:
+        """
+        Return hit/miss statistics, in the same shape as ``functools.lru_cache``.
+        """
+        with self._lock:
+            return PhoneCacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# Shared by every Contacts instance that is not given its own cache
+default_phone_cache = PhoneNumberCache()
+
+
+def _normalize_chunk(phones: List[str], default_region: Optional[str]) -> List[Tuple[Optional[str], Optional[Exception]]]:
+    """
+    Normalize a chunk of numbers; runs inside worker processes, so it must stay module-level.
+    """
+    results = []
+    for phone in phones:
+        try:
+            results.append((normalize_phone_number(phone, default_region), None))
+        except (ValueError, TypeError) as e:
+            results.append((None, ValueError(str(e))))
+    return results
+
+
+def normalize_phone_numbers(
+        phones: Iterable[str],
+        default_region: Optional[str] = None,
+        workers: int = 1,
+        chunk_size: int = 1000
+) -> Iterator[BatchResult]:
+    """
+    Normalize many phone numbers to E.164, spreading chunks of them over a process pool.
+
+    The input is consumed lazily, ``chunk_size`` numbers at a time, and at most two chunks
+    per worker are in flight, so memory stays bounded for inputs of millions of rows.
+    Results come back in input order.
+
+    :param phones: Iterable of raw phone numbers, including generators.
+    :param default_region: (Optional) Region code used for numbers without a country prefix.
+    :param workers: Number of worker processes; 1 validates in the calling process.
+    :param chunk_size: Number of phone numbers sent to a worker at once.
+    :return: An iterator of :class:`BatchResult` whose ``result`` is the E.164 number, or whose
+             ``error`` is the ``ValueError`` raised for that row.
+    :raises ValueError: If 'workers' or 'chunk_size' is not positive, on the call itself.
+    """
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("Parameters 'workers' and 'chunk_size' must be positive integers.")
+    return _normalize_phone_numbers(phones, default_region, workers, chunk_size)
+
+
+def _normalize_phone_numbers(
+        phones: Iterable[str],
+        default_region: Optional[str],
+        workers: int,
+        chunk_size: int
+) -> Iterator[BatchResult]:
+    """
+    Generator behind :func:`normalize_phone_numbers`, which validates the arguments eagerly.
+    """
+    source = iter(phones)
+    index = 0
+
+    def next_chunk():
+        return list(islice(source, chunk_size))
+
+    if workers == 1:
+        while True:
+            chunk = next_chunk()
+            if not chunk:
+                return
+            for phone, (e164, error) in zip(chunk, _normalize_chunk(chunk, default_region)):
+                yield BatchResult(index, phone, result=e164, error=error)
+                index += 1
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        window = deque()
+        try:
+            while True:
+                while len(window) < 2 * workers:
+                    chunk = next_chunk()
+                    if not chunk:
+                        break
+                    window.append((chunk, executor.submit(_normalize_chunk, chunk, default_region)))
+                if not window:
+                    return
+
+                chunk, future = window.popleft()
+                for phone, (e164, error) in zip(chunk, future.result()):
+                    yield BatchResult(index, phone, result=e164, error=error)
+                    index += 1
+        finally:
+            for _, future in window:
+                future.cancel()
@@ -1,16 +1,162 @@
 import hmac
 import hashlib
-def verify_signature(message: str, provided_signature: str, secret: str) -> bool:
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# Anything hmac can consume without a copy, plus str for backward compatibility
+Buffer = Union[bytes, bytearray, memoryview, str]
+
+
+def _to_bytes(value: Buffer, name: str):
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return value
+    raise ValueError(f"Parameter '{name}' must be a string or a bytes-like object.")
+
+
+class SignatureVerifier:
+    """
+    HMAC SHA256 signer and verifier bound to one secret.
+
+    The keyed HMAC state is computed once and copied for each message, so the secret is
+    neither re-encoded nor re-hashed per call. Messages are hashed straight from the given
+    buffer (``bytes``, ``bytearray`` or ``memoryview``); ``str`` is accepted and encoded as UTF-8.
+    """
+
+    def __init__(self, secret: Union[str, bytes]) -> None:
+        """
+        :param secret: The shared secret used to sign the webhook messages.
+        """
+        if not secret:
+            raise ValueError("A valid secret key must be provided.")
+        self._state = hmac.new(_to_bytes(secret, "secret"), digestmod=hashlib.sha256)
+
+    def sign(self, message: Buffer) -> str:
+        """
+        :return: The HMAC SHA-256 signature of ``message`` as a hexadecimal string.
+        """
+        mac = self._state.copy()
+        mac.update(_to_bytes(message, "message"))
+        return mac.hexdigest()
+
+    def verify(self, message: Buffer, provided_signature: Union[str, bytes]) -> bool:
+        """
+        Check ``provided_signature`` against the signature of ``message`` in constant time.
+
+        :return: True if the signature is valid, False otherwise (including signatures that
+                 are not even ASCII).
+        """
+        if isinstance(provided_signature, str):
+            try:
+                provided_signature = provided_signature.encode("ascii")
+            except UnicodeEncodeError:
+                return False
+        elif not isinstance(provided_signature, (bytes, bytearray)):
+            raise ValueError("Parameter 'signature' must be a string or bytes.")
+        return hmac.compare_digest(self.sign(message).encode("ascii"), provided_signature)
+
+
+@lru_cache(maxsize=32)
+def get_verifier(secret: Union[str, bytes]) -> SignatureVerifier:
+    """
+    Return the shared :class:`SignatureVerifier` for ``secret``.
+    """
+    return SignatureVerifier(secret)
+
+
+def verify_signature(message: Buffer, provided_signature: str, secret: str) -> bool:
     """
     Verifies the HMAC SHA256 signature of a webhook message.
 
-    :param message: The raw request body (exactly as received from the webhook).
+    :param message: The raw request body (exactly as received from the webhook), preferably
+                    as bytes so it is not copied.
     :param provided_signature: The signature provided in the `Authorization` header.
     :param secret: The shared secret used to sign the webhook messages.
     :return: True if the signature is valid, False otherwise.
     """
-    if not isinstance(message, str) or not isinstance(provided_signature, str) or not isinstance(secret, str):
-        raise ValueError("Parameters 'message', 'signature', and 'secret' must all be strings.")
+    if not isinstance(secret, (str, bytes)) or not secret:
+        raise ValueError("Parameter 'secret' must be a non-empty string.")
+    return get_verifier(secret).verify(message, provided_signature)
+
+
+def key_fingerprint(secret: Union[str, bytes], salt: bytes) -> str:
+    """
+    Short identifier of a secret: its HMAC keyed with ``salt``, truncated.
+
+    An unsalted hash would let anyone seeing it check guessed secrets offline; with a random
+    salt that is never exposed (see :class:`KeyRing`), it cannot be linked back to a secret.
+    """
+    if not salt:
+        raise ValueError("Parameter 'salt' must be a non-empty bytes value.")
+    return hmac.new(salt, _to_bytes(secret, "secret"), hashlib.sha256).hexdigest()[:8]
+
+
+class KeyRing:
+    """
+    Verifies signatures against several active secrets, e.g. the current one and the one
+    being rotated out, and counts how many messages each key accepted.
+
+    Keys are tried in order with their precomputed HMAC states, so when the first (current)
+    key matches, verification costs a single HMAC. The key set can be replaced at runtime;
+    counters of keys kept across a replacement are preserved.
+
+    Keys are identified by :func:`key_fingerprint` with a salt drawn at random for each key
+    ring, so fingerprints are only comparable within one process.
+    """
+
+    def __init__(self, secrets: Sequence[Union[str, bytes]]) -> None:
+        """
+        :param secrets: Active secrets, the current one first.
+        """
+        self._lock = threading.Lock()
+        self._salt = os.urandom(16)
+        self._counts: Dict[str, int] = {}
+        self._keys: Tuple[Tuple[str, SignatureVerifier], ...] = ()
+        self.replace(secrets)
+
+    def replace(self, secrets: Sequence[Union[str, bytes]]) -> None:
+        """
+        Atomically switch to a new set of active secrets, the current one first.
+
+        :raises ValueError: If no secret is given.
+        """
+        if not secrets:
+            raise ValueError("At least one secret must be provided.")
+        keys = tuple((self.fingerprint(secret), SignatureVerifier(secret)) for secret in secrets)
+        with self._lock:
+            self._counts = {fingerprint: self._counts.get(fingerprint, 0) for fingerprint, _ in keys}
+            self._keys = keys
+
+    def fingerprint(self, secret: Union[str, bytes]) -> str:
+        """
+        :return: The identifier of ``secret`` in this key ring.
+        """
+        return key_fingerprint(secret, self._salt)
+
+    @property
+    def fingerprints(self) -> List[str]:
+        return [fingerprint for fingerprint, _ in self._keys]
+
+    def verify(self, message: Buffer, provided_signature: Union[str, bytes]) -> Optional[str]:
+        """
+        Check ``provided_signature`` against each active key in turn.
+
+        :return: The fingerprint of the key that signed ``message``, or None if none did.
+        """
+        for fingerprint, verifier in self._keys:
+            if verifier.verify(message, provided_signature):
+                with self._lock:
+                    if fingerprint in self._counts:
+                        self._counts[fingerprint] += 1
+                return fingerprint
+        return None
 
-    calculated_signature = hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
-    return hmac.compare_digest(calculated_signature, provided_signature)
\ No newline at end of file
+    def acceptance_counts(self) -> Dict[str, int]:
+        """
+        Return the number of messages accepted by each active key, by fingerprint, in key order.
+        """
+        with self._lock:
+            return dict(self._counts)
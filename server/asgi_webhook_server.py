@@ -0,0 +1,105 @@
+"""
+ASGI implementation of the webhook server, with the same `/webhooks` semantics as
+``server/webhook_server.py``.
+
+Run it with several worker processes (``WEB_CONCURRENCY``, default 2):
+    python server/asgi_webhook_server.py
+or through any ASGI launcher:
+    uvicorn server.asgi_webhook_server:app --workers 4 --port 3010
+Each worker process has its own event queue, worker threads and key acceptance counters.
+"""
+import logging
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+
+from server.dedup import SqliteDedupStore
+from server.webhook_core import (
+    WEBHOOK_PORT, create_dedup_store, create_dispatcher, create_keys, create_sink, create_spool,
+    process_keys_request, process_webhook, replay_spool, setup_logging, shutdown
+)
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Created here rather than at import so that each worker process gets its own, and the
+    # supervisor process, which imports the module too, holds no spool slot or database
+    log_listener = setup_logging()
+    state = app.state
+    # Events are processed by worker threads after the request has been acknowledged,
+    # and written in batches to the sink when one is configured
+    state.sink = create_sink()
+    state.dispatcher = create_dispatcher(state.sink)
+    # Active webhook secrets, reloadable at runtime
+    state.keys = create_keys()
+    # Events already processed, so retried callbacks are not handled twice
+    state.dedup = create_dedup_store()
+    # Accepted events are spooled to disk before being acknowledged, when configured
+    state.spool = create_spool()
+
+    # File and database accesses block: the spool's fsync, the SQLite dedup store's writes
+    # (which wait on other processes' locks) and the secrets file's periodic re-reads
+    state.blocking = (
+        state.spool is not None or isinstance(state.dedup, SqliteDedupStore) or bool(state.keys.secrets_file)
+    )
+
+    replay_spool(state.spool, state.dispatcher, state.dedup)
+    state.dispatcher.start()
+    yield
+    shutdown(state.dispatcher, state.sink, state.spool)
+    log_listener.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+@app.post("/webhooks")
+async def handle_webhook(request: Request):
+    """
+    Handle incoming webhook events.
+    Validates the HMAC signature and queues the event for the dispatcher's workers.
+    Returns 503 with a Retry-After header when the queue is full.
+    """
+    state = request.app.state
+    args = (
+        await request.body(), request.headers.get("Authorization", ""),
+        state.keys, state.dispatcher, state.dedup, state.spool
+    )
+    if state.blocking:
+        # Keep the event loop free for the other requests while this one waits on I/O
+        status, body, headers = await run_in_threadpool(process_webhook, *args)
+    else:
+        # In-memory verification, deduplication and queueing run directly on the event loop
+        status, body, headers = process_webhook(*args)
+    return JSONResponse(body, status_code=status, headers=headers)
+
+
+@app.get("/webhooks/keys")
+async def webhook_keys(request: Request):
+    """
+    Report how many webhooks each active secret accepted in this worker process.
+    """
+    status, body, headers = process_keys_request(request.headers.get("Authorization", ""), request.app.state.keys)
+    return JSONResponse(body, status_code=status, headers=headers)
+
+
+def main():
+    import uvicorn
+
+    # Worker processes import the app by name, so the launcher cannot be handed the object
+    uvicorn.run(
+        "server.asgi_webhook_server:app",
+        host="0.0.0.0",
+        port=WEBHOOK_PORT,
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
+        access_log=False
+    )
+
+
+if __name__ == "__main__":
+    main()
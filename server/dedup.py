@@ -0,0 +1,131 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+def dedup_key(event: Dict[str, Any]) -> Optional[str]:
+    """
+    Identity of a delivery event: the message id and its status, so a ``delivered`` callback
+    after a ``failed`` one is still processed. Events without an id are never deduplicated.
+    """
+    if not isinstance(event, dict) or not event.get("id"):
+        return None
+    return f"{event['id']}:{event.get('status')}"
+
+
+class InMemoryDedupStore:
+    """
+    Keys seen in the last ``ttl`` seconds, bounded to ``maxsize`` entries (oldest dropped first).
+
+    Entries are kept in insertion order, which is also expiry order, so both checks and
+    expiry are O(1) amortized.
+    """
+
+    def __init__(self, maxsize: int = 100000, ttl: float = 86400.0, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param maxsize: Maximum number of keys remembered.
+        :param ttl: Seconds a key is remembered.
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+        if maxsize < 1 or ttl <= 0:
+            raise ValueError("Parameters 'maxsize' and 'ttl' must be positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key: str) -> bool:
+        """
+        Record a key.
+
+        :return: True if the key was not seen within the time to live.
+        """
+        now = self._clock()
+        with self._lock:
+            while self._seen:
+                oldest, seen_at = next(iter(self._seen.items()))
+                if seen_at > now - self.ttl:
+                    break
+                del self._seen[oldest]
+            if key in self._seen:
+                return False
+            self._seen[key] = now
+            if len(self._seen) > self.maxsize:
+                self._seen.popitem(last=False)
+            return True
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._seen.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteDedupStore:
+    """
+    Keys seen in the last ``ttl`` seconds, stored in a SQLite file so they survive restarts
+    and are shared by every worker process using the same file.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            ttl: float = 86400.0,
+            purge_every: int = 1000,
+            clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        :param path: Path of the SQLite file; created if missing.
+        :param ttl: Seconds a key is remembered.
+        :param purge_every: Number of insertions between deletions of expired keys.
+        :param clock: Wall-clock time source (persisted, so not monotonic), replaceable in tests.
+        """
+        if ttl <= 0:
+            raise ValueError("Parameter 'ttl' must be positive.")
+        self.ttl = ttl
+        self._clock = clock
+        self._purge_every = purge_every
+        self._inserted = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY, seen_at REAL NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS seen_at_index ON seen (seen_at)")
+
+    def add(self, key: str) -> bool:
+        """
+        Record a key.
+
+        :return: True if the key was not seen within the time to live.
+        """
+        now = self._clock()
+        with self._lock:
+            # Insert, or take over an expired row; a live row is left untouched (rowcount 0)
+            cursor = self._connection.execute(
+                "INSERT INTO seen (key, seen_at) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET seen_at = excluded.seen_at WHERE seen.seen_at <= ?",
+                (key, now, now - self.ttl)
+            )
+            added = cursor.rowcount == 1
+            if added:
+                self._inserted += 1
+                if self._inserted >= self._purge_every:
+                    self._connection.execute("DELETE FROM seen WHERE seen_at <= ?", (now - self.ttl,))
+                    self._inserted = 0
+            return added
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM seen WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,164 @@
+import logging
+import queue
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# The API only sends one kind of callback, and its payload carries no type field
+DEFAULT_EVENT_TYPE = "message.delivery"
+
+
+def event_type_of(event: Dict[str, Any]) -> str:
+    """
+    Return the type of a webhook event, defaulting to ``message.delivery``.
+    """
+    if isinstance(event, dict):
+        return event.get("type") or event.get("event") or DEFAULT_EVENT_TYPE
+    return DEFAULT_EVENT_TYPE
+
+
+class _Countdown:
+    """
+    Calls ``callback`` once :meth:`done` has been called ``count`` times, from any thread.
+    """
+
+    def __init__(self, count: int, callback: Callable[[], None]) -> None:
+        self._count = count
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def done(self) -> None:
+        with self._lock:
+            self._count -= 1
+            finished = self._count == 0
+        if finished:
+            self._callback()
+
+
+class EventDispatcher:
+    """
+    Bounded in-process queue of webhook events, drained by a pool of worker threads that
+    call the handlers registered for each event type.
+
+    An event's completion callback (see :meth:`submit`) only runs once it is fully processed:
+    every handler returned without raising, and every deferred handler reported its own
+    completion. An event a handler failed on is never completed, so it stays in the spool.
+    """
+
+    def __init__(self, workers: int = 4, queue_size: int = 1000) -> None:
+        """
+        :param workers: Number of worker threads processing events.
+        :param queue_size: Maximum number of events waiting; ``submit`` refuses events beyond it.
+        """
+        if workers < 1 or queue_size < 1:
+            raise ValueError("Parameters 'workers' and 'queue_size' must be positive integers.")
+        self.workers = workers
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._handlers: Dict[str, List[Tuple[Callable[..., None], bool]]] = defaultdict(list)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def register(self, event_type: str, handler: Callable[..., None], deferred: bool = False) -> None:
+        """
+        Call ``handler(event)`` on a worker thread for every event of ``event_type``.
+
+        :param deferred: Call ``handler(event, on_done=callback)`` instead, for handlers that
+                         finish their work later, e.g. :meth:`server.sink.BatchingSink.put`:
+                         the event only counts as processed once ``callback`` is called.
+        """
+        self._handlers[event_type].append((handler, deferred))
+
+    def handler(self, event_type: str):
+        """
+        Decorator form of :meth:`register`.
+        """
+        def decorator(function):
+            self.register(event_type, function)
+            return function
+        return decorator
+
+    def start(self) -> None:
+        """
+        Start the worker threads; called automatically by the first ``submit``.
+        """
+        with self._lock:
+            if self._threads:
+                return
+            for number in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"webhook-worker-{number}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Let the workers finish the queued events, then stop them.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def submit(self, event: Dict[str, Any], on_done: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Queue an event for processing without blocking.
+
+        :param on_done: (Optional) Called once every handler has processed the event
+                        successfully, on the worker thread or, with deferred handlers, on
+                        the thread of the last one to complete.
+        :return: False if the queue is full and the event was not accepted.
+        """
+        if not self._threads:
+            self.start()
+        try:
+            self._queue.put_nowait((event, on_done))
+        except queue.Full:
+            return False
+        return True
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self.dispatch(*item)
+            except Exception:
+                logger.exception("Webhook completion callback failed")
+            finally:
+                self._queue.task_done()
+
+    def dispatch(self, event: Dict[str, Any], on_done: Optional[Callable[[], None]] = None) -> None:
+        """
+        Run the handlers of an event in the calling thread, logging their failures.
+
+        :param on_done: (Optional) Called once every handler has processed the event
+                        successfully; never called if one of them failed.
+        """
+        event_type = event_type_of(event)
+        handlers = self._handlers.get(event_type)
+        if not handlers:
+            logger.warning("No handler registered for webhook event type '%s'", event_type)
+            if on_done is not None:
+                on_done()
+            return
+        # One count per deferred handler, plus one for the handlers run here
+        countdown = _Countdown(1 + sum(deferred for _, deferred in handlers), on_done or (lambda: None))
+        failed = False
+        for handler, deferred in handlers:
+            try:
+                if deferred:
+                    handler(event, on_done=countdown.done)
+                else:
+                    handler(event)
+            except Exception:
+                failed = True
+                logger.exception("Webhook handler %r failed for event type '%s'", handler, event_type)
+        if not failed:
+            countdown.done()
@@ -0,0 +1,165 @@
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sdk.utils.codec import dumps
+
+logger = logging.getLogger(__name__)
+
+
+class JsonlWriter:
+    """
+    Appends each batch of events to a JSON Lines file with a single write, synced to disk.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "ab")
+
+    def write_batch(self, events: List[Dict[str, Any]]) -> None:
+        self._file.write(b"".join(dumps(event) + b"\n" for event in events))
+        self._file.flush()
+        os.fsync(self._file.fileno())  # Events are acknowledged to the spool once written
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SqliteWriter:
+    """
+    Inserts each batch of events into a SQLite ``events`` table in one transaction.
+    """
+
+    def __init__(self, path: str) -> None:
+        # Only the sink's flusher thread writes, but the writer is created on another thread
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS events "
+            "(id TEXT, status TEXT, delivered_at TEXT, payload TEXT NOT NULL, received_at REAL NOT NULL)"
+        )
+
+    def write_batch(self, events: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO events (id, status, delivered_at, payload, received_at) VALUES (?, ?, ?, ?, ?)",
+                [(event.get("id"), event.get("status"), event.get("deliveredAt"), dumps(event).decode("utf-8"), now)
+                 for event in events]
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def create_writer(path: str):
+    """
+    Create the writer matching the extension of ``path``: ``.jsonl``, or ``.db``/``.sqlite``/``.sqlite3``.
+
+    :raises ValueError: If the extension is not supported.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".jsonl":
+        return JsonlWriter(path)
+    if extension in (".db", ".sqlite", ".sqlite3"):
+        return SqliteWriter(path)
+    raise ValueError(f"Unsupported sink file '{path}': expected .jsonl, .db, .sqlite or .sqlite3.")
+
+
+class BatchingSink:
+    """
+    Gathers events into batches and hands them to a writer from a background thread.
+
+    A batch is flushed when it holds ``batch_size`` events or when its first event has waited
+    ``max_latency`` seconds, whichever comes first. :meth:`put` blocks while ``queue_size``
+    events are waiting, which slows the dispatcher's workers and, in turn, makes the
+    webhook endpoint shed load. :meth:`close` flushes everything accepted so far.
+
+    The ``on_done`` callback given with an event is called once its batch is written; it is
+    not called if the writer fails, so the event stays in the spool to be replayed.
+    """
+
+    def __init__(self, writer, batch_size: int = 500, max_latency: float = 0.5, queue_size: int = 10000) -> None:
+        """
+        :param writer: Object with ``write_batch(events)`` and ``close()``, e.g. :class:`JsonlWriter`.
+        :param batch_size: Maximum number of events per batch.
+        :param max_latency: Maximum number of seconds an event waits before its batch is flushed.
+        :param queue_size: Maximum number of events waiting to be batched.
+        """
+        if batch_size < 1 or queue_size < 1 or max_latency < 0:
+            raise ValueError("Parameters 'batch_size' and 'queue_size' must be positive and 'max_latency' non-negative.")
+        self.writer = writer
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self.batches = 0
+        self.events = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="webhook-sink", daemon=True)
+        self._thread.start()
+
+    def put(
+            self,
+            event: Dict[str, Any],
+            timeout: Optional[float] = None,
+            on_done: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Queue an event, blocking while the sink is full.
+
+        :param on_done: (Optional) Called on the sink's thread once the event is written.
+        :raises queue.Full: If ``timeout`` elapses while the sink is still full.
+        :raises RuntimeError: If the sink is closed.
+        """
+        if self._closed:
+            raise RuntimeError("The sink is closed.")
+        self._queue.put((event, on_done), timeout=timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush the queued events, then close the writer.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self.writer.close()
+
+    def _run(self) -> None:
+        closing = False
+        while not closing:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[Dict[str, Any], Optional[Callable[[], None]]]]) -> None:
+        try:
+            self.writer.write_batch([event for event, _ in batch])
+        except Exception:
+            logger.exception("Failed to write a batch of %d webhook events", len(batch))
+            return
+        self.batches += 1
+        self.events += len(batch)
+        for _, on_done in batch:
+            if on_done is not None:
+                try:
+                    on_done()
+                except Exception:
+                    logger.exception("Webhook completion callback failed")
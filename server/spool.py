@@ -0,0 +1,343 @@
+import logging
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import defaultdict, namedtuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no lock, one process per spool directory is up to the operator
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("always", "group", "interval")
+
+# Each record is framed as: payload length, CRC32 of the payload, payload
+_HEADER = struct.Struct(">II")
+# Each acknowledgement is the offset of the record's frame in its segment
+_ACK = struct.Struct(">Q")
+_SEGMENT_NAME = re.compile(r"^segment-(\d{12})\.log$")
+_ACKS_NAME = re.compile(r"^segment-(\d{12})\.acks$")
+
+# Where a record was appended, to pass to Spool.ack
+SpoolPosition = namedtuple("SpoolPosition", "segment offset")
+
+
+def _segment_name(segment: int) -> str:
+    return f"segment-{segment:012d}.log"
+
+
+def _acks_name(segment: int) -> str:
+    return f"segment-{segment:012d}.acks"
+
+
+def _read_frames(path: str) -> Iterator[Tuple[int, bytes]]:
+    with open(path, "rb") as file:
+        offset = 0
+        while True:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            length, checksum = _HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                logger.warning("Spool segment %s ends with a torn record, ignoring it", path)
+                return
+            yield offset, payload
+            offset += _HEADER.size + length
+
+
+def read_segment(path: str) -> Iterator[bytes]:
+    """
+    Yield the records of a segment file, stopping at the first torn or corrupt record
+    (the tail of a write interrupted by a crash).
+    """
+    for _, payload in _read_frames(path):
+        yield payload
+
+
+def read_acks(path: str) -> Set[int]:
+    """
+    Return the offsets of the acknowledged records listed in an acks file, ignoring a torn
+    last entry; empty if the file does not exist.
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return set()
+    return {offset for offset, in _ACK.iter_unpack(data[:len(data) - len(data) % _ACK.size])}
+
+
+class Spool:
+    """
+    Append-only write-ahead log of accepted webhook events, split into segment files.
+
+    Records are appended sequentially to the current segment, which is rotated once it
+    exceeds ``segment_size`` bytes. Each :meth:`append` returns the record's position; once
+    every record of a rotated segment has been acknowledged with :meth:`ack`, the segment is
+    deleted. Segments left over by a previous process are drained with :meth:`replay`.
+
+    Acknowledgements are appended to a ``segment-<n>.acks`` file next to the segment (without
+    fsync: an acknowledgement lost in a machine crash only means a record is replayed again),
+    so :meth:`replay` skips the records a previous process had already processed.
+
+    When :meth:`append` returns, the record is on disk according to ``fsync``:
+
+    - ``always``: fsync after every record.
+    - ``group``: concurrent appenders share fsyncs; one of them syncs everything written so
+      far while the others wait for it, so each still returns only once its record is durable.
+    - ``interval``: a background thread fsyncs every ``fsync_interval`` seconds; a crash can
+      lose the records of the last interval.
+    """
+
+    def __init__(
+            self,
+            directory: str,
+            fsync: str = "group",
+            segment_size: int = 64 * 1024 * 1024,
+            fsync_interval: float = 0.05
+    ) -> None:
+        """
+        :param directory: Directory of the segment files; created if missing.
+        :param fsync: One of ``always``, ``group`` or ``interval``.
+        :param segment_size: Size in bytes after which a new segment is started.
+        :param fsync_interval: Seconds between fsyncs with the ``interval`` policy.
+        :raises ValueError: If the policy is unknown.
+        :raises RuntimeError: If another process is using the directory.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Parameter 'fsync' must be one of {', '.join(FSYNC_POLICIES)}.")
+        if segment_size < 1:
+            raise ValueError("Parameter 'segment_size' must be a positive integer.")
+        self.directory = directory
+        self.fsync = fsync
+        self.segment_size = segment_size
+        self.fsync_interval = fsync_interval
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = self._lock_directory()
+
+        self._cond = threading.Condition()
+        self._unacked: Dict[int, int] = defaultdict(int)
+        self._ack_fds: Dict[int, int] = {}
+        self._written = 0  # Records appended so far
+        self._synced = 0  # Records known to be on disk
+        self._syncing = False
+        self._retired: List[int] = []  # File descriptors to close once the running fsync ends
+        self._closed = False
+
+        self._leftovers = self.segments()
+        self._remove_orphan_acks()
+        self._segment = (self._leftovers[-1] + 1) if self._leftovers else 0
+        self._fd = self._open_segment(self._segment)
+        self._segment_bytes = 0
+
+        self._flusher = None
+        if fsync == "interval":
+            self._flusher = threading.Thread(target=self._flush_periodically, name="webhook-spool", daemon=True)
+            self._flusher.start()
+
+    def _lock_directory(self):
+        file = open(os.path.join(self.directory, "LOCK"), "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                file.close()
+                raise RuntimeError(f"Spool directory '{self.directory}' is used by another process.")
+        return file
+
+    def _remove_orphan_acks(self) -> None:
+        """
+        Delete acks files whose segment is gone (a crash between the two deletions), so they
+        cannot apply to a new segment reusing the number.
+        """
+        leftovers = set(self._leftovers)
+        for name in os.listdir(self.directory):
+            match = _ACKS_NAME.match(name)
+            if match and int(match.group(1)) not in leftovers:
+                os.remove(os.path.join(self.directory, name))
+
+    def _open_segment(self, segment: int) -> int:
+        return os.open(
+            os.path.join(self.directory, _segment_name(segment)), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+
+    def segments(self) -> List[int]:
+        """
+        Return the numbers of the segment files in the directory, oldest first.
+        """
+        return sorted(int(match.group(1)) for match in map(_SEGMENT_NAME.match, os.listdir(self.directory)) if match)
+
+    def append(self, record: bytes) -> SpoolPosition:
+        """
+        Append a record and make it durable according to the fsync policy.
+
+        :return: The position of the record, to pass to :meth:`ack`.
+        :raises RuntimeError: If the spool is closed.
+        """
+        frame = _HEADER.pack(len(record), zlib.crc32(record)) + record
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The spool is closed.")
+            if self._segment_bytes and self._segment_bytes + len(frame) > self.segment_size:
+                self._rotate()
+            view = memoryview(frame)
+            offset = self._segment_bytes
+            while view:
+                view = view[os.write(self._fd, view):]
+            self._segment_bytes += len(frame)
+            self._written += 1
+            position = self._written
+            segment = self._segment
+            self._unacked[segment] += 1
+
+            if self.fsync == "always":
+                os.fsync(self._fd)
+                self._synced = position
+            elif self.fsync == "group":
+                self._sync_until(position)
+        return SpoolPosition(segment, offset)
+
+    def _sync_until(self, position: int) -> None:
+        """
+        Group commit: return once ``position`` records are synced, syncing as the leader if no
+        one else is. Called with the lock held; it is released during the fsync itself.
+        """
+        while self._synced < position:
+            if self._syncing:
+                self._cond.wait()
+                continue
+            self._syncing = True
+            target, fd = self._written, self._fd
+            self._cond.release()
+            try:
+                os.fsync(fd)
+            finally:
+                self._cond.acquire()
+                self._syncing = False
+                self._cond.notify_all()
+            self._synced = max(self._synced, target)
+            for retired in self._retired:
+                os.close(retired)
+            self._retired = []
+
+    def _rotate(self) -> None:
+        """
+        Close the current segment and start the next one; called with the lock held.
+        """
+        os.fsync(self._fd)
+        self._synced = self._written
+        if self._syncing:
+            self._retired.append(self._fd)  # The running fsync still uses it
+        else:
+            os.close(self._fd)
+        previous = self._segment
+        self._segment += 1
+        self._fd = self._open_segment(self._segment)
+        self._segment_bytes = 0
+        if not self._unacked.get(previous):
+            self._delete(previous)
+
+    def ack(self, position: SpoolPosition) -> None:
+        """
+        Mark the record at ``position`` as processed, so it is not replayed; rotated segments
+        are deleted once fully processed.
+        """
+        segment = position.segment
+        with self._cond:
+            self._unacked[segment] -= 1
+            if self._unacked[segment] <= 0 and segment != self._segment:
+                self._delete(segment)
+                return
+            fd = self._ack_fds.get(segment)
+            if fd is None:
+                fd = self._ack_fds[segment] = os.open(
+                    os.path.join(self.directory, _acks_name(segment)), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+                )
+            os.write(fd, _ACK.pack(position.offset))
+
+    def _delete(self, segment: int) -> None:
+        """
+        Delete a segment and its acks file; the acks go first, so a crash in between leaves
+        a segment replayed in full rather than acks without their segment.
+        """
+        self._unacked.pop(segment, None)
+        fd = self._ack_fds.pop(segment, None)
+        if fd is not None:
+            os.close(fd)
+        for name in (_acks_name(segment), _segment_name(segment)):
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def replay(self, handler: Callable[[bytes], None]) -> int:
+        """
+        Pass every record left unacknowledged by a previous process to ``handler``, oldest
+        first, deleting each segment once all its records are handled. Call it before
+        serving requests.
+
+        :return: The number of records replayed.
+        """
+        count = 0
+        while self._leftovers:
+            segment = self._leftovers[0]
+            acked = read_acks(os.path.join(self.directory, _acks_name(segment)))
+            for offset, record in _read_frames(os.path.join(self.directory, _segment_name(segment))):
+                if offset not in acked:
+                    handler(record)
+                    count += 1
+            self._delete(segment)
+            self._leftovers.pop(0)
+        return count
+
+    def _flush_periodically(self) -> None:
+        with self._cond:
+            while not self._closed:
+                self._cond.wait(self.fsync_interval)
+                if not self._closed and self._synced < self._written:
+                    self._sync_until(self._written)
+
+    def close(self) -> None:
+        """
+        Sync and close the current segment. Unacknowledged records stay for the next replay.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            while self._syncing:
+                self._cond.wait()
+            os.fsync(self._fd)
+            os.close(self._fd)
+            for retired in self._retired:
+                os.close(retired)
+            self._retired = []
+            if not self._unacked.get(self._segment):
+                self._delete(self._segment)
+            for fd in self._ack_fds.values():
+                os.close(fd)
+            self._ack_fds.clear()
+        if self._flusher is not None:
+            self._flusher.join()
+        self._lock_file.close()
+
+
+def open_spool(base_directory: str, **kwargs) -> Spool:
+    """
+    Open a spool in the first ``slot-<n>`` subdirectory of ``base_directory`` not used by
+    another process, so each worker process of a server gets its own spool and, after a
+    restart, replays the segments of a previous process.
+    """
+    slot = 0
+    while True:
+        try:
+            return Spool(os.path.join(base_directory, f"slot-{slot}"), **kwargs)
+        except RuntimeError:
+            slot += 1
@@ -0,0 +1,524 @@
+"""
+In-memory stub of the messaging API (``docs/openapi.yaml``) for load and latency testing.
+
+It serves ``/contacts`` and ``/messages`` with the documented request and response schemas,
+and moves sent messages to ``delivered`` (or ``failed``) after ``delivery_delay`` seconds,
+posting a signed ``message.delivery`` webhook to ``webhook_url`` when one is set.
+Latency, 5xx errors, 429s and page size caps are injected from :class:`Faults`, with a
+seeded random generator so runs are reproducible.
+
+Usage:
+    python -m server.stub_api_server --port 3000 --latency 0.02 --error-rate 0.01 \\
+        --webhook-url http://localhost:3010/webhooks --webhook-secret mySecret
+"""
+import argparse
+import heapq
+import logging
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from sdk.utils.codec import dumps, loads
+from sdk.utils.signature import get_verifier
+
+logger = logging.getLogger(__name__)
+
+StubResponse = Tuple[int, Optional[Dict[str, Any]], Dict[str, str]]
+
+
+@dataclass
+class Faults:
+    """
+    Faults injected into every API request; the webhook callbacks are not affected.
+
+    :param latency: Seconds added to every response.
+    :param latency_jitter: Up to this many more seconds, drawn uniformly.
+    :param error_rate: Fraction of requests answered ``500``.
+    :param throttle_rate: Fraction of requests answered ``429``.
+    :param rate_limit: Requests per second above which requests are answered ``429``; None for no limit.
+    :param retry_after: ``Retry-After`` seconds sent with every ``429``; None to omit the header.
+    :param max_page_size: Largest page returned by the list endpoints, whatever the client asks for.
+    """
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    rate_limit: Optional[float] = None
+    retry_after: Optional[float] = 1.0
+    max_page_size: Optional[int] = None
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _not_found(kind: str, item_id: str) -> StubResponse:
+    return 404, {"id": item_id, "message": f"{kind} not found"}, {}
+
+
+def _bad_request(error: str) -> StubResponse:
+    return 400, {"error": error}, {}
+
+
+def _page_params(query: Dict[str, List[str]], page_key: str, size_key: str, default_size: int) -> Tuple[int, int]:
+    """
+    Read 1-based page number and page size query parameters, falling back to defaults when invalid.
+    """
+    def read(key: str, default: int) -> int:
+        try:
+            return max(1, int(float(query[key][0])))
+        except (KeyError, IndexError, ValueError):
+            return default
+
+    return read(page_key, 1), read(size_key, default_size)
+
+
+class StubAPI:
+    """
+    State and request handling of the stub, independent of the HTTP transport.
+    """
+
+    def __init__(
+            self,
+            api_key: Optional[str] = None,
+            faults: Optional[Faults] = None,
+            webhook_url: Optional[str] = None,
+            webhook_secret: str = "mySecret",
+            delivery_delay: float = 0.1,
+            failure_rate: float = 0.0,
+            seed: Optional[int] = 0,
+            webhook_workers: int = 4
+    ) -> None:
+        """
+        :param api_key: Bearer token required on every request; None accepts any token.
+        :param faults: Faults to inject; can be replaced at any time through ``self.faults``.
+        :param webhook_url: URL receiving the ``message.delivery`` callbacks; None sends none.
+        :param webhook_secret: Secret signing the callbacks (``Authorization: Signature <hex>``).
+        :param delivery_delay: Seconds after which a sent message reaches its final status.
+        :param failure_rate: Fraction of messages ending ``failed`` instead of ``delivered``.
+        :param seed: Seed of the random generator driving faults and failures.
+        :param webhook_workers: Number of threads posting the callbacks, so a slow receiver
+                                does not hold back the other deliveries.
+        """
+        self.api_key = api_key
+        self.faults = faults or Faults()
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.delivery_delay = delivery_delay
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.webhooks_sent = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._contacts: Dict[str, Dict[str, Any]] = {}
+        self._messages: Dict[str, Dict[str, Any]] = {}
+        # IDs in creation order, which is also the listing order: a page is sliced from them
+        # without copying the whole store (deleting a contact scans its list instead)
+        self._contact_ids: List[str] = []
+        self._message_ids: List[str] = []
+        self._tokens: Optional[float] = None  # Rate limit budget, full at the first request
+        self._tokens_updated = time.monotonic()
+
+        self._deliveries: List[Tuple[float, str]] = []  # Heap of (due time, message id)
+        self._deliveries_changed = threading.Condition(self._lock)
+        self._closed = False
+        self._session = requests.Session()
+        self._session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=webhook_workers))
+        self._session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=webhook_workers))
+        self._webhooks = ThreadPoolExecutor(max_workers=webhook_workers, thread_name_prefix="stub-api-webhooks")
+        self._deliverer = threading.Thread(target=self._deliver_loop, name="stub-api-deliveries", daemon=True)
+        self._deliverer.start()
+
+    def close(self) -> None:
+        """
+        Stop delivering messages; pending deliveries are dropped, callbacks already due are still posted.
+        """
+        with self._lock:
+            self._closed = True
+            self._deliveries_changed.notify()
+        self._deliverer.join()
+        self._webhooks.shutdown()
+        self._session.close()
+
+    def add_contacts(self, count: int) -> List[str]:
+        """
+        Create ``count`` contacts directly in the store, e.g. to benchmark listing.
+
+        :return: Their IDs.
+        """
+        ids = []
+        with self._lock:
+            for number in range(count):
+                contact = self._new_contact(f"Contact {len(self._contacts) + 1}", f"+1415{number % 10 ** 7:07d}")
+                ids.append(contact["id"])
+        return ids
+
+    def handle(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> StubResponse:
+        """
+        Answer one request.
+
+        :param method: HTTP method.
+        :param target: Path and query string.
+        :param headers: Request headers, with lowercase names.
+        :param body: Raw request body.
+        :return: The status, the JSON body (None for no content) and extra headers.
+        """
+        faults = self.faults
+        injected = self._inject(faults)
+        if faults.latency or faults.latency_jitter:
+            time.sleep(faults.latency + self._random.uniform(0, faults.latency_jitter))
+        if injected is not None:
+            return injected
+
+        authorization = headers.get("authorization", "")
+        if not authorization.startswith("Bearer ") or (self.api_key and authorization[7:] != self.api_key):
+            return 401, {"message": "Unauthorized"}, {}
+
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+        query = parse_qs(url.query)
+        payload = None
+        if method in ("POST", "PATCH"):
+            try:
+                payload = loads(body or b"null")
+            except ValueError:
+                return _bad_request("Invalid JSON body")
+            if not isinstance(payload, dict):
+                return _bad_request("The request body must be a JSON object")
+
+        if parts == ["contacts"]:
+            if method == "POST":
+                return self._create_contact(payload)
+            if method == "GET":
+                return self._list_contacts(query)
+        elif len(parts) == 2 and parts[0] == "contacts":
+            if method == "GET":
+                return self._get_contact(parts[1])
+            if method == "PATCH":
+                return self._update_contact(parts[1], payload)
+            if method == "DELETE":
+                return self._delete_contact(parts[1])
+        elif parts == ["messages"]:
+            if method == "POST":
+                return self._send_message(payload)
+            if method == "GET":
+                return self._list_messages(query)
+        elif len(parts) == 2 and parts[0] == "messages" and method == "GET":
+            return self._get_message(parts[1])
+        return 404, {"message": f"Cannot {method} {url.path}"}, {}
+
+    def _inject(self, faults: Faults) -> Optional[StubResponse]:
+        """
+        Pick the injected failure of a request, if any.
+        """
+        with self._lock:
+            self.requests += 1
+            throttled = faults.throttle_rate and self._random.random() < faults.throttle_rate
+            if faults.rate_limit and not throttled:
+                now = time.monotonic()
+                refill = (now - self._tokens_updated) * faults.rate_limit
+                self._tokens = faults.rate_limit if self._tokens is None else min(faults.rate_limit, self._tokens + refill)
+                self._tokens_updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                else:
+                    throttled = True
+            failed = not throttled and faults.error_rate and self._random.random() < faults.error_rate
+        if throttled:
+            headers = {"Retry-After": f"{faults.retry_after:g}"} if faults.retry_after is not None else {}
+            return 429, {"message": "Too many requests"}, headers
+        if failed:
+            return 500, {"message": "Internal server error"}, {}
+        return None
+
+    def _page_size(self, requested: int) -> int:
+        cap = self.faults.max_page_size
+        return min(requested, cap) if cap else requested
+
+    # Contacts
+
+    def _new_contact(self, name: str, phone: str) -> Dict[str, Any]:
+        """
+        Store a new contact; called with the lock held.
+        """
+        contact = {"id": uuid.uuid4().hex, "name": name, "phone": phone}
+        self._contacts[contact["id"]] = contact
+        self._contact_ids.append(contact["id"])
+        return contact
+
+    @staticmethod
+    def _check_contact_fields(payload: Dict[str, Any], required: bool) -> Optional[str]:
+        for key in ("name", "phone"):
+            if key in payload or required:
+                value = payload.get(key)
+                if not isinstance(value, str) or not value.strip():
+                    return f"'{key}' must be a non-empty string"
+        if "phone" in payload and not payload["phone"].startswith("+"):
+            return "'phone' must be in E.164 format"
+        return None
+
+    def _create_contact(self, payload: Dict[str, Any]) -> StubResponse:
+        error = self._check_contact_fields(payload, required=True)
+        if error:
+            return _bad_request(error)
+        with self._lock:
+            contact = self._new_contact(payload["name"], payload["phone"])
+        return 201, dict(contact), {}
+
+    def _list_contacts(self, query: Dict[str, List[str]]) -> StubResponse:
+        page, size = _page_params(query, "pageIndex", "max", 10)
+        size = self._page_size(size)
+        with self._lock:
+            contacts = [dict(self._contacts[item_id]) for item_id in self._contact_ids[(page - 1) * size:page * size]]
+        return 200, {"contacts": contacts, "pageNumber": page, "pageSize": size}, {}
+
+    def _get_contact(self, contact_id: str) -> StubResponse:
+        contact = self._contacts.get(contact_id)
+        if contact is None:
+            return _not_found("Contact", contact_id)
+        return 200, dict(contact), {}
+
+    def _update_contact(self, contact_id: str, payload: Dict[str, Any]) -> StubResponse:
+        error = self._check_contact_fields(payload, required=False)
+        if error:
+            return _bad_request(error)
+        with self._lock:
+            contact = self._contacts.get(contact_id)
+            if contact is None:
+                return _not_found("Contact", contact_id)
+            contact.update((key, payload[key]) for key in ("name", "phone") if key in payload)
+            return 200, dict(contact), {}
+
+    def _delete_contact(self, contact_id: str) -> StubResponse:
+        with self._lock:
+            if self._contacts.pop(contact_id, None) is None:
+                return _not_found("Contact", contact_id)
+            self._contact_ids.remove(contact_id)
+        return 204, None, {}
+
+    # Messages
+
+    def _send_message(self, payload: Dict[str, Any]) -> StubResponse:
+        for key in ("from", "content"):
+            if not isinstance(payload.get(key), str) or not payload[key]:
+                return _bad_request(f"'{key}' must be a non-empty string")
+        to = payload.get("to")
+        if not isinstance(to, dict):
+            return _bad_request("'to' must be a contact ID or contact details")
+
+        with self._lock:
+            if "id" in to:
+                recipient = self._contacts.get(to["id"])
+                if recipient is None:
+                    return _bad_request(f"Contact {to['id']} does not exist")
+            else:
+                error = self._check_contact_fields(to, required=True)
+                if error:
+                    return _bad_request(error)
+                recipient = self._new_contact(to["name"], to["phone"])
+            message = {
+                "id": uuid.uuid4().hex,
+                "from": payload["from"],
+                "to": dict(recipient),
+                "content": payload["content"],
+                "status": "queued",
+                "createdAt": _now(),
+                "deliveredAt": None,
+            }
+            self._messages[message["id"]] = message
+            self._message_ids.append(message["id"])
+            heapq.heappush(self._deliveries, (time.monotonic() + self.delivery_delay, message["id"]))
+            self._deliveries_changed.notify()
+            return 201, dict(message), {}
+
+    def _list_messages(self, query: Dict[str, List[str]]) -> StubResponse:
+        page, size = _page_params(query, "page", "limit", 100)
+        size = self._page_size(size)
+        with self._lock:
+            messages = [dict(self._messages[item_id]) for item_id in self._message_ids[(page - 1) * size:page * size]]
+        return 200, {"messages": messages, "page": page, "quantityPerPage": size}, {}
+
+    def _get_message(self, message_id: str) -> StubResponse:
+        message = self._messages.get(message_id)
+        if message is None:
+            return _not_found("Message", message_id)
+        return 200, dict(message), {}
+
+    # Deliveries
+
+    def _deliver_loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._closed and (not self._deliveries or self._deliveries[0][0] > time.monotonic()):
+                    self._deliveries_changed.wait(
+                        self._deliveries[0][0] - time.monotonic() if self._deliveries else None
+                    )
+                if self._closed:
+                    return
+                _, message_id = heapq.heappop(self._deliveries)
+                message = self._messages.get(message_id)
+                if message is None:
+                    continue
+                event = {"id": message_id}
+                if self._random.random() < self.failure_rate:
+                    event.update(status="failed", failureReason="Recipient unreachable")
+                else:
+                    event.update(status="delivered", deliveredAt=_now())
+                    message["deliveredAt"] = event["deliveredAt"]
+                message["status"] = event["status"]
+            if self.webhook_url:
+                self._webhooks.submit(self._send_webhook, event)
+
+    def _send_webhook(self, event: Dict[str, Any]) -> None:
+        body = dumps(event)
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Signature {get_verifier(self.webhook_secret).sign(body)}",
+        }
+        try:
+            self._session.post(self.webhook_url, data=body, headers=headers, timeout=5)
+            with self._lock:
+                self.webhooks_sent += 1
+        except requests.RequestException as e:
+            logger.warning("Delivery webhook for message %s failed: %s", event["id"], e)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Buffer the response and disable Nagle so headers and body leave in one segment;
+    # otherwise delayed ACKs add ~40ms to every keep-alive round trip.
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        status, payload, extra_headers = self.server.api.handle(self.command, self.path, headers, body)
+
+        content = dumps(payload) if payload is not None else b""
+        self.send_response(status)
+        for name, value in extra_headers.items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubAPIServer(ThreadingHTTPServer):
+    """
+    HTTP server around a :class:`StubAPI`, one thread per connection.
+
+    Use it as a context manager to serve from a background thread::
+
+        with StubAPIServer(StubAPI(faults=Faults(latency=0.01))) as server:
+            client = APIClient(...)  # with base_url = server.url
+    """
+    daemon_threads = True
+
+    def __init__(self, api: StubAPI, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        :param api: The stub answering requests.
+        :param host: Interface to listen on.
+        :param port: Port to listen on; 0 picks a free one.
+        """
+        super().__init__((host, port), _StubHandler)
+        self.api = api
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_port}"
+
+    def start(self) -> "StubAPIServer":
+        """
+        Serve from a background thread.
+        """
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, name="stub-api-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the listening socket and the stub.
+        """
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+        self.server_close()
+        self.api.close()
+
+    def __enter__(self) -> "StubAPIServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=3000, help="Port to listen on.")
+    parser.add_argument("--api-key", help="Bearer token to require; any token is accepted by default.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Up to this many more seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 500.")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered 429.")
+    parser.add_argument("--rate-limit", type=float, help="Requests/sec above which requests are answered 429.")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds of the 429s.")
+    parser.add_argument("--max-page-size", type=int, help="Largest page returned by the list endpoints.")
+    parser.add_argument("--webhook-url", help="URL receiving the message.delivery callbacks.")
+    parser.add_argument("--webhook-secret", default="mySecret", help="Secret signing the callbacks.")
+    parser.add_argument("--delivery-delay", type=float, default=0.1, help="Seconds before a message is final.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of messages ending 'failed'.")
+    parser.add_argument("--webhook-workers", type=int, default=4, help="Threads posting the callbacks.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the injected faults.")
+    parser.add_argument("--contacts", type=int, default=0, help="Contacts to create at startup.")
+    args = parser.parse_args()
+
+    faults = Faults(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+        max_page_size=args.max_page_size,
+    )
+    api = StubAPI(
+        args.api_key, faults, args.webhook_url, args.webhook_secret, args.delivery_delay, args.failure_rate, args.seed,
+        args.webhook_workers
+    )
+    api.add_contacts(args.contacts)
+    server = StubAPIServer(api, args.host, args.port)
+    logging.basicConfig(level=logging.INFO)
+    logger.info("Stub API listening on %s", server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        api.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import json
+import hmac
+import hashlib
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.testclient import TestClient
+
+from server.asgi_webhook_server import app
+from server.dedup import SqliteDedupStore
+from server.webhook_core import WEBHOOK_SECRET, process_webhook
+
+
+class TestAsgiWebhookHandler(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up the ASGI test client for the webhook handler.
+        """
+        self.client = TestClient(app)
+        self.client.__enter__()  # Runs the lifespan, which creates the server's resources
+        self.addCleanup(self.client.__exit__, None, None, None)
+
+    def _signed_post(self, body: str):
+        signature = hmac.new(WEBHOOK_SECRET.encode(), body.encode(), hashlib.sha256).hexdigest()
+        return self.client.post(
+            "/webhooks",
+            content=body,
+            headers={"Content-Type": "application/json", "Authorization": f"Signature {signature}"}
+        )
+
+    def test_handle_webhook_expects_invalid_signature(self):
+        """
+        Test handling a webhook with an invalid signature.
+        """
+        response = self.client.post(
+            "/webhooks",
+            content=json.dumps({"event": "test_event", "data": "sample_data"}),
+            headers={"Authorization": "Signature invalid_signature"}
+        )
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {"error": "Invalid signature"})
+
+    def test_handle_webhook_expects_missing_authorization_header(self):
+        """
+        Test handling a webhook request with a missing Authorization header.
+        """
+        response = self.client.post("/webhooks", content=json.dumps({"event": "test_event"}))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Missing Authorization header"})
+
+    @patch.object(app.state, "dispatcher")
+    def test_handle_webhook_expects_event_queued(self, mock_dispatcher):
+        """
+        Test that a valid webhook is handed to the dispatcher and acknowledged.
+        """
+        mock_dispatcher.submit.return_value = True
+        payload = {"id": "msg-1", "status": "delivered", "deliveredAt": "2024-01-01T00:00:00Z"}
+
+        response = self._signed_post(json.dumps(payload))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "received"})
+        mock_dispatcher.submit.assert_called_once_with(payload, None)
+
+    @patch.object(app.state, "dispatcher")
+    def test_handle_webhook_expects_duplicate_acknowledged_once(self, mock_dispatcher):
+        """
+        Test that a retried callback is acknowledged without being queued again.
+        """
+        mock_dispatcher.submit.return_value = True
+        body = json.dumps({"id": "msg-1", "status": "delivered"})
+
+        self.assertEqual(self._signed_post(body).json(), {"status": "received"})
+        self.assertEqual(self._signed_post(body).json(), {"status": "duplicate"})
+        mock_dispatcher.submit.assert_called_once()
+
+    def test_resources_are_created_by_the_lifespan(self):
+        """
+        Test that importing the module creates nothing, so a supervisor process holds no spool slot.
+        """
+        import server.asgi_webhook_server as module
+
+        for name in ("sink", "dispatcher", "keys", "dedup", "spool"):
+            self.assertFalse(hasattr(module, name))
+        with patch("server.webhook_core.WEBHOOK_ADMIN_TOKEN", "adminToken"):
+            response = self.client.get("/webhooks/keys", headers={"Authorization": "Bearer adminToken"})
+        self.assertEqual(len(response.json()["keys"]), 1)
+
+    @patch.object(app.state, "dispatcher")
+    def test_handle_webhook_expects_503_when_queue_full(self, mock_dispatcher):
+        """
+        Test that the webhook is rejected with Retry-After when the queue is full.
+        """
+        mock_dispatcher.submit.return_value = False
+
+        response = self._signed_post(json.dumps({"id": "msg-1", "status": "delivered"}))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {"error": "Webhook queue is full"})
+        self.assertIn("Retry-After", response.headers)
+
+
+class TestAsgiBlockingResources(unittest.TestCase):
+    def test_sqlite_dedup_store_runs_off_the_event_loop(self):
+        """
+        Test that requests run in the thread pool when the dedup store writes to SQLite.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        store = SqliteDedupStore(os.path.join(directory.name, "dedup.db"))
+        self.addCleanup(store.close)
+        body = json.dumps({"id": "msg-1", "status": "delivered"})
+        signature = hmac.new(WEBHOOK_SECRET.encode(), body.encode(), hashlib.sha256).hexdigest()
+        offloaded = []
+
+        async def recording_run_in_threadpool(function, *args):
+            offloaded.append(function)
+            return await run_in_threadpool(function, *args)
+
+        with patch("server.asgi_webhook_server.create_dedup_store", return_value=store), \
+                patch("server.asgi_webhook_server.run_in_threadpool", recording_run_in_threadpool), \
+                TestClient(app) as client:
+            response = client.post("/webhooks", content=body, headers={"Authorization": f"Signature {signature}"})
+
+        self.assertEqual(response.json(), {"status": "received"})
+        self.assertEqual(offloaded, [process_webhook])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+
+from server.dedup import InMemoryDedupStore, SqliteDedupStore, dedup_key
+
+
+class TestDedupKey(unittest.TestCase):
+    def test_key_combines_id_and_status(self):
+        self.assertEqual(dedup_key({"id": "msg-1", "status": "delivered"}), "msg-1:delivered")
+        self.assertIsNone(dedup_key({"status": "delivered"}))
+        self.assertIsNone(dedup_key(["not", "an", "event"]))
+
+
+class TestInMemoryDedupStore(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.store = InMemoryDedupStore(maxsize=2, ttl=10, clock=lambda: self.now)
+
+    def test_add_detects_duplicates(self):
+        self.assertTrue(self.store.add("a"))
+        self.assertFalse(self.store.add("a"))
+        self.store.discard("a")
+        self.assertTrue(self.store.add("a"))
+
+    def test_keys_expire_after_ttl(self):
+        self.store.add("a")
+        self.now = 10.0
+        self.assertTrue(self.store.add("a"))
+        self.assertEqual(len(self.store), 1)
+
+    def test_oldest_key_dropped_beyond_maxsize(self):
+        for key in ("a", "b", "c"):
+            self.store.add(key)
+        self.assertEqual(len(self.store), 2)
+        self.assertTrue(self.store.add("a"))
+        self.assertFalse(self.store.add("c"))
+
+
+class TestSqliteDedupStore(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "dedup.db")
+
+    def _store(self, **kwargs):
+        store = SqliteDedupStore(self.path, ttl=10, clock=lambda: self.now, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_add_detects_duplicates_across_restarts(self):
+        """
+        Test that keys recorded by one store are still known after reopening the file.
+        """
+        store = self._store()
+        self.assertTrue(store.add("a"))
+        self.assertFalse(store.add("a"))
+        store.close()
+
+        reopened = self._store()
+        self.assertFalse(reopened.add("a"))
+        reopened.discard("a")
+        self.assertTrue(reopened.add("a"))
+
+    def test_expired_keys_are_accepted_and_purged(self):
+        store = self._store(purge_every=1)
+        store.add("a")
+        self.now += 10
+        self.assertTrue(store.add("a"))
+        store.add("b")
+        self.now += 10
+        store.add("c")  # Purges 'a' and 'b'
+        count = store._connection.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        self.assertEqual(count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import threading
+import unittest
+
+from server.dispatcher import DEFAULT_EVENT_TYPE, EventDispatcher, event_type_of
+
+
+class TestEventDispatcher(unittest.TestCase):
+    def test_event_type_defaults_to_message_delivery(self):
+        """
+        Test that events without a type field are delivery events.
+        """
+        self.assertEqual(event_type_of({"id": "msg-1", "status": "delivered"}), DEFAULT_EVENT_TYPE)
+        self.assertEqual(event_type_of({"type": "contact.updated"}), "contact.updated")
+
+    def test_submit_runs_handlers_on_workers(self):
+        """
+        Test that queued events reach every handler registered for their type, and only those.
+        """
+        dispatcher = EventDispatcher(workers=2, queue_size=10)
+        received = []
+        dispatcher.register(DEFAULT_EVENT_TYPE, lambda event: received.append(("first", event["id"])))
+        dispatcher.register(DEFAULT_EVENT_TYPE, lambda event: received.append(("second", event["id"])))
+        dispatcher.register("other", lambda event: received.append(("other", event["id"])))
+
+        self.assertTrue(dispatcher.submit({"id": "msg-1"}))
+        dispatcher.stop()
+
+        self.assertEqual(sorted(received), [("first", "msg-1"), ("second", "msg-1")])
+
+    def test_submit_expects_false_when_queue_full(self):
+        """
+        Test that events beyond the queue size are refused instead of blocking.
+        """
+        dispatcher = EventDispatcher(workers=1, queue_size=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_handler(event):
+            started.set()
+            release.wait(5)
+
+        dispatcher.register(DEFAULT_EVENT_TYPE, slow_handler)
+        self.assertTrue(dispatcher.submit({"id": "busy"}))
+        started.wait(5)
+        self.assertTrue(dispatcher.submit({"id": "queued"}))
+        self.assertFalse(dispatcher.submit({"id": "rejected"}))
+
+        release.set()
+        dispatcher.stop()
+
+    def test_failing_handler_does_not_stop_worker(self):
+        """
+        Test that an exception in a handler is logged and later events are still processed.
+        """
+        dispatcher = EventDispatcher(workers=1, queue_size=10)
+        received = []
+
+        def handler(event):
+            if event["id"] == "bad":
+                raise RuntimeError("boom")
+            received.append(event["id"])
+
+        dispatcher.register(DEFAULT_EVENT_TYPE, handler)
+        with self.assertLogs("server.dispatcher", level="ERROR"):
+            dispatcher.submit({"id": "bad"})
+            dispatcher.submit({"id": "good"})
+            dispatcher.stop()
+
+        self.assertEqual(received, ["good"])
+
+    def test_on_done_only_after_every_handler_succeeded(self):
+        """
+        Test that an event a handler failed on is not completed, so it stays in the spool.
+        """
+        dispatcher = EventDispatcher(workers=1, queue_size=10)
+        completed = []
+
+        def handler(event):
+            if event["id"] == "bad":
+                raise RuntimeError("boom")
+
+        dispatcher.register(DEFAULT_EVENT_TYPE, handler)
+        with self.assertLogs("server.dispatcher", level="ERROR"):
+            dispatcher.submit({"id": "bad"}, lambda: completed.append("bad"))
+            dispatcher.submit({"id": "good"}, lambda: completed.append("good"))
+            dispatcher.stop()
+
+        self.assertEqual(completed, ["good"])
+
+    def test_on_done_waits_for_deferred_handlers(self):
+        """
+        Test that an event is completed when its deferred handler reports it done, not before.
+        """
+        dispatcher = EventDispatcher()
+        callbacks, completed = [], []
+        dispatcher.register(DEFAULT_EVENT_TYPE, lambda event: None)
+        dispatcher.register(DEFAULT_EVENT_TYPE, lambda event, on_done: callbacks.append(on_done), deferred=True)
+
+        dispatcher.dispatch({"id": "msg-1"}, lambda: completed.append("msg-1"))
+        self.assertEqual(completed, [])
+        callbacks[0]()
+        self.assertEqual(completed, ["msg-1"])
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            EventDispatcher(workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
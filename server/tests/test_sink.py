@@ -0,0 +1,134 @@
+import json
+import os
+import queue
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+
+from server.sink import BatchingSink, JsonlWriter, SqliteWriter, create_writer
+
+
+class RecordingWriter:
+    def __init__(self, block: threading.Event = None):
+        self.batches = []
+        self.closed = False
+        self.block = block
+
+    def write_batch(self, events):
+        if self.block is not None:
+            self.block.wait(5)
+        self.batches.append(list(events))
+
+    def close(self):
+        self.closed = True
+
+
+class TestBatchingSink(unittest.TestCase):
+    def test_batches_by_size(self):
+        """
+        Test that full batches are written as soon as they reach 'batch_size'.
+        """
+        writer = RecordingWriter()
+        sink = BatchingSink(writer, batch_size=3, max_latency=60)
+        for number in range(7):
+            sink.put({"id": str(number)})
+        sink.close()
+
+        self.assertEqual([len(batch) for batch in writer.batches], [3, 3, 1])
+        self.assertEqual(sink.events, 7)
+        self.assertTrue(writer.closed)
+
+    def test_flushes_after_max_latency(self):
+        writer = RecordingWriter()
+        sink = BatchingSink(writer, batch_size=100, max_latency=0.05)
+        self.addCleanup(sink.close)
+        sink.put({"id": "1"})
+
+        deadline = time.monotonic() + 5
+        while not writer.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(writer.batches, [[{"id": "1"}]])
+
+    def test_put_blocks_when_full(self):
+        """
+        Test backpressure: once the queue is full, put waits for the writer.
+        """
+        release = threading.Event()
+        writer = RecordingWriter(block=release)
+        sink = BatchingSink(writer, batch_size=1, max_latency=0, queue_size=1)
+        sink.put({"id": "1"})  # Taken by the flusher, which blocks in write_batch
+        time.sleep(0.05)
+        sink.put({"id": "2"})  # Fills the queue
+
+        with self.assertRaises(queue.Full):
+            sink.put({"id": "3"}, timeout=0.05)
+        release.set()
+        sink.close()
+        self.assertEqual(sink.events, 2)
+
+    def test_on_done_after_batch_written(self):
+        """
+        Test that events are completed once their batch is written, and never when the write fails.
+        """
+        class FailingWriter(RecordingWriter):
+            def write_batch(self, events):
+                if any(event["id"] == "bad" for event in events):
+                    raise OSError("disk full")
+                super().write_batch(events)
+
+        writer = FailingWriter()
+        sink = BatchingSink(writer, batch_size=1, max_latency=60)
+        completed = []
+        sink.put({"id": "good"}, on_done=lambda: completed.append("good"))
+        with self.assertLogs("server.sink", level="ERROR"):
+            sink.put({"id": "bad"}, on_done=lambda: completed.append("bad"))
+            sink.close()
+
+        self.assertEqual(writer.batches, [[{"id": "good"}]])
+        self.assertEqual(completed, ["good"])
+
+    def test_put_after_close_raises(self):
+        sink = BatchingSink(RecordingWriter())
+        sink.close()
+        with self.assertRaises(RuntimeError):
+            sink.put({"id": "1"})
+
+
+class TestWriters(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.events = [{"id": "msg-1", "status": "delivered", "deliveredAt": "2024-01-01T00:00:00Z"},
+                       {"id": "msg-2", "status": "failed"}]
+
+    def test_jsonl_writer(self):
+        path = os.path.join(self.directory, "events.jsonl")
+        writer = create_writer(path)
+        self.assertIsInstance(writer, JsonlWriter)
+        writer.write_batch(self.events)
+        writer.close()
+
+        with open(path, encoding="utf-8") as file:
+            self.assertEqual([json.loads(line) for line in file], self.events)
+
+    def test_sqlite_writer(self):
+        path = os.path.join(self.directory, "events.db")
+        writer = create_writer(path)
+        self.assertIsInstance(writer, SqliteWriter)
+        writer.write_batch(self.events)
+        writer.close()
+
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute("SELECT id, status, delivered_at FROM events ORDER BY id").fetchall()
+        self.assertEqual(rows, [("msg-1", "delivered", "2024-01-01T00:00:00Z"), ("msg-2", "failed", None)])
+
+    def test_unsupported_extension(self):
+        with self.assertRaises(ValueError):
+            create_writer(os.path.join(self.directory, "events.csv"))
+
+
+if __name__ == "__main__":
+    unittest.main()
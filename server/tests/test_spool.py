@@ -0,0 +1,135 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from server.spool import Spool, open_spool, read_segment
+
+
+class TestSpool(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def _spool(self, **kwargs):
+        spool = Spool(self.directory, **kwargs)
+        self.addCleanup(spool.close)
+        return spool
+
+    def test_unacked_records_are_replayed_by_next_process(self):
+        """
+        Test that records not acknowledged before close are replayed, in order, then removed.
+        """
+        spool = self._spool(fsync="always")
+        for number in range(3):
+            position = spool.append(f"event-{number}".encode())
+        spool.ack(position)  # Only the last of the three records was processed
+        spool.close()
+
+        replayed = []
+        reopened = self._spool()
+        self.assertEqual(reopened.replay(replayed.append), 2)
+        self.assertEqual(replayed, [b"event-0", b"event-1"])
+        self.assertEqual(reopened.replay(replayed.append), 0)
+        self.assertEqual(sorted(os.listdir(self.directory)), ["LOCK", "segment-000000000001.log"])
+
+    def test_acked_records_are_not_replayed_after_reopen(self):
+        """
+        Test that acknowledgements survive a restart, across segments, so only the
+        unprocessed records are replayed.
+        """
+        spool = self._spool(segment_size=40)  # Two records per segment
+        positions = [spool.append(f"event-{number}".encode()) for number in range(5)]
+        self.assertGreater(len(spool.segments()), 1)
+        for position in positions[:2] + positions[3:]:
+            spool.ack(position)
+        spool.close()
+
+        replayed = []
+        self.assertEqual(self._spool().replay(replayed.append), 1)
+        self.assertEqual(replayed, [b"event-2"])
+
+    def test_orphan_acks_do_not_apply_to_a_new_segment(self):
+        """
+        Test that an acks file left without its segment by a crash is removed at startup.
+        """
+        spool = self._spool()
+        spool.ack(spool.append(b"first"))
+        spool.close()
+        os.remove(os.path.join(self.directory, "LOCK"))
+        with open(os.path.join(self.directory, "segment-000000000000.acks"), "wb") as file:
+            file.write(b"\x00" * 8)  # Acknowledges offset 0
+
+        spool = self._spool()
+        spool.append(b"second")
+        spool.close()
+        replayed = []
+        self._spool().replay(replayed.append)
+        self.assertEqual(replayed, [b"second"])
+
+    def test_acked_segments_are_deleted_after_rotation(self):
+        spool = self._spool(segment_size=64)
+        positions = [spool.append(b"x" * 40) for _ in range(3)]
+        self.assertEqual([position.segment for position in positions], [0, 1, 2])
+
+        spool.ack(positions[0])
+        self.assertEqual(spool.segments(), [1, 2])
+        spool.ack(positions[2])  # Current segment is kept until rotated
+        self.assertEqual(spool.segments(), [1, 2])
+
+    def test_fully_acked_spool_leaves_nothing_to_replay(self):
+        spool = self._spool(fsync="interval", fsync_interval=0.01)
+        spool.ack(spool.append(b"event"))
+        spool.close()
+
+        self.assertEqual(self._spool().replay(lambda record: None), 0)
+
+    def test_group_commit_with_concurrent_appenders(self):
+        """
+        Test that concurrent appenders sharing fsyncs all get their records written.
+        """
+        spool = self._spool(fsync="group")
+
+        def append_many(worker):
+            for number in range(50):
+                spool.append(f"{worker}-{number}".encode())
+
+        threads = [threading.Thread(target=append_many, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        spool.close()
+
+        records = list(read_segment(os.path.join(self.directory, "segment-000000000000.log")))
+        self.assertEqual(len(records), 200)
+        self.assertEqual(len(set(records)), 200)
+
+    def test_torn_tail_is_ignored(self):
+        spool = self._spool()
+        spool.append(b"complete")
+        spool.close()
+        with open(os.path.join(self.directory, "segment-000000000000.log"), "ab") as file:
+            file.write(b"\x00\x00\x00\x10torn")
+
+        replayed = []
+        self._spool().replay(replayed.append)
+        self.assertEqual(replayed, [b"complete"])
+
+    def test_directory_locked_by_one_spool(self):
+        self._spool()
+        with self.assertRaises(RuntimeError):
+            Spool(self.directory)
+
+        other = open_spool(self.directory)
+        self.addCleanup(other.close)
+        self.assertNotEqual(other.directory, self.directory)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            Spool(self.directory, fsync="never")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+import yaml
+
+from sdk.api_client import APIClient
+from sdk.resources.contacts import Contacts
+from sdk.resources.messages import Messages
+from sdk.utils.signature import verify_signature
+from server.stub_api_server import Faults, StubAPI, StubAPIServer
+
+
+class _WebhookRecorder(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append((body, self.headers["Authorization"]))
+        self.server.event.set()
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _SlowWebhookReceiver(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.barrier.wait(5)  # Only passes once two callbacks are posted at the same time
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestStubAPIServer(unittest.TestCase):
+    def setUp(self):
+        self.api = StubAPI(api_key="stubKey", delivery_delay=0.01)
+        self.server = StubAPIServer(self.api).start()
+        self.addCleanup(self.server.stop)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as file:
+            yaml.safe_dump({"api_key": "stubKey", "base_url": self.server.url, "retry": {"backoff_base": 0.01}}, file)
+        self.addCleanup(os.unlink, file.name)
+        self.client = APIClient(config_path=file.name)
+        self.addCleanup(self.client.close)
+        self.contacts = Contacts(self.client)
+        self.messages = Messages(self.client, webhook_secret="mySecret")
+
+    def test_contacts_crud(self):
+        contact = self.contacts.create_contact("Alice", "+14155552671")
+        self.assertEqual(self.contacts.get_contact(contact["id"]), contact)
+
+        updated = self.contacts.update_contact(contact["id"], name="Alice B")
+        self.assertEqual(updated["name"], "Alice B")
+
+        self.contacts.delete_contact(contact["id"])
+        with self.assertRaises(requests.HTTPError) as error:
+            self.client.request("GET", f"contacts/{contact['id']}")
+        self.assertEqual(error.exception.response.status_code, 404)
+
+    def test_unauthorized_and_invalid_requests(self):
+        response = requests.get(f"{self.server.url}/contacts", headers={"Authorization": "Bearer wrong"})
+        self.assertEqual(response.status_code, 401)
+        self.assertIn("message", response.json())
+
+        with self.assertRaises(requests.HTTPError) as error:
+            self.client.request("POST", "contacts", json={"name": "Bob"})
+        self.assertEqual(error.exception.response.status_code, 400)
+        self.assertIn("error", error.exception.response.json())
+
+    def test_pagination_follows_the_schema(self):
+        self.api.add_contacts(25)
+
+        page = self.contacts.list_contacts(page=3, limit=10)
+        self.assertEqual((page["pageNumber"], page["pageSize"], len(page["contacts"])), (3, 10, 5))
+        self.assertEqual(len(list(self.contacts.iter_contacts(limit=10))), 25)
+
+        self.api.faults = Faults(max_page_size=4)
+        page = self.contacts.list_contacts(page=1, limit=10)
+        self.assertEqual((page["pageSize"], len(page["contacts"])), (4, 4))
+
+    def test_capped_page_size_expects_every_contact_listed(self):
+        ids = set(self.api.add_contacts(300))
+        self.api.faults = Faults(max_page_size=50)
+
+        self.assertEqual({contact["id"] for contact in self.contacts.iter_contacts(limit=100)}, ids)
+        self.assertEqual(len(list(self.contacts.iter_contacts(limit=100, prefetch=True))), 300)
+
+        exported = []
+        total = self.contacts.export_contacts(lambda page, contacts: exported.extend(contacts), limit=100)
+        self.assertEqual((total, {contact["id"] for contact in exported}), (300, ids))
+
+    def test_messages_are_delivered(self):
+        contact = self.contacts.create_contact("Alice", "+14155552671")
+        message = self.messages.send_message(contact["id"], "Hello", "+14155550000")
+        self.assertEqual(message["status"], "queued")
+        self.assertEqual(message["to"], contact)
+
+        inline = self.messages.send_message_to_number("Bob", "+14155552672", "Hi", "+14155550000")
+        self.assertEqual(inline["to"]["name"], "Bob")
+
+        listing = self.messages.list_messages(page=1, limit=1)
+        self.assertEqual((listing["page"], listing["quantityPerPage"], len(listing["messages"])), (1, 1, 1))
+
+        for _ in range(200):
+            if self.messages.get_message(message["id"])["status"] == "delivered":
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(self.messages.get_message(message["id"])["status"], "delivered")
+
+    def test_injected_throttling_is_retried(self):
+        self.api.faults = Faults(throttle_rate=0.5, retry_after=0)
+
+        with self.assertLogs(level="WARNING"):
+            for _ in range(10):
+                self.client.request("GET", "contacts")
+        self.assertGreater(self.api.requests, 10)
+
+    def test_injected_errors(self):
+        self.api.faults = Faults(error_rate=1.0)
+        response = requests.get(f"{self.server.url}/contacts", headers={"Authorization": "Bearer stubKey"})
+        self.assertEqual(response.status_code, 500)
+
+        self.api.faults = Faults(rate_limit=1, retry_after=2)
+        headers = {"Authorization": "Bearer stubKey"}
+        statuses = [requests.get(f"{self.server.url}/contacts", headers=headers) for _ in range(3)]
+        self.assertEqual(statuses[0].status_code, 200)
+        self.assertEqual(statuses[-1].status_code, 429)
+        self.assertEqual(statuses[-1].headers["Retry-After"], "2")
+
+    def test_delivery_webhooks_are_signed(self):
+        receiver = ThreadingHTTPServer(("127.0.0.1", 0), _WebhookRecorder)
+        receiver.received, receiver.event = [], threading.Event()
+        threading.Thread(target=receiver.serve_forever, daemon=True).start()
+        self.addCleanup(receiver.server_close)
+        self.addCleanup(receiver.shutdown)
+        self.api.webhook_url = f"http://127.0.0.1:{receiver.server_port}/webhooks"
+
+        message = self.messages.send_message_to_number("Bob", "+14155552672", "Hi", "+14155550000")
+        self.assertTrue(receiver.event.wait(5))
+
+        body, authorization = receiver.received[0]
+        self.assertEqual(json.loads(body)["id"], message["id"])
+        self.assertEqual(json.loads(body)["status"], "delivered")
+        self.assertTrue(verify_signature(body, authorization[len("Signature "):], "mySecret"))
+
+    def test_delivery_webhooks_are_posted_concurrently(self):
+        receiver = ThreadingHTTPServer(("127.0.0.1", 0), _SlowWebhookReceiver)
+        receiver.barrier = threading.Barrier(2)
+        threading.Thread(target=receiver.serve_forever, daemon=True).start()
+        self.addCleanup(receiver.server_close)
+        self.addCleanup(receiver.shutdown)
+        self.api.webhook_url = f"http://127.0.0.1:{receiver.server_port}/webhooks"
+
+        for number in range(2):
+            self.messages.send_message_to_number("Bob", f"+1415555267{number}", "Hi", "+14155550000")
+        deadline = time.monotonic() + 10
+        while self.api.webhooks_sent < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.api.webhooks_sent, 2)
+        self.assertFalse(receiver.barrier.broken)
+
+    def test_listing_after_delete_expects_remaining_contacts_in_order(self):
+        ids = self.api.add_contacts(25)
+        self.contacts.delete_contact(ids[3])
+
+        listed = [contact["id"] for contact in self.contacts.iter_contacts(limit=10)]
+        self.assertEqual(listed, ids[:3] + ids[4:])
+
+
+if __name__ == "__main__":
+    unittest.main()
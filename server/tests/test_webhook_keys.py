@@ -0,0 +1,58 @@
+import hashlib
+import hmac
+import os
+import tempfile
+import unittest
+
+from server.webhook_keys import WebhookKeys
+
+
+def sign(body: bytes, secret: str) -> str:
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+class TestWebhookKeys(unittest.TestCase):
+    def setUp(self):
+        self.body = b'{"id": "msg-1", "status": "delivered"}'
+        self.now = 0.0
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "secrets")
+
+    def _write(self, *secrets, mtime):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("# current first\n" + "\n".join(secrets) + "\n")
+        os.utime(self.path, ns=(mtime, mtime))
+
+    def test_default_secrets_without_file(self):
+        keys = WebhookKeys(["mySecret"])
+        self.assertEqual(keys.verify(self.body, sign(self.body, "mySecret")), keys.keyring.fingerprint("mySecret"))
+
+    def test_file_is_reloaded_after_interval(self):
+        """
+        Test that a rotated secrets file is picked up without a restart, once the interval elapsed.
+        """
+        self._write("oldSecret", mtime=1)
+        keys = WebhookKeys(["unused"], secrets_file=self.path, reload_interval=5, clock=lambda: self.now)
+        self.assertIsNotNone(keys.verify(self.body, sign(self.body, "oldSecret")))
+
+        self._write("newSecret", "oldSecret", mtime=2)
+        self.assertIsNone(keys.verify(self.body, sign(self.body, "newSecret")))  # Not checked yet
+
+        self.now = 10.0
+        self.assertEqual(keys.verify(self.body, sign(self.body, "newSecret")), keys.keyring.fingerprint("newSecret"))
+        self.assertEqual(keys.verify(self.body, sign(self.body, "oldSecret")), keys.keyring.fingerprint("oldSecret"))
+        self.assertEqual(keys.acceptance_counts(), {keys.keyring.fingerprint("newSecret"): 1, keys.keyring.fingerprint("oldSecret"): 2})
+
+    def test_reload_keeps_active_secrets_on_error(self):
+        self._write("oldSecret", mtime=1)
+        keys = WebhookKeys(["unused"], secrets_file=self.path)
+        os.remove(self.path)
+
+        with self.assertLogs("server.webhook_keys", level="ERROR"):
+            keys.reload()
+        self.assertIsNotNone(keys.verify(self.body, sign(self.body, "oldSecret")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,18 @@
+import os
+import sqlite3
+import tempfile
 import unittest
-from unittest.mock import patch
+import urllib.request
+from unittest.mock import Mock, patch
 import json
 import hmac
 import hashlib
-from server.webhook_server import app
+from server.webhook_server import app, serve_in_background
+from sdk.delivery import DeliveryTracker
+from server.webhook_core import WEBHOOK_SECRET, log_delivery_event, replay_spool
+from server.dedup import InMemoryDedupStore
+from server.dispatcher import DEFAULT_EVENT_TYPE, EventDispatcher
+from server.spool import Spool
 
 def verify_signature(message: str, provided_signature: str, secret: str) -> bool:
     """
@@ -27,6 +36,9 @@ class TestWebhookHandler(unittest.TestCase):
         """
         self.client = app.test_client()
         self.client.testing = True
+        dedup_patcher = patch("server.webhook_server.dedup", InMemoryDedupStore())
+        dedup_patcher.start()
+        self.addCleanup(dedup_patcher.stop)
     @patch("sdk.utils.signature.verify_signature")
     def test_handle_webhook_expects_invalid_signature(self, mock_verify_signature):
         """
@@ -69,5 +81,314 @@ class TestWebhookHandler(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.get_json(), {"error": "Missing Authorization header"})
 
+    def _signed_post(self, body: str):
+        signature = hmac.new(WEBHOOK_SECRET.encode(), body.encode(), hashlib.sha256).hexdigest()
+        return self.client.post(
+            "/webhooks",
+            data=body,
+            content_type="application/json",
+            headers={"Authorization": f"Signature {signature}"}
+        )
+
+    @patch("server.webhook_server.dispatcher")
+    def test_handle_webhook_expects_event_queued(self, mock_dispatcher):
+        """
+        Test that a valid webhook is handed to the dispatcher and acknowledged.
+        """
+        mock_dispatcher.submit.return_value = True
+        payload = {"id": "msg-1", "status": "delivered", "deliveredAt": "2024-01-01T00:00:00Z"}
+
+        response = self._signed_post(json.dumps(payload))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"status": "received"})
+        mock_dispatcher.submit.assert_called_once_with(payload, None)
+
+    @patch("server.webhook_server.dispatcher")
+    def test_handle_webhook_expects_duplicate_acknowledged_once(self, mock_dispatcher):
+        """
+        Test that a retried callback is acknowledged without being queued again.
+        """
+        mock_dispatcher.submit.return_value = True
+        body = json.dumps({"id": "msg-1", "status": "delivered"})
+
+        first = self._signed_post(body)
+        second = self._signed_post(body)
+        failed = self._signed_post(json.dumps({"id": "msg-1", "status": "failed"}))
+
+        self.assertEqual(first.get_json(), {"status": "received"})
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.get_json(), {"status": "duplicate"})
+        self.assertEqual(failed.get_json(), {"status": "received"})
+        self.assertEqual(mock_dispatcher.submit.call_count, 2)
+
+    @patch("server.webhook_server.dispatcher")
+    def test_handle_webhook_expects_retry_accepted_after_queue_full(self, mock_dispatcher):
+        """
+        Test that an event rejected because the queue was full is processed when retried.
+        """
+        mock_dispatcher.submit.side_effect = [False, True]
+        body = json.dumps({"id": "msg-1", "status": "delivered"})
+
+        self.assertEqual(self._signed_post(body).status_code, 503)
+        self.assertEqual(self._signed_post(body).get_json(), {"status": "received"})
+
+    @patch("server.webhook_server.dispatcher")
+    def test_handle_webhook_expects_503_when_queue_full(self, mock_dispatcher):
+        """
+        Test that the webhook is rejected with Retry-After when the queue is full.
+        """
+        mock_dispatcher.submit.return_value = False
+
+        response = self._signed_post(json.dumps({"id": "msg-1", "status": "delivered"}))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.get_json(), {"error": "Webhook queue is full"})
+        self.assertIn("Retry-After", response.headers)
+
+    def test_handle_webhook_expects_invalid_json(self):
+        """
+        Test that a correctly signed but malformed body is rejected.
+        """
+        response = self._signed_post("not json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {"error": "Invalid JSON payload"})
+
+    @patch("server.webhook_server.dispatcher")
+    def test_handle_webhook_expects_event_spooled_before_ack(self, mock_dispatcher):
+        """
+        Test that an accepted event is in the spool until its handlers are done.
+        """
+        mock_dispatcher.submit.return_value = True
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        spool = Spool(directory.name, fsync="always")
+        body = json.dumps({"id": "msg-1", "status": "delivered"})
+
+        with patch("server.webhook_server.spool", spool):
+            response = self._signed_post(body)
+        spool.close()
+
+        self.assertEqual(response.status_code, 200)
+        replayed = []
+        Spool(directory.name).replay(replayed.append)
+        self.assertEqual(replayed, [body.encode()])
+
+        # Once the handlers have run, the completion callback releases the record
+        spool = Spool(os.path.join(directory.name, "done"), fsync="always")
+        with patch("server.webhook_server.spool", spool):
+            self._signed_post(json.dumps({"id": "msg-2", "status": "delivered"}))
+        on_done = mock_dispatcher.submit.call_args[0][1]
+        on_done()
+        spool.close()
+        self.assertEqual(Spool(os.path.join(directory.name, "done")).replay(replayed.append), 0)
+
+    @patch("server.webhook_server.dispatcher")
+    def test_handle_webhook_expects_retry_accepted_after_spool_error(self, mock_dispatcher):
+        """
+        Test that an event whose spool append failed is processed when retried, not acknowledged as a duplicate.
+        """
+        mock_dispatcher.submit.return_value = True
+        failing_spool = Mock()
+        failing_spool.append.side_effect = OSError("No space left on device")
+        body = json.dumps({"id": "msg-1", "status": "delivered"})
+
+        with patch("server.webhook_server.spool", failing_spool):
+            self.assertEqual(self._signed_post(body).status_code, 500)
+        self.assertEqual(self._signed_post(body).get_json(), {"status": "received"})
+        mock_dispatcher.submit.assert_called_once()
+
+    @patch("server.webhook_server.dispatcher")
+    def test_handle_webhook_expects_key_recorded_after_spool_append(self, mock_dispatcher):
+        """
+        Test that the dedup key is only recorded once the event is spooled, so a crash in between leaves it retryable.
+        """
+        mock_dispatcher.submit.return_value = True
+        calls = Mock()
+        calls.dedup.add.return_value = True
+
+        with patch("server.webhook_server.spool", calls.spool), patch("server.webhook_server.dedup", calls.dedup):
+            self._signed_post(json.dumps({"id": "msg-1", "status": "delivered"}))
+
+        self.assertEqual([call[0] for call in calls.mock_calls], ["spool.append", "dedup.add"])
+
+    @patch("server.webhook_server.dispatcher")
+    def test_handle_webhook_expects_duplicate_not_left_in_spool(self, mock_dispatcher):
+        """
+        Test that the spooled copy of a duplicate is released, so it is not replayed.
+        """
+        mock_dispatcher.submit.return_value = True
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        spool = Spool(directory.name, fsync="always")
+        body = json.dumps({"id": "msg-1", "status": "delivered"})
+
+        with patch("server.webhook_server.spool", spool):
+            self._signed_post(body)
+            mock_dispatcher.submit.call_args[0][1]()  # The first copy is processed
+            self.assertEqual(self._signed_post(body).get_json(), {"status": "duplicate"})
+        spool.close()
+
+        self.assertEqual(Spool(directory.name).replay(lambda record: None), 0)
+
+    @patch("server.webhook_server.dispatcher")
+    def test_handle_webhook_expects_dedup_error_leaves_nothing_recorded(self, mock_dispatcher):
+        """
+        Test that an event whose dedup check failed is neither replayed nor recorded, so its retry is processed.
+        """
+        mock_dispatcher.submit.return_value = True
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        spool = Spool(directory.name, fsync="always")
+        dedup = InMemoryDedupStore()
+        body = json.dumps({"id": "msg-1", "status": "delivered"})
+
+        with patch("server.webhook_server.spool", spool), patch("server.webhook_server.dedup", dedup):
+            with patch.object(dedup, "add", side_effect=sqlite3.OperationalError("database is locked")):
+                self.assertEqual(self._signed_post(body).status_code, 500)
+            mock_dispatcher.submit.assert_not_called()
+            self.assertEqual(self._signed_post(body).get_json(), {"status": "received"})
+            mock_dispatcher.submit.call_args[0][1]()
+        spool.close()
+
+        self.assertEqual(Spool(directory.name).replay(lambda record: None), 0)
+
+    def test_handle_webhook_expects_non_utf8_body_rejected(self):
+        """
+        Test that a body that is not UTF-8 fails verification instead of raising.
+        """
+        response = self.client.post(
+            "/webhooks",
+            data=b"\xff\xfe",
+            content_type="application/json",
+            headers={"Authorization": "Signature " + "0" * 64}
+        )
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.get_json(), {"error": "Invalid signature"})
+
+    @patch("server.webhook_core.WEBHOOK_ADMIN_TOKEN", "adminToken")
+    def test_webhook_keys_expects_acceptance_counts(self):
+        """
+        Test that the keys endpoint reports the active keys of this process without exposing them.
+        """
+        response = self.client.get("/webhooks/keys", headers={"Authorization": "Bearer adminToken"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["worker"], os.getpid())
+        keys = response.get_json()["keys"]
+        self.assertEqual(len(keys), 1)
+        self.assertNotEqual(keys[0]["fingerprint"], hashlib.sha256(WEBHOOK_SECRET.encode()).hexdigest()[:8])
+
+    @patch("server.webhook_core.WEBHOOK_ADMIN_TOKEN", "adminToken")
+    def test_webhook_keys_expects_admin_token(self):
+        """
+        Test that the keys endpoint refuses requests without the admin token.
+        """
+        self.assertEqual(self.client.get("/webhooks/keys").status_code, 401)
+        response = self.client.get("/webhooks/keys", headers={"Authorization": "Bearer wrongToken"})
+        self.assertEqual(response.status_code, 401)
+
+    @patch("server.webhook_core.WEBHOOK_ADMIN_TOKEN", None)
+    def test_webhook_keys_expects_disabled_without_admin_token(self):
+        """
+        Test that the keys endpoint is not served when no admin token is configured.
+        """
+        self.assertEqual(self.client.get("/webhooks/keys").status_code, 404)
+
+
+class TestReplaySpool(unittest.TestCase):
+    def test_replayed_events_are_recorded_as_processed(self):
+        """
+        Test that replayed events are handled once and that the sender's retries after the restart are duplicates.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        spool = Spool(directory.name)
+        for event in ({"id": "msg-1", "status": "delivered"}, {"id": "msg-1", "status": "delivered"},
+                      {"id": "msg-2", "status": "failed"}):
+            spool.append(json.dumps(event).encode())
+        spool.close()
+
+        dispatcher, dedup = Mock(), InMemoryDedupStore()
+        spool = Spool(directory.name)
+        self.addCleanup(spool.close)
+        replay_spool(spool, dispatcher, dedup)
+
+        self.assertEqual([call[0][0]["id"] for call in dispatcher.dispatch.call_args_list], ["msg-1", "msg-2"])
+        self.assertFalse(dedup.add("msg-1:delivered"))
+        self.assertFalse(dedup.add("msg-2:failed"))
+
+    def test_replayed_events_stay_spooled_until_processed(self):
+        """
+        Test that a replayed event whose handler fails is replayed again by the next process.
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        spool = Spool(directory.name)
+        spool.append(json.dumps({"id": "msg-1", "status": "delivered"}).encode())
+        spool.close()
+
+        def failing_handler(event):
+            raise RuntimeError("boom")
+
+        dispatcher = EventDispatcher()
+        dispatcher.register(DEFAULT_EVENT_TYPE, failing_handler)
+        spool = Spool(directory.name)
+        with self.assertLogs("server.dispatcher", level="ERROR"):
+            replay_spool(spool, dispatcher)
+        spool.close()
+
+        replayed = []
+        Spool(directory.name).replay(replayed.append)
+        self.assertEqual([json.loads(record)["id"] for record in replayed], ["msg-1"])
+
+
+class TestServeInBackground(unittest.TestCase):
+    def test_webhooks_reach_an_attached_delivery_tracker(self):
+        """
+        Test that a tracker attached to the dispatcher is resolved by a webhook, without polling.
+        """
+        messages = Mock()
+        tracker = DeliveryTracker(messages, webhook_timeout=60)
+        self.addCleanup(tracker.close)
+        dispatcher = EventDispatcher()
+        tracker.attach(dispatcher)
+        body = json.dumps({"id": "msg-1", "status": "delivered"}).encode()
+        signature = hmac.new(WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+        with patch("server.webhook_server.dispatcher", dispatcher), \
+                patch("server.webhook_server.dedup", InMemoryDedupStore()), \
+                patch("server.webhook_server.spool", None), patch("server.webhook_server.sink", None):
+            server = serve_in_background(port=0)
+            try:
+                delivery = tracker.track("msg-1")
+                urllib.request.urlopen(urllib.request.Request(
+                    f"http://127.0.0.1:{server.port}/webhooks", data=body,
+                    headers={"Content-Type": "application/json", "Authorization": f"Signature {signature}"}
+                ), timeout=5).close()
+                self.assertEqual(delivery.result(5)["status"], "delivered")
+            finally:
+                server.stop()
+        messages.get_message.assert_not_called()
+
+
+class TestLogDeliveryEvent(unittest.TestCase):
+    def test_log_delivery_event_expects_summary_without_payload(self):
+        """
+        Test that delivery events are logged as id and status, the payload only at DEBUG level.
+        """
+        event = {"id": "msg-1", "status": "delivered", "content": "x" * 10000}
+        with self.assertLogs("server.webhook_core", level="INFO") as logs:
+            log_delivery_event(event)
+        self.assertEqual(logs.output, ["INFO:server.webhook_core:Webhook received for message msg-1: delivered"])
+        self.assertEqual(logs.records[0].message_id, "msg-1")
+
+        with self.assertLogs("server.webhook_core", level="DEBUG") as logs:
+            log_delivery_event(event)
+        self.assertLess(len(logs.records[1].getMessage()), 1000)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,276 @@
+import hmac
+import logging
+import os
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
+
+from server.dedup import InMemoryDedupStore, SqliteDedupStore, dedup_key
+from server.dispatcher import DEFAULT_EVENT_TYPE, EventDispatcher
+from server.sink import BatchingSink, create_writer
+from server.spool import Spool, open_spool
+from server.webhook_keys import WebhookKeys
+from sdk.utils.codec import loads
+from sdk.utils.log import Truncated, configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Environment variables, shared by the Flask and ASGI servers
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "mySecret")
+# Comma-separated active secrets, current first; takes precedence over WEBHOOK_SECRET
+WEBHOOK_SECRETS = [secret for secret in os.getenv("WEBHOOK_SECRETS", "").split(",") if secret]
+# File with one secret per line, re-read when it changes; takes precedence over both
+WEBHOOK_SECRETS_FILE = os.getenv("WEBHOOK_SECRETS_FILE")
+WEBHOOK_SECRETS_RELOAD_INTERVAL = float(os.getenv("WEBHOOK_SECRETS_RELOAD_INTERVAL", "5"))
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "3010"))
+WEBHOOK_WORKERS = int(os.getenv("WEBHOOK_WORKERS", "4"))
+WEBHOOK_QUEUE_SIZE = int(os.getenv("WEBHOOK_QUEUE_SIZE", "1000"))
+# Retried callbacks seen within WEBHOOK_DEDUP_TTL seconds are acknowledged but not processed again;
+# WEBHOOK_DEDUP_DB keeps them in a SQLite file shared by worker processes and across restarts
+WEBHOOK_DEDUP_DB = os.getenv("WEBHOOK_DEDUP_DB")
+WEBHOOK_DEDUP_TTL = float(os.getenv("WEBHOOK_DEDUP_TTL", "86400"))
+WEBHOOK_DEDUP_SIZE = int(os.getenv("WEBHOOK_DEDUP_SIZE", "100000"))
+# Delivery events are also written in batches to WEBHOOK_SINK (.jsonl or SQLite .db file) when set
+WEBHOOK_SINK = os.getenv("WEBHOOK_SINK")
+WEBHOOK_SINK_BATCH_SIZE = int(os.getenv("WEBHOOK_SINK_BATCH_SIZE", "500"))
+WEBHOOK_SINK_MAX_LATENCY = float(os.getenv("WEBHOOK_SINK_MAX_LATENCY", "0.5"))
+# Accepted events are appended to a write-ahead spool in WEBHOOK_SPOOL_DIR before the 200 is sent,
+# and replayed at startup if the process stopped before handling them
+WEBHOOK_SPOOL_DIR = os.getenv("WEBHOOK_SPOOL_DIR")
+WEBHOOK_SPOOL_FSYNC = os.getenv("WEBHOOK_SPOOL_FSYNC", "group")
+WEBHOOK_SPOOL_SEGMENT_BYTES = int(os.getenv("WEBHOOK_SPOOL_SEGMENT_BYTES", str(64 * 1024 * 1024)))
+WEBHOOK_SPOOL_FSYNC_INTERVAL = float(os.getenv("WEBHOOK_SPOOL_FSYNC_INTERVAL", "0.05"))
+# Bearer token required by GET /webhooks/keys; the endpoint is disabled when it is not set
+WEBHOOK_ADMIN_TOKEN = os.getenv("WEBHOOK_ADMIN_TOKEN")
+# Seconds a sender is asked to wait before retrying when the queue is full
+WEBHOOK_RETRY_AFTER = os.getenv("WEBHOOK_RETRY_AFTER", "1")
+# Logs go through a bounded queue to a background thread; LOG_FORMAT=json writes one JSON object
+# per line, and LOG_SAMPLE_RATE keeps that fraction of the INFO and DEBUG records
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1"))
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+WebhookResponse = Tuple[int, Dict[str, Any], Dict[str, str]]
+
+
+def log_delivery_event(event_data: Dict[str, Any]) -> None:
+    """
+    Default handler for message delivery events: one line with the message id and status,
+    and the (truncated) event itself at DEBUG level.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        fields = event_data if isinstance(event_data, dict) else {}
+        message_id, status = fields.get("id"), fields.get("status")
+        logger.info("Webhook received for message %s: %s", message_id, status,
+                    extra={"message_id": message_id, "delivery_status": status})
+    logger.debug("Webhook event: %s", Truncated(event_data))
+
+
+def setup_logging():
+    """
+    Configure the logging of a server process from the environment (see :func:`sdk.utils.log.configure_logging`).
+
+    :return: The queue listener, to stop at shutdown so queued records are written.
+    """
+    return configure_logging(
+        LOG_LEVEL, structured=LOG_FORMAT == "json", sample_rate=LOG_SAMPLE_RATE, queue_size=LOG_QUEUE_SIZE
+    )
+
+
+def create_sink() -> Optional[BatchingSink]:
+    """
+    Create the batching sink of a server process from the environment, if one is configured.
+    """
+    if not WEBHOOK_SINK:
+        return None
+    return BatchingSink(
+        create_writer(WEBHOOK_SINK), batch_size=WEBHOOK_SINK_BATCH_SIZE, max_latency=WEBHOOK_SINK_MAX_LATENCY
+    )
+
+
+def create_dispatcher(sink: Optional[BatchingSink] = None) -> EventDispatcher:
+    """
+    Create the event dispatcher of a server process, with the default delivery handler registered.
+
+    :param sink: (Optional) Sink receiving every delivery event as well.
+    """
+    dispatcher = EventDispatcher(workers=WEBHOOK_WORKERS, queue_size=WEBHOOK_QUEUE_SIZE)
+    dispatcher.register(DEFAULT_EVENT_TYPE, log_delivery_event)
+    if sink is not None:
+        dispatcher.register(DEFAULT_EVENT_TYPE, sink.put, deferred=True)
+    return dispatcher
+
+
+def create_spool() -> Optional[Spool]:
+    """
+    Open the write-ahead spool of a server process from the environment, if one is configured.
+    """
+    if not WEBHOOK_SPOOL_DIR:
+        return None
+    return open_spool(
+        WEBHOOK_SPOOL_DIR,
+        fsync=WEBHOOK_SPOOL_FSYNC,
+        segment_size=WEBHOOK_SPOOL_SEGMENT_BYTES,
+        fsync_interval=WEBHOOK_SPOOL_FSYNC_INTERVAL
+    )
+
+
+def replay_spool(spool: Optional[Spool], dispatcher: EventDispatcher, dedup: Optional[Any] = None) -> None:
+    """
+    Run the handlers of the events a previous process accepted but did not finish processing.
+
+    Each replayed event is appended to the spool again and acknowledged like a new one, since
+    the segment it came from is deleted once replayed. Replayed events are recorded in
+    ``dedup``, so a retry the sender makes after the restart is acknowledged as a duplicate
+    instead of being processed a second time; an event spooled more than once is replayed once.
+
+    :param dedup: (Optional) Store of processed events, as passed to :func:`process_webhook`.
+    """
+    if spool is None:
+        return
+    replayed = set()
+    skipped = 0
+
+    def handle(record: bytes) -> None:
+        nonlocal skipped
+        event_data = loads(record)
+        key = dedup_key(event_data) if dedup is not None else None
+        if key is not None:
+            if key in replayed:
+                skipped += 1
+                return
+            replayed.add(key)
+            dedup.add(key)  # Already there if the store outlived the previous process
+        dispatcher.dispatch(event_data, partial(spool.ack, spool.append(record)))
+
+    count = spool.replay(handle) - skipped
+    if count or skipped:
+        logger.info("Replayed %d spooled webhook events, skipped %d duplicates", count, skipped)
+
+
+def shutdown(dispatcher: EventDispatcher, sink: Optional[BatchingSink] = None, spool: Optional[Spool] = None) -> None:
+    """
+    Process the queued events, then flush them from the sink and close the spool.
+    """
+    dispatcher.stop()
+    if sink is not None:
+        sink.close()
+    if spool is not None:
+        spool.close()
+
+
+def create_keys() -> WebhookKeys:
+    """
+    Create the webhook secrets of a server process from the environment.
+    """
+    return WebhookKeys(
+        WEBHOOK_SECRETS or [WEBHOOK_SECRET],
+        secrets_file=WEBHOOK_SECRETS_FILE,
+        reload_interval=WEBHOOK_SECRETS_RELOAD_INTERVAL
+    )
+
+
+def create_dedup_store():
+    """
+    Create the store of already processed events from the environment.
+    """
+    if WEBHOOK_DEDUP_DB:
+        return SqliteDedupStore(WEBHOOK_DEDUP_DB, ttl=WEBHOOK_DEDUP_TTL)
+    return InMemoryDedupStore(maxsize=WEBHOOK_DEDUP_SIZE, ttl=WEBHOOK_DEDUP_TTL)
+
+
+def process_webhook(
+        raw_body: bytes,
+        authorization: str,
+        keys: WebhookKeys,
+        dispatcher: EventDispatcher,
+        dedup: Optional[Any] = None,
+        spool: Optional[Spool] = None
+) -> WebhookResponse:
+    """
+    Framework-independent handling of a webhook request: validate the HMAC signature and
+    queue the event for the dispatcher's workers.
+
+    :param raw_body: The request body, exactly as received.
+    :param authorization: The value of the `Authorization` header ("Signature <hex digest>").
+    :param keys: The active secrets the webhook messages may be signed with.
+    :param dispatcher: The dispatcher receiving valid events.
+    :param dedup: (Optional) Store of processed events; duplicates are acknowledged without being queued.
+    :param spool: (Optional) Write-ahead spool the raw event is appended to before it is acknowledged.
+    :return: A ``(status code, JSON body, extra headers)`` tuple.
+    """
+    auth_header = authorization.replace("Signature ", "")
+
+    if not auth_header:
+        logger.error("Missing Authorization header")
+        return 400, {"error": "Missing Authorization header"}, {}
+
+    # Verify the raw bytes; the body is only decoded once the signature checks out
+    if keys.verify(raw_body, auth_header) is None:
+        logger.error("Invalid signature")
+        return 401, {"error": "Invalid signature"}, {}
+
+    try:
+        event_data = loads(raw_body)
+    except ValueError:  # Includes bodies that are not valid UTF-8
+        logger.error("Invalid JSON payload")
+        return 400, {"error": "Invalid JSON payload"}, {}
+
+    # Spool first: the key is only recorded once the event is durable, so a crash or an error
+    # in between never leaves a key for an event the sender will retry but nobody processes
+    on_done = None
+    if spool is not None:
+        on_done = partial(spool.ack, spool.append(raw_body))
+
+    key = dedup_key(event_data) if dedup is not None else None
+    added = accepted = False
+    try:
+        if key is not None:
+            added = dedup.add(key)
+            if not added:
+                logger.info("Duplicate webhook %s acknowledged without processing", key)
+                return 200, {"status": "duplicate"}, {}
+        # Hand the event over and acknowledge right away; shed load when the workers fall behind
+        accepted = dispatcher.submit(event_data, on_done)
+    finally:
+        if not accepted:
+            # Duplicate, refused or failed: nothing to replay, and a refused event will be retried
+            if on_done is not None:
+                on_done()
+            if added:
+                dedup.discard(key)
+
+    if not accepted:
+        logger.warning("Webhook queue is full, rejecting event")
+        return 503, {"error": "Webhook queue is full"}, {"Retry-After": WEBHOOK_RETRY_AFTER}
+
+    return 200, {"status": "received"}, {}
+
+
+def keys_status(keys: WebhookKeys) -> Dict[str, Any]:
+    """
+    Acceptance count of each active key of this process, by fingerprint, current key first.
+
+    Counters and fingerprints are per process: with several worker processes, each request
+    is answered by one of them (identified by ``worker``, its pid) and covers only its share.
+    """
+    return {"worker": os.getpid(),
+            "keys": [{"fingerprint": fingerprint, "accepted": count}
+                     for fingerprint, count in keys.acceptance_counts().items()]}
+
+
+def process_keys_request(authorization: str, keys: WebhookKeys) -> WebhookResponse:
+    """
+    Framework-independent handling of ``GET /webhooks/keys``, which needs the
+    ``WEBHOOK_ADMIN_TOKEN`` as a bearer token and is not served when none is configured.
+
+    :param authorization: The value of the `Authorization` header ("Bearer <token>").
+    :param keys: The active secrets of this process.
+    :return: A ``(status code, JSON body, extra headers)`` tuple.
+    """
+    if not WEBHOOK_ADMIN_TOKEN:
+        return 404, {"error": "Not found"}, {}
+    token = authorization[len("Bearer "):] if authorization.startswith("Bearer ") else ""
+    if not hmac.compare_digest(token.encode("utf-8"), WEBHOOK_ADMIN_TOKEN.encode("utf-8")):
+        return 401, {"error": "Invalid token"}, {"WWW-Authenticate": "Bearer"}
+    return 200, keys_status(keys), {}
@@ -0,0 +1,95 @@
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sdk.utils.signature import Buffer, KeyRing
+
+logger = logging.getLogger(__name__)
+
+
+def read_secrets_file(path: str) -> List[str]:
+    """
+    Read one secret per line, the current one first; blank lines and ``#`` comments are ignored.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip() and not line.lstrip().startswith("#")]
+
+
+class WebhookKeys:
+    """
+    The set of webhook secrets a server process accepts, reloadable without a restart.
+
+    Secrets come from ``secrets_file`` when given, otherwise from ``default_secrets``. The
+    file is checked for changes at most every ``reload_interval`` seconds, on the request
+    path, so rotating means: add the new secret on the first line, keep the old one below
+    it until its acceptance count stops growing, then remove it. :meth:`reload` can also be
+    called directly, e.g. from a SIGHUP handler.
+    """
+
+    def __init__(
+            self,
+            default_secrets: Sequence[str],
+            secrets_file: Optional[str] = None,
+            reload_interval: float = 5.0,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        :param default_secrets: Secrets used when there is no secrets file, the current one first.
+        :param secrets_file: (Optional) Path of a file with one secret per line.
+        :param reload_interval: Minimum number of seconds between two checks of the file.
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+        self.default_secrets = list(default_secrets)
+        self.secrets_file = secrets_file
+        self.reload_interval = reload_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._checked_at = clock()
+        self.keyring = KeyRing(self._load())
+
+    def _load(self) -> List[str]:
+        if self.secrets_file:
+            self._mtime = os.stat(self.secrets_file).st_mtime_ns
+            secrets = read_secrets_file(self.secrets_file)
+            if secrets:
+                return secrets
+            logger.warning("Secrets file %s is empty, using the default secrets", self.secrets_file)
+        return self.default_secrets
+
+    def reload(self) -> None:
+        """
+        Re-read the secrets; on error the active secrets are kept.
+        """
+        with self._lock:
+            try:
+                self.keyring.replace(self._load())
+            except (OSError, ValueError) as e:
+                logger.error("Could not reload webhook secrets: %s", e)
+                return
+        logger.info("Webhook secrets reloaded, active keys: %s", self.keyring.fingerprints)
+
+    def _maybe_reload(self) -> None:
+        now = self._clock()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+        try:
+            changed = os.stat(self.secrets_file).st_mtime_ns != self._mtime
+        except OSError:
+            return
+        if changed:
+            self.reload()
+
+    def verify(self, message: Buffer, provided_signature: str) -> Optional[str]:
+        """
+        :return: The fingerprint of the active key that signed ``message``, or None.
+        """
+        if self.secrets_file:
+            self._maybe_reload()
+        return self.keyring.verify(message, provided_signature)
+
+    def acceptance_counts(self) -> Dict[str, int]:
+        return self.keyring.acceptance_counts()
@@ -1,46 +1,95 @@
 from flask import Flask, request, jsonify
 import logging
-import os
-import json
-from sdk.utils.signature import verify_signature
+import signal
+import threading
+from werkzeug.serving import make_server
+from server.webhook_core import (
+    WEBHOOK_PORT, create_dedup_store, create_dispatcher, create_keys, create_sink, create_spool,
+    process_keys_request, process_webhook, replay_spool, setup_logging, shutdown
+)
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 # Flask app
 app = Flask(__name__)
 
-# Environment variables
-WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "mySecret")
+# Events are processed by worker threads after the request has been acknowledged,
+# and written in batches to the sink when one is configured
+sink = create_sink()
+dispatcher = create_dispatcher(sink)
+# Active webhook secrets, reloadable at runtime
+keys = create_keys()
+# Events already processed, so retried callbacks are not handled twice
+dedup = create_dedup_store()
+# Accepted events are spooled to disk before being acknowledged, when configured
+spool = create_spool()
 
 
 @app.route("/webhooks", methods=["POST"])
 def handle_webhook():
     """
     Handle incoming webhook events.
-    Validates the HMAC signature and processes the event.
+    Validates the HMAC signature and queues the event for the dispatcher's workers.
+    Returns 503 with a Retry-After header when the queue is full.
     """
-    # Raw request body and headers
-    raw_body = request.data.decode("utf-8")
-    auth_header = request.headers.get("Authorization", "").replace("Signature ", "")
+    status, body, headers = process_webhook(
+        request.get_data(), request.headers.get("Authorization", ""), keys, dispatcher, dedup, spool
+    )
+    return jsonify(body), status, headers
 
-    if not auth_header:
-        logger.error("Missing Authorization header")
-        return jsonify({"error": "Missing Authorization header"}), 400
 
-    # Verify the webhook signature
-    if not verify_signature(raw_body, auth_header, WEBHOOK_SECRET):
-        logger.error("Invalid signature")
-        return jsonify({"error": "Invalid signature"}), 401
+@app.route("/webhooks/keys", methods=["GET"])
+def webhook_keys():
+    """
+    Report how many webhooks each active secret accepted, to know when an old one can be retired.
+    """
+    status, body, headers = process_keys_request(request.headers.get("Authorization", ""), keys)
+    return jsonify(body), status, headers
+
+
+class BackgroundServer:
+    """
+    The webhook endpoint served from a daemon thread, see :func:`serve_in_background`.
+    """
 
-    # Log and process the event payload
-    logger.info(f"Valid webhook received: {raw_body}")
-    event_data = json.loads(raw_body)
+    def __init__(self, http_server) -> None:
+        self._http_server = http_server
+        self.port = http_server.port
+        self._thread = threading.Thread(target=http_server.serve_forever, name="webhook-http", daemon=True)
+        self._thread.start()
 
-    print("Webhook Event:", event_data)
+    def stop(self) -> None:
+        """
+        Stop accepting webhooks, then process the queued events and close the spool.
+        """
+        self._http_server.shutdown()
+        self._thread.join()
+        shutdown(dispatcher, sink, spool)
+
+
+def serve_in_background(host: str = "127.0.0.1", port: int = WEBHOOK_PORT) -> BackgroundServer:
+    """
+    Serve the webhook endpoint from a thread of the calling process, so the handlers the
+    application registers on :data:`dispatcher` get its events, e.g. a
+    :class:`sdk.delivery.DeliveryTracker` attached with ``tracker.attach(dispatcher)``.
+    Register the handlers first: spooled events are replayed here.
+
+    :param port: Port to listen on; 0 picks a free one, available as ``port`` on the result.
+    """
+    replay_spool(spool, dispatcher, dedup)
+    dispatcher.start()
+    return BackgroundServer(make_server(host, port, app, threaded=True))
 
-    return jsonify({"status": "received"}), 200
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=3010)
+    # Logging is configured from LOG_LEVEL, LOG_FORMAT and LOG_SAMPLE_RATE
+    log_listener = setup_logging()
+    # kill -HUP <pid> re-reads the webhook secrets
+    signal.signal(signal.SIGHUP, lambda signum, frame: keys.reload())
+    replay_spool(spool, dispatcher, dedup)
+    dispatcher.start()
+    try:
+        app.run(host="0.0.0.0", port=WEBHOOK_PORT, threaded=True)
+    finally:
+        shutdown(dispatcher, sink, spool)
+        log_listener.stop()
@@ -11,5 +11,9 @@ setup(
         "pyyaml>=6.0",
         "Flask>=2.2.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8.0"],
+        "fast": ["orjson>=3.6.0"],
+    },
     python_requires=">=3.7",  # Minimum Python version
 )
@@ -8,6 +8,15 @@ class TestAPIClient(unittest.TestCase):
         Set up a test instance of APIClient.
         """
         self.client = APIClient(config_path="tests/config_test/test_config.yaml")
+        self.addCleanup(self.client.close)
+
+    def _patch_session_request(self):
+        """
+        Patches the pooled session so no real HTTP request is sent.
+        """
+        patcher = patch.object(self.client.session, "request")
+        self.addCleanup(patcher.stop)
+        return patcher.start()
 
     @patch("sdk.api_client.Config")
     def test_api_client_init_expects_correct_config_values(self, MockConfig):
@@ -34,14 +43,14 @@ class TestAPIClient(unittest.TestCase):
         self.client.api_key = "test_api_key"
         self.assertEqual(self.client._get_headers(), expected_headers)
 
-    @patch("sdk.api_client.requests.request")
-    def test_get_request_expects_successful_response(self, mock_request):
+    def test_get_request_expects_successful_response(self):
         """
         Test a successful GET request.
         """
+        mock_request = self._patch_session_request()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"key": "value"}
+        mock_response.content = b'{"key": "value"}'
         mock_request.return_value = mock_response
 
         response = self.client.request("GET", "test_endpoint")
@@ -51,15 +60,15 @@ class TestAPIClient(unittest.TestCase):
             f"{self.client.base_url}/test_endpoint",
             headers=self.client._get_headers(),
             params=None,
-            json=None,
+            data=None,
             timeout=self.client.timeout
         )
 
-    @patch("sdk.api_client.requests.request")
-    def test_delete_request_expects_successful_response(self, mock_request):
+    def test_delete_request_expects_successful_response(self):
         """
         Test a successful DELETE request with 204 response (No response)
         """
+        mock_request = self._patch_session_request()
         mock_response = Mock()
         mock_response.status_code = 204
         mock_request.return_value = mock_response
@@ -71,9 +80,50 @@ class TestAPIClient(unittest.TestCase):
             f"{self.client.base_url}/test_endpoint",
             headers=self.client._get_headers(),
             params=None,
-            json=None,
+            data=None,
             timeout=self.client.timeout
         )
 
+    def test_requests_reuse_the_same_pooled_session(self):
+        """
+        Test that consecutive requests go through one keep-alive session.
+        """
+        mock_request = self._patch_session_request()
+        mock_request.return_value = Mock(status_code=200, content=b"{}")
+
+        session = self.client.session
+        self.client.request("GET", "contacts")
+        self.client.request("GET", "messages")
+
+        self.assertIs(self.client.session, session)
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_pool_settings_expect_values_from_config(self):
+        """
+        Test that the HTTP adapter is sized from the pool configuration.
+        """
+        adapter = self.client.session.get_adapter(self.client.base_url)
+        self.assertEqual(adapter._pool_connections, self.client.config.pool_connections)
+        self.assertEqual(adapter._pool_maxsize, self.client.config.pool_maxsize)
+
+    def test_idle_pool_expects_connections_recycled(self):
+        """
+        Test that a pool idle past the keep-alive timeout is closed before reuse.
+        """
+        self.client.keepalive_timeout = 5
+        self.client._last_used -= 10
+        with patch.object(self.client.session, "close") as mock_close:
+            self.client._get_session()
+            mock_close.assert_called_once()
+
+    def test_context_manager_expects_session_closed(self):
+        """
+        Test that leaving the context manager closes the pooled connections.
+        """
+        with patch("sdk.api_client.requests.Session.close") as mock_close:
+            with APIClient(config_path="tests/config_test/test_config.yaml"):
+                mock_close.assert_not_called()
+            mock_close.assert_called_once()
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,263 @@
+import asyncio
+import os
+import tempfile
+import unittest
+import uuid
+
+import aiohttp
+import yaml
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sdk.async_api_client import AsyncAPIClient
+from sdk.instrumentation import MetricsObserver
+from sdk.resources.contacts import AsyncContacts
+from sdk.resources.messages import AsyncMessages
+
+
+def create_stub_app():
+    """
+    Builds a minimal in-memory stub of the /contacts and /messages endpoints.
+    :return: The application and the set of client ports that connected to it.
+    """
+    contacts = {}
+    messages = {}
+    connections = set()
+    app = web.Application()
+
+    @web.middleware
+    async def track_connections(request, handler):
+        # Remember the client port of every request to check connection reuse
+        connections.add(request.transport.get_extra_info("peername")[1])
+        if request.headers.get("Authorization") != "Bearer test_api_key":
+            return web.json_response({"message": "Unauthorized"}, status=401)
+        return await handler(request)
+
+    async def create_contact(request):
+        contact = dict(await request.json(), id=str(uuid.uuid4()))
+        contacts[contact["id"]] = contact
+        return web.json_response(contact, status=201)
+
+    async def list_contacts(request):
+        return web.json_response({"contacts": list(contacts.values()), "pageNumber": 1, "pageSize": 10})
+
+    async def get_contact(request):
+        contact = contacts.get(request.match_info["id"])
+        if contact is None:
+            return web.json_response({"message": "Contact not found"}, status=404)
+        return web.json_response(contact)
+
+    async def update_contact(request):
+        contact = contacts[request.match_info["id"]]
+        contact.update(await request.json())
+        return web.json_response(contact)
+
+    async def delete_contact(request):
+        contacts.pop(request.match_info["id"])
+        return web.Response(status=204)
+
+    async def send_message(request):
+        body = await request.json()
+        message = {
+            "to": contacts[body["to"]["id"]],
+            "from": body["from"],
+            "content": body["content"],
+            "id": str(uuid.uuid4()),
+            "status": "queued",
+            "createdAt": "2024-01-01T12:00:00Z",
+            "deliveredAt": None,
+        }
+        messages[message["id"]] = message
+        return web.json_response(message, status=201)
+
+    async def list_messages(request):
+        page = int(request.query.get("page", 1))
+        limit = int(request.query.get("limit", 100))
+        records = list(messages.values())[(page - 1) * limit:page * limit]
+        return web.json_response({"messages": records, "page": page, "quantityPerPage": limit})
+
+    async def get_message(request):
+        return web.json_response(messages[request.match_info["id"]])
+
+    flaky_calls = {}
+
+    async def flaky(request):
+        # Answers 503 until it has been called 'failures' times on this path
+        calls = flaky_calls[request.path] = flaky_calls.get(request.path, 0) + 1
+        if calls <= int(request.match_info["failures"]):
+            return web.json_response({"message": "Unavailable"}, status=503, headers={"Retry-After": "0"})
+        return web.json_response({"calls": calls})
+
+    app.middlewares.append(track_connections)
+    app.router.add_post("/contacts", create_contact)
+    app.router.add_get("/contacts", list_contacts)
+    app.router.add_get("/contacts/{id}", get_contact)
+    app.router.add_patch("/contacts/{id}", update_contact)
+    app.router.add_delete("/contacts/{id}", delete_contact)
+    app.router.add_post("/messages", send_message)
+    app.router.add_get("/messages", list_messages)
+    app.router.add_get("/messages/{id}", get_message)
+    app.router.add_route("*", "/flaky/{failures}", flaky)
+    return app, connections
+
+
+class TestAsyncAPIClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """
+        Start the stub server and point an AsyncAPIClient at it.
+        """
+        self.app, self.connections = create_stub_app()
+        self.server = TestServer(self.app)
+        await self.server.start_server()
+
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as file:
+            yaml.safe_dump({
+                "api_key": "test_api_key",
+                "base_url": str(self.server.make_url("")).rstrip("/"),
+                "pool": {"maxsize": 4},
+            }, file)
+        self.addCleanup(os.unlink, file.name)
+
+        self.client = AsyncAPIClient(config_path=file.name)
+        self.contacts = AsyncContacts(self.client)
+        self.messages = AsyncMessages(self.client)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def test_contact_lifecycle_expects_successful_deletion(self):
+        """
+        Test creating, getting, updating and deleting a contact asynchronously.
+        """
+        created = await self.contacts.create_contact(name="Jane Doe", phone="+14155552671")
+        contact_id = created["id"]
+
+        fetched = await self.contacts.get_contact(contact_id)
+        self.assertEqual(fetched["phone"], "+14155552671")
+
+        updated = await self.contacts.update_contact(contact_id, name="Jane Smith")
+        self.assertEqual(updated["name"], "Jane Smith")
+
+        listed = await self.contacts.list_contacts()
+        self.assertEqual([contact["id"] for contact in listed["contacts"]], [contact_id])
+
+        self.assertIsNone(await self.contacts.delete_contact(contact_id))
+
+    async def test_send_message_expects_message_listed_and_retrievable(self):
+        """
+        Test sending a message and reading it back asynchronously.
+        """
+        bob = await self.contacts.create_contact(name="Bob", phone="+34612345678")
+        message = await self.messages.send_message(
+            recipient_id=bob["id"], content="Hello!", sender_phone="+14155552671"
+        )
+        self.assertEqual(message["status"], "queued")
+
+        fetched = await self.messages.get_message(message["id"])
+        self.assertEqual(fetched["content"], "Hello!")
+
+        listed = await self.messages.list_messages()
+        self.assertEqual(len(listed["messages"]), 1)
+
+    async def test_send_many_expects_result_for_every_message(self):
+        """
+        Test bulk sending over the shared pool, with a failing message in the batch.
+        """
+        bob = await self.contacts.create_contact(name="Bob", phone="+34612345678")
+        batch = [
+            {"recipient_id": bob["id"], "content": f"Hello {i}", "sender_phone": "+14155552671"}
+            for i in range(20)
+        ]
+        batch[7]["content"] = ""
+
+        results = [result async for result in self.messages.send_many(batch, concurrency=8)]
+        self.assertEqual(sorted(result.index for result in results), list(range(20)))
+        self.assertEqual([result.index for result in results if not result.ok], [7])
+        self.assertLessEqual(len(self.connections), 4)
+
+    async def test_iter_messages_expects_every_page_walked(self):
+        """
+        Test async iteration over several pages of messages, with prefetch.
+        """
+        bob = await self.contacts.create_contact(name="Bob", phone="+34612345678")
+        batch = [{"recipient_id": bob["id"], "content": f"Hello {i}", "sender_phone": "+14155552671"} for i in range(7)]
+        sent = [result.result["id"] async for result in self.messages.send_many(batch, ordered=True)]
+
+        listed = [message["id"] async for message in self.messages.iter_messages(limit=3, prefetch=True)]
+        self.assertEqual(listed, sent)
+
+    async def test_concurrent_requests_expect_pooled_connections(self):
+        """
+        Test that many concurrent requests share at most 'maxsize' connections.
+        """
+        await asyncio.gather(*(self.contacts.list_contacts() for _ in range(50)))
+        self.assertLessEqual(len(self.connections), 4)
+
+    async def test_observers_expect_templated_events(self):
+        """
+        Test that observers see every attempt, with the endpoint's IDs templated.
+        """
+        metrics = MetricsObserver()
+        self.client.add_observer(metrics)
+
+        created = await self.contacts.create_contact(name="Jane Doe", phone="+14155552671")
+        await self.contacts.get_contact(created["id"])
+        with self.assertLogs(level="WARNING"):
+            await self.client.request("GET", "flaky/1")
+
+        requests = {(row["method"], row["endpoint"], row["status"]): row["count"]
+                    for row in metrics.snapshot()["requests"]}
+        self.assertEqual(requests, {
+            ("POST", "contacts", 201): 1,
+            ("GET", "contacts/{id}", 200): 1,
+            ("GET", "flaky/{id}", 503): 1,
+            ("GET", "flaky/{id}", 200): 1,
+        })
+        latency = {(row["method"], row["endpoint"]): row for row in metrics.snapshot()["latency"]}
+        self.assertEqual(latency[("POST", "contacts")]["bytes_sent"], len(b'{"name":"Jane Doe","phone":"+14155552671"}'))
+
+    async def test_retryable_status_expects_retry(self):
+        """
+        Test that a GET answered with 503 is retried, honoring Retry-After.
+        """
+        with self.assertLogs(level="WARNING"):
+            response = await self.client.request("GET", "flaky/2")
+        self.assertEqual(response, {"calls": 3})
+
+    async def test_post_expects_no_retry_on_server_error(self):
+        """
+        Test that a POST is not resent after a 503 unless the caller opts in.
+        """
+        with self.assertRaises(aiohttp.ClientResponseError):
+            await self.client.request("POST", "flaky/1", json={})
+
+        with self.assertLogs(level="WARNING"):
+            response = await self.client.request("POST", "flaky/2", json={}, idempotent=True)
+        self.assertEqual(response, {"calls": 3})
+
+    async def test_http_error_expects_exception(self):
+        """
+        Test that a 404 from the API is raised to the caller.
+        """
+        with self.assertRaises(aiohttp.ClientResponseError) as context:
+            await self.contacts.get_contact("missing")
+        self.assertEqual(context.exception.status, 404)
+
+    async def test_validation_expects_value_error_before_request(self):
+        """
+        Test that the async resources share the validation of their sync counterparts.
+        """
+        with self.assertRaises(ValueError):
+            await self.contacts.create_contact(name="Jane", phone="12345")
+        with self.assertRaises(ValueError):
+            await self.contacts.update_contact("123")
+        with self.assertRaises(ValueError):
+            await self.messages.send_message(recipient_id="", content="Hello!", sender_phone="+14155552672")
+        with self.assertRaises(ValueError):
+            await self.messages.list_messages(page=0)
+        self.assertEqual(self.connections, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+import unittest
+from sdk.utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a small cache driven by a fake clock.
+        """
+        self.clock = FakeClock()
+        self.cache = TTLCache(maxsize=2, ttl=10, clock=self.clock)
+
+    def test_get_or_load_expects_loader_called_once(self):
+        """
+        Test that the second lookup is a hit.
+        """
+        calls = []
+        loader = lambda: calls.append(1) or {"id": "1"}
+        self.assertEqual(self.cache.get_or_load("1", loader), {"id": "1"})
+        self.assertEqual(self.cache.get_or_load("1", loader), {"id": "1"})
+        self.assertEqual(len(calls), 1)
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.hit_rate), (1, 1, 0.5))
+
+    def test_get_expects_expired_entry_reloaded(self):
+        """
+        Test that entries expire after the TTL.
+        """
+        self.cache.set("1", "old")
+        self.clock.now = 11
+        self.assertIsNone(self.cache.get("1"))
+        self.assertEqual(self.cache.stats().expirations, 1)
+
+    def test_set_expects_least_recently_used_evicted(self):
+        """
+        Test that exceeding maxsize evicts the least recently used entry.
+        """
+        self.cache.set("1", "a")
+        self.cache.set("2", "b")
+        self.cache.get("1")
+        self.cache.set("3", "c")
+        self.assertIsNone(self.cache.get("2"))
+        self.assertEqual(self.cache.get("1"), "a")
+        self.assertEqual(self.cache.stats().evictions, 1)
+
+    def test_get_or_load_expects_errors_not_cached(self):
+        """
+        Test that a failing load is retried on the next lookup.
+        """
+        def failing():
+            raise RuntimeError("404")
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_load("1", failing)
+        self.assertEqual(self.cache.get_or_load("1", lambda: "ok"), "ok")
+
+    def test_get_or_load_expects_concurrent_misses_share_one_load(self):
+        """
+        Test that threads missing on the same key wait for a single loader call.
+        """
+        cache = TTLCache()
+        calls = []
+        started = threading.Event()
+
+        def slow_loader():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return "value"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("k", slow_loader)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["value"] * 8)
+        self.assertEqual(len(calls), 1)
+
+    def test_invalidate_expects_in_flight_load_not_stored(self):
+        """
+        Test that invalidating a key during its load keeps the stale result out of the cache.
+        """
+        def loader():
+            self.cache.invalidate("1")
+            return "stale"
+
+        self.assertEqual(self.cache.get_or_load("1", loader), "stale")
+        self.assertIsNone(self.cache.get("1"))
+
+
+class TestAsyncTTLCache(unittest.IsolatedAsyncioTestCase):
+    async def test_async_get_or_load_expects_concurrent_misses_share_one_load(self):
+        """
+        Test that tasks missing on the same key share one awaited load.
+        """
+        cache = TTLCache()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.async_get_or_load("k", loader) for _ in range(10)))
+        self.assertEqual(results, ["value"] * 10)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(await cache.async_get_or_load("k", loader), "value")
+        self.assertEqual(cache.stats().hits, 1)
+
+    async def test_async_get_or_load_expects_waiters_reload_when_loading_task_cancelled(self):
+        """
+        Test that cancelling the task running a shared load does not cancel the tasks waiting on it.
+        """
+        cache = TTLCache()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.05 if len(calls) == 1 else 0)
+            return "value"
+
+        owner = asyncio.ensure_future(cache.async_get_or_load("k", loader))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(cache.async_get_or_load("k", loader)) for _ in range(3)]
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        self.assertEqual(await asyncio.gather(*waiters), ["value"] * 3)
+        self.assertTrue(owner.cancelled())
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from sdk.utils import codec
+from sdk.utils.codec import OrjsonCodec, StdlibCodec, create_codec, headers_with_content_type
+
+
+def _available_codecs():
+    codecs = [StdlibCodec()]
+    if codec.orjson is not None:
+        codecs.append(OrjsonCodec())
+    return codecs
+
+
+class TestCodecs(unittest.TestCase):
+    def test_round_trip_from_bytes(self):
+        value = {"name": "Zoë", "phones": ["+33612345678"], "count": 3, "ratio": 0.5, "ok": True, "none": None}
+        for json_codec in _available_codecs():
+            with self.subTest(json_codec.name):
+                encoded = json_codec.dumps(value)
+                self.assertIsInstance(encoded, bytes)
+                self.assertIn("Zoë".encode("utf-8"), encoded)
+                self.assertEqual(json_codec.loads(encoded), value)
+                self.assertEqual(json_codec.loads(memoryview(encoded)), value)
+                self.assertEqual(json_codec.loads(encoded.decode("utf-8")), value)
+
+    def test_codecs_produce_the_same_output(self):
+        value = {"id": "m1", "status": "delivered", 1: [1.25, None]}
+        self.assertEqual(len({json_codec.dumps(value) for json_codec in _available_codecs()}), 1)
+
+    def test_errors_match_the_standard_library(self):
+        for json_codec in _available_codecs():
+            with self.subTest(json_codec.name):
+                for invalid in (b"{", b"\xff\xfe{}", b""):
+                    with self.assertRaises(ValueError):
+                        json_codec.loads(invalid)
+                with self.assertRaises(TypeError):
+                    json_codec.dumps({"value": object()})
+
+    def test_stdlib_codec_rejects_non_finite_floats(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with self.subTest(value), self.assertRaises(ValueError):
+                StdlibCodec().dumps({"ratio": value})
+
+
+class TestCodecSelection(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(codec.set_codec, codec.get_codec())
+
+    def test_fastest_codec_by_default(self):
+        expected = "orjson" if codec.orjson is not None else "json"
+        with patch.dict(os.environ):
+            os.environ.pop("SDK_JSON_CODEC", None)
+            self.assertEqual(create_codec().name, expected)
+
+    def test_set_codec_by_name(self):
+        codec.set_codec("json")
+        self.assertIsInstance(codec.get_codec(), StdlibCodec)
+        self.assertEqual(codec.loads(codec.dumps([1, "a"])), [1, "a"])
+
+    def test_unknown_codec_is_rejected(self):
+        with self.assertRaises(ValueError):
+            create_codec("simplejson")
+
+
+class TestHeadersWithContentType(unittest.TestCase):
+    def test_content_type_added_only_when_missing(self):
+        self.assertEqual(headers_with_content_type(None), {"Content-Type": "application/json"})
+        headers = {"content-type": "application/merge-patch+json"}
+        self.assertIs(headers_with_content_type(headers), headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+import unittest
+from sdk.utils.concurrency import async_bounded_map, bounded_map
+
+
+class TestBoundedMap(unittest.TestCase):
+    def test_bounded_map_expects_concurrency_limit_respected(self):
+        """
+        Test that no more than 'concurrency' calls run at the same time.
+        """
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work(item):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.005)
+            with lock:
+                state["running"] -= 1
+            return item * 2
+
+        results = list(bounded_map(work, range(40), concurrency=4))
+        self.assertEqual(sorted(result.result for result in results), [i * 2 for i in range(40)])
+        self.assertLessEqual(state["peak"], 4)
+
+    def test_bounded_map_expects_input_order_when_ordered(self):
+        """
+        Test that ordered mode yields results in input order even if they complete out of order.
+        """
+        def work(item):
+            time.sleep(0.001 * (10 - item))
+            return item
+
+        results = list(bounded_map(work, range(10), concurrency=5, ordered=True))
+        self.assertEqual([result.index for result in results], list(range(10)))
+
+    def test_bounded_map_expects_failures_reported_per_item(self):
+        """
+        Test that one failing item does not stop the batch.
+        """
+        def work(item):
+            if item == 3:
+                raise ValueError("bad item")
+            return item
+
+        results = list(bounded_map(work, range(6), concurrency=2, ordered=True))
+        self.assertEqual([result.ok for result in results], [True, True, True, False, True, True])
+        self.assertIsInstance(results[3].error, ValueError)
+
+    def test_bounded_map_expects_lazy_consumption(self):
+        """
+        Test that the input is pulled only as calls finish, not all at once.
+        """
+        pulled = []
+
+        def source():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+
+        iterator = bounded_map(lambda item: item, source(), concurrency=3)
+        next(iterator)
+        self.assertLessEqual(len(pulled), 4)
+        iterator.close()
+
+    def test_bounded_map_expects_value_error_for_invalid_concurrency(self):
+        """
+        Test that a non-positive concurrency is rejected when called, before iterating.
+        """
+        with self.assertRaises(ValueError):
+            bounded_map(lambda item: item, [1], concurrency=0)
+        with self.assertRaises(ValueError):
+            async_bounded_map(lambda item: item, [1], concurrency=0)
+
+
+class TestAsyncBoundedMap(unittest.IsolatedAsyncioTestCase):
+    async def test_async_bounded_map_expects_concurrency_limit_and_order(self):
+        """
+        Test the async variant keeps the in-flight limit and input order.
+        """
+        state = {"running": 0, "peak": 0}
+
+        async def work(item):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.001 * (item % 3))
+            state["running"] -= 1
+            if item == 5:
+                raise RuntimeError("boom")
+            return item
+
+        results = [result async for result in async_bounded_map(work, range(20), concurrency=4, ordered=True)]
+        self.assertEqual([result.index for result in results], list(range(20)))
+        self.assertFalse(results[5].ok)
+        self.assertLessEqual(state["peak"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -45,6 +45,38 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.base_url, "http://localhost:3000")
         self.assertEqual(config.timeout, 20)
 
+    def test_config_loads_expects_pool_settings(self):
+        """
+        Test if the Config class reads the connection pool section, with defaults for missing keys.
+        """
+        self.config_data["pool"] = {"maxsize": 32, "keepalive_timeout": 5}
+
+        with open(self.config_path, "w") as file:
+            yaml.dump(self.config_data, file)
+
+        config = Config(config_path=self.config_path)
+        self.assertEqual(config.pool_maxsize, 32)
+        self.assertEqual(config.keepalive_timeout, 5)
+        self.assertEqual(config.pool_connections, 10)
+        self.assertFalse(config.pool_block)
+
+    def test_config_loads_expects_retry_and_rate_limit_sections(self):
+        """
+        Test if the Config class passes the retry and rate limit sections through, empty when missing.
+        """
+        config = Config(config_path=self.config_path)
+        self.assertEqual(config.retry, {})
+        self.assertEqual(config.rate_limit, {})
+
+        self.config_data["retry"] = {"max_attempts": 5}
+        self.config_data["rate_limit"] = {"endpoints": {"messages": {"rate": 10}}}
+        with open(self.config_path, "w") as file:
+            yaml.dump(self.config_data, file)
+
+        config = Config(config_path=self.config_path)
+        self.assertEqual(config.retry, {"max_attempts": 5})
+        self.assertEqual(config.rate_limit["endpoints"]["messages"], {"rate": 10})
+
     def test_missing_api_key_raises_value_error(self):
         """
         Test if a missing API key raises a ValueError.
@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+from sdk.contact_import import ContactImporter, SqlitePhoneIndex, read_contact_rows
+from sdk.resources.contacts import Contacts
+
+
+class TestContactImport(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a temporary directory, a CSV input and Contacts over a mock client.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.csv_path = os.path.join(self.directory.name, "contacts.csv")
+        self.report_path = os.path.join(self.directory.name, "report.jsonl")
+        with open(self.csv_path, "w") as file:
+            file.write("name,phone\n")
+            file.write("Alice,+14155552671\n")
+            file.write("Bob,+34612345678\n")
+            file.write("Alice again,+1 415-555-2671\n")
+            file.write("Nobody,12345\n")
+            file.write("Carol,+442071838750\n")
+
+        self.mock_client = Mock()
+        self.mock_client.request.side_effect = lambda method, endpoint, json: dict(json, id=f"id-{json['phone']}")
+        self.contacts = Contacts(self.mock_client)
+
+    def read_report(self):
+        with open(self.report_path) as file:
+            return [json.loads(line) for line in file]
+
+    def test_run_expects_duplicates_and_invalid_rows_skipped(self):
+        """
+        Test that duplicates by E.164 and invalid phones are reported and not sent to the API.
+        """
+        summary = ContactImporter(self.contacts, self.report_path, concurrency=2).run(read_contact_rows(self.csv_path))
+
+        self.assertEqual((summary.created, summary.duplicates, summary.invalid, summary.failed), (3, 1, 1, 0))
+        self.assertEqual(self.mock_client.request.call_count, 3)
+        statuses = {entry["row"]: entry["status"] for entry in self.read_report()}
+        self.assertEqual(statuses, {1: "created", 2: "created", 3: "duplicate", 4: "invalid", 5: "created"})
+
+    def test_run_expects_missing_name_reported_invalid_and_not_retried(self):
+        """
+        Test that rows without a name are reported as invalid, so resuming does not retry them.
+        """
+        rows = [{"name": "", "phone": "+14155552671"}, {"phone": "+34612345678"}, {"name": "Carol", "phone": "+442071838750"}]
+        summary = ContactImporter(self.contacts, self.report_path).run(rows)
+
+        self.assertEqual((summary.created, summary.invalid, summary.failed), (1, 2, 0))
+        self.mock_client.request.assert_called_once_with(
+            "POST", "contacts", json={"name": "Carol", "phone": "+442071838750"}
+        )
+        summary = ContactImporter(self.contacts, self.report_path, resume=True).run(rows)
+        self.assertEqual((summary.resumed, self.mock_client.request.call_count), (3, 1))
+
+    def test_run_expects_failures_reported_and_retried_on_resume(self):
+        """
+        Test that a failed creation is reported, and only it is retried when resuming.
+        """
+        def flaky_request(method, endpoint, json):
+            if json["phone"] == "+34612345678":
+                raise RuntimeError("500 Server Error")
+            return dict(json, id=f"id-{json['phone']}")
+
+        self.mock_client.request.side_effect = flaky_request
+        summary = ContactImporter(self.contacts, self.report_path).run(read_contact_rows(self.csv_path))
+        self.assertEqual(summary.failed, 1)
+
+        self.mock_client.request.reset_mock(side_effect=True)
+        self.mock_client.request.side_effect = lambda method, endpoint, json: dict(json, id="id-bob")
+        summary = ContactImporter(self.contacts, self.report_path, resume=True).run(read_contact_rows(self.csv_path))
+
+        self.assertEqual((summary.created, summary.resumed), (1, 4))
+        self.mock_client.request.assert_called_once_with(
+            "POST", "contacts", json={"name": "Bob", "phone": "+34612345678"}
+        )
+        created = [entry["id"] for entry in self.read_report() if entry["status"] == "created"]
+        self.assertIn("id-bob", created)
+
+    def test_run_expects_sqlite_index_deduplicates_across_runs(self):
+        """
+        Test that the on-disk index remembers imported numbers between runs, even without resuming.
+        """
+        index_path = os.path.join(self.directory.name, "index.sqlite")
+        ContactImporter(self.contacts, self.report_path, index=SqlitePhoneIndex(index_path)).run(
+            read_contact_rows(self.csv_path)
+        )
+        summary = ContactImporter(self.contacts, self.report_path, index=SqlitePhoneIndex(index_path)).run(
+            [{"name": "Bob", "phone": "+34 612 34 56 78"}]
+        )
+        self.assertEqual((summary.created, summary.duplicates), (0, 1))
+        self.assertEqual(self.read_report(), [{"row": 1, "status": "duplicate", "phone": "+34612345678"}])
+
+    def test_run_expects_resume_after_crash_with_sqlite_index(self):
+        """
+        Test that a row in flight when the import crashed is created on resume, not reported as a duplicate.
+        """
+        class Crash(BaseException):
+            pass
+
+        def crashing_request(method, endpoint, json):
+            if json["name"] == "Carol":
+                raise Crash()
+            return dict(json, id=f"id-{json['phone']}")
+
+        index_path = os.path.join(self.directory.name, "index.sqlite")
+        self.mock_client.request.side_effect = crashing_request
+        with self.assertRaises(Crash):
+            ContactImporter(self.contacts, self.report_path, concurrency=1, index=SqlitePhoneIndex(index_path)).run(
+                read_contact_rows(self.csv_path)
+            )
+
+        self.mock_client.request.side_effect = lambda method, endpoint, json: dict(json, id=f"id-{json['phone']}")
+        summary = ContactImporter(
+            self.contacts, self.report_path, index=SqlitePhoneIndex(index_path), resume=True
+        ).run(read_contact_rows(self.csv_path))
+
+        self.assertEqual((summary.created, summary.duplicates, summary.resumed), (1, 0, 4))
+        statuses = {entry["row"]: entry["status"] for entry in self.read_report()}
+        self.assertEqual(statuses, {1: "created", 2: "created", 3: "duplicate", 4: "invalid", 5: "created"})
+
+    def test_read_contact_rows_expects_jsonl_supported(self):
+        """
+        Test reading JSON Lines input, and rejecting unknown extensions.
+        """
+        jsonl_path = os.path.join(self.directory.name, "contacts.jsonl")
+        with open(jsonl_path, "w") as file:
+            file.write('{"name": "Alice", "phone": "+14155552671"}\n\n')
+        self.assertEqual(list(read_contact_rows(jsonl_path)), [{"name": "Alice", "phone": "+14155552671"}])
+
+        with self.assertRaises(ValueError):
+            list(read_contact_rows(os.path.join(self.directory.name, "contacts.xlsx")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch,Mock
 from sdk.resources.contacts import Contacts
+from sdk.utils.cache import TTLCache
+from sdk.utils.phone import PhoneNumberCache
 
 
 class TestContacts(unittest.TestCase):
@@ -27,6 +29,23 @@ class TestContacts(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.contacts.validate_phone_number(invalid_phone)
 
+    def test_validate_phone_number_expects_cache_used(self):
+        """
+        Test that validation goes through the contacts' phone number cache.
+        """
+        contacts = Contacts(self.mock_client, default_region="ES", phone_cache=PhoneNumberCache())
+        self.assertEqual(contacts.validate_phone_number("612345678"), "+34612345678")
+        self.assertEqual(contacts.validate_phone_number("612345678"), "+34612345678")
+        self.assertEqual(contacts.phone_cache.cache_info().hits, 1)
+
+    def test_validate_phone_numbers_expects_results_in_input_order(self):
+        """
+        Test batch validation of phone numbers through Contacts.
+        """
+        results = list(self.contacts.validate_phone_numbers(["+14155552671", "12345"]))
+        self.assertEqual(results[0].result, "+14155552671")
+        self.assertFalse(results[1].ok)
+
     def test_create_contact_expects_value_error_for_missing_name(self):
         """
         Test creating a contact with missing name raises ValueError.
@@ -126,5 +145,83 @@ class TestContacts(unittest.TestCase):
         self.assertEqual(updated_contact["name"], "Jane Smith")
         self.assertEqual(updated_contact["phone"], "+34612345678")
 
+    def test_list_contacts_expects_spec_pagination_parameters(self):
+        """
+        Test that list_contacts sends the 'pageIndex' and 'max' query parameters from the spec.
+        """
+        self.mock_client.request.return_value = {"contacts": [], "pageNumber": 2, "pageSize": 5}
+
+        self.contacts.list_contacts(page=2, limit=5)
+        self.mock_client.request.assert_called_once_with(
+            "GET", "contacts", params={"pageIndex": 2, "max": 5}
+        )
+
+    def test_iter_contacts_expects_every_page_walked(self):
+        """
+        Test that iter_contacts yields contacts across pages and stops on a short page.
+        """
+        pages = {
+            1: [{"id": "1"}, {"id": "2"}],
+            2: [{"id": "3"}, {"id": "4"}],
+            3: [{"id": "5"}],
+        }
+        self.mock_client.request.side_effect = lambda method, endpoint, params: {
+            "contacts": pages[params["pageIndex"]], "pageNumber": params["pageIndex"], "pageSize": params["max"]
+        }
+
+        contact_ids = [contact["id"] for contact in self.contacts.iter_contacts(limit=2)]
+        self.assertEqual(contact_ids, ["1", "2", "3", "4", "5"])
+        self.assertEqual(self.mock_client.request.call_count, 3)
+
+    def test_get_contact_expects_cache_hit_and_invalidation(self):
+        """
+        Test that a cached contact is served without a request, refreshed by updates and dropped on delete.
+        """
+        contacts = Contacts(self.mock_client, cache=TTLCache())
+        contact_id = "b8704130-5be8-4b5f-ba71-8f4da96ef5a8"
+        self.mock_client.request.return_value = {"id": contact_id, "name": "Jane", "phone": "+34612345678"}
+
+        contacts.get_contact(contact_id)
+        contacts.get_contact(contact_id)
+        self.assertEqual(self.mock_client.request.call_count, 1)
+
+        self.mock_client.request.return_value = {"id": contact_id, "name": "Jane Smith", "phone": "+34612345678"}
+        contacts.update_contact(contact_id, name="Jane Smith")
+        self.assertEqual(contacts.get_contact(contact_id)["name"], "Jane Smith")
+        self.assertEqual(self.mock_client.request.call_count, 2)
+
+        self.mock_client.request.return_value = None
+        contacts.delete_contact(contact_id)
+        self.mock_client.request.return_value = {"id": contact_id, "name": "Jane Smith", "phone": "+34612345678"}
+        contacts.get_contact(contact_id)
+        self.assertEqual(self.mock_client.request.call_count, 4)
+
+    def test_warm_cache_expects_listed_contacts_cached(self):
+        """
+        Test that warming the cache from list_contacts avoids later GET requests.
+        """
+        contacts = Contacts(self.mock_client, cache=TTLCache())
+        self.mock_client.request.return_value = {
+            "contacts": [{"id": "1", "name": "Alice"}, {"id": "2", "name": "Bob"}], "pageNumber": 1, "pageSize": 100
+        }
+
+        self.assertEqual(contacts.warm_cache(), 2)
+        self.assertEqual(contacts.get_contact("2")["name"], "Bob")
+        self.assertEqual(self.mock_client.request.call_count, 1)
+
+    def test_cached_contact_expects_caller_changes_not_shared(self):
+        """
+        Test that changing a returned contact does not change the cached one.
+        """
+        contacts = Contacts(self.mock_client, default_region="ES", cache=TTLCache())
+        contact_id = "b8704130-5be8-4b5f-ba71-8f4da96ef5a8"
+        self.mock_client.request.return_value = {"id": contact_id, "name": "Jane", "phone": "+34612345678"}
+
+        contacts.create_contact("Jane", "+34612345678")["name"] = "Changed"
+        contacts.get_contact(contact_id)["name"] = "Changed again"
+        self.assertEqual(contacts.get_contact(contact_id)["name"], "Jane")
+        self.assertEqual(self.mock_client.request.call_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
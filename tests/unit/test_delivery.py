@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from sdk.delivery import DeliveryTracker
+
+
+class TestDeliveryTracker(unittest.TestCase):
+    def setUp(self):
+        self.messages = MagicMock()
+        self.delivered = {"id": "msg-1", "status": "delivered", "deliveredAt": "2024-01-01T00:00:00Z"}
+
+    def _tracker(self, **kwargs):
+        tracker = DeliveryTracker(self.messages, **kwargs)
+        self.addCleanup(tracker.close)
+        return tracker
+
+    def test_webhook_resolves_without_polling(self):
+        """
+        Test that a delivery webhook resolves the tracked message and no polling happens.
+        """
+        tracker = self._tracker(webhook_timeout=60)
+        future = tracker.track("msg-1")
+
+        tracker.handle_event({"id": "msg-1", "status": "queued"})  # Not final, ignored
+        self.assertFalse(future.done())
+        tracker.handle_event(self.delivered)
+
+        self.assertEqual(future.result(1), self.delivered)
+        self.messages.get_message.assert_not_called()
+
+    def test_webhook_arriving_before_track_is_matched(self):
+        tracker = self._tracker(webhook_timeout=60)
+        tracker.handle_event(self.delivered)
+
+        self.assertEqual(tracker.wait("msg-1", timeout=1), self.delivered)
+
+    def test_send_message_tracks_sent_id(self):
+        self.messages.send_message.return_value = {"id": "msg-1", "status": "queued"}
+        tracker = self._tracker(webhook_timeout=60)
+
+        message, future = tracker.send_message("contact-1", "Hello", "+14155552671")
+        self.assertIs(future, tracker.track("msg-1"))
+        tracker.handle_event(self.delivered)
+
+        self.assertEqual(message["status"], "queued")
+        self.assertEqual(future.result(1)["status"], "delivered")
+
+    def test_polls_with_backoff_when_no_webhook_arrives(self):
+        """
+        Test the polling fallback: polled until the message reaches a final status.
+        """
+        self.messages.get_message.side_effect = [
+            {"id": "msg-1", "status": "queued"},
+            RuntimeError("API error"),
+            {"id": "msg-1", "status": "failed"},
+        ]
+        tracker = self._tracker(webhook_timeout=0.01, poll_interval=0.01)
+
+        with self.assertLogs("sdk.delivery", level="WARNING"):
+            result = tracker.wait("msg-1", timeout=5)
+
+        self.assertEqual(result["status"], "failed")
+        self.assertEqual(self.messages.get_message.call_count, 3)
+
+    def test_polling_gives_up_after_poll_timeout(self):
+        self.messages.get_message.return_value = {"id": "msg-1", "status": "queued"}
+        tracker = self._tracker(webhook_timeout=0.01, poll_interval=0.01, poll_timeout=0.05)
+
+        with self.assertRaises(TimeoutError):
+            tracker.wait("msg-1", timeout=5)
+
+    def test_wait_async(self):
+        tracker = self._tracker(webhook_timeout=60)
+
+        async def scenario():
+            waiter = asyncio.ensure_future(tracker.wait_async("msg-1", timeout=5))
+            await asyncio.sleep(0)
+            tracker.handle_event(self.delivered)
+            return await waiter
+
+        self.assertEqual(asyncio.run(scenario()), self.delivered)
+
+    def test_wait_async_timeout_keeps_tracking(self):
+        tracker = self._tracker(webhook_timeout=60)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(tracker.wait_async("msg-1", timeout=0.01))
+        tracker.handle_event(self.delivered)
+        self.assertEqual(tracker.wait("msg-1", timeout=1), self.delivered)
+
+    def test_close_cancels_pending(self):
+        tracker = DeliveryTracker(self.messages, webhook_timeout=60)
+        future = tracker.track("msg-1")
+        tracker.close()
+
+        self.assertTrue(future.cancelled())
+        with self.assertRaises(RuntimeError):
+            tracker.track("msg-2")
+
+
+if __name__ == "__main__":
+    unittest.main()
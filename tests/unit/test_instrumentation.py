@@ -0,0 +1,118 @@
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from sdk.api_client import APIClient
+from sdk.instrumentation import MetricsObserver, RequestEvent, RequestObserver, endpoint_template
+
+
+class RecordingObserver(RequestObserver):
+    def __init__(self):
+        self.calls = []
+
+    def on_request_start(self, event):
+        self.calls.append(("start", event.endpoint, event.attempt))
+
+    def on_request_end(self, event):
+        self.calls.append(("end", event.endpoint, event.status, event.bytes_sent, event.bytes_received))
+
+    def on_request_error(self, event):
+        self.calls.append(("error", event.endpoint, type(event.error).__name__))
+
+
+def _finished(method, endpoint, duration, status=200, error=None):
+    event = RequestEvent(method, endpoint)
+    event.finish(status=None if error else status, bytes_sent=10, bytes_received=100, error=error)
+    event.duration = duration
+    return event
+
+
+class TestEndpointTemplate(unittest.TestCase):
+    def test_ids_are_templated(self):
+        self.assertEqual(endpoint_template("contacts"), "contacts")
+        self.assertEqual(endpoint_template("contacts/6f1c2a"), "contacts/{id}")
+        self.assertEqual(endpoint_template("/messages/abc?x=1"), "messages/{id}")
+
+
+class TestMetricsObserver(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsObserver()
+
+    def test_snapshot_counts_and_percentiles(self):
+        for number in range(100):
+            self.metrics.on_request_end(_finished("GET", f"contacts/{number}", duration=0.01))
+        self.metrics.on_request_end(_finished("GET", "contacts/x", duration=1.0, status=500))
+        self.metrics.on_request_error(_finished("POST", "messages", duration=0.5, error=requests.Timeout()))
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["requests"], [
+            {"method": "GET", "endpoint": "contacts/{id}", "status": 200, "count": 100},
+            {"method": "GET", "endpoint": "contacts/{id}", "status": 500, "count": 1},
+        ])
+        self.assertEqual(snapshot["errors"], [
+            {"method": "POST", "endpoint": "messages", "error": "Timeout", "count": 1},
+        ])
+        latency = snapshot["latency"][0]
+        self.assertEqual((latency["endpoint"], latency["count"], latency["bytes_received"]), ("contacts/{id}", 101, 10100))
+        self.assertAlmostEqual(latency["p50"], 0.01, delta=0.003)
+        self.assertAlmostEqual(latency["p99"], 0.01, delta=0.003)
+        self.assertGreater(snapshot["latency"][0]["mean"], 0.01)
+
+    def test_threads_record_into_shards(self):
+        def record():
+            for _ in range(1000):
+                self.metrics.on_request_end(_finished("GET", "contacts", duration=0.001))
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.metrics.snapshot()["requests"][0]["count"], 4000)
+
+    def test_prometheus_text(self):
+        self.metrics.on_request_end(_finished("GET", "contacts/1", duration=0.02))
+        text = self.metrics.prometheus()
+
+        self.assertIn('devexp_sdk_requests_total{method="GET",endpoint="contacts/{id}",status="200"} 1', text)
+        self.assertIn('devexp_sdk_request_duration_seconds_bucket{method="GET",endpoint="contacts/{id}",le="+Inf"} 1', text)
+        self.assertIn('devexp_sdk_request_duration_seconds_count{method="GET",endpoint="contacts/{id}"} 1', text)
+        self.assertIn("# TYPE devexp_sdk_request_duration_seconds histogram", text)
+
+
+class TestAPIClientObservers(unittest.TestCase):
+    def setUp(self):
+        self.observer = RecordingObserver()
+        self.client = APIClient(config_path="tests/config_test/test_config.yaml", observers=[self.observer])
+        self.addCleanup(self.client.close)
+        patcher = patch.object(self.client.session, "request")
+        self.addCleanup(patcher.stop)
+        self.mock_request = patcher.start()
+
+    def test_events_for_a_response(self):
+        response = Mock(status_code=200, headers={}, content=b'{"id": "1"}')
+        self.mock_request.return_value = response
+
+        self.client.request("PATCH", "contacts/123", json={"name": "Jane"})
+        self.assertEqual(self.observer.calls, [
+            ("start", "contacts/{id}", 1),
+            ("end", "contacts/{id}", 200, 15, 11),
+        ])
+
+    def test_events_for_errors_and_failing_observers(self):
+        broken = Mock(spec=RequestObserver)
+        broken.on_request_start.side_effect = RuntimeError("observer bug")
+        self.client.add_observer(broken)
+        self.mock_request.side_effect = requests.exceptions.ReadTimeout("timed out")
+
+        with self.assertLogs(level="ERROR"), self.assertRaises(requests.exceptions.ReadTimeout):
+            self.client.request("POST", "messages", json={})
+        self.assertEqual(self.observer.calls, [("start", "messages", 1), ("error", "messages", "ReadTimeout")])
+        broken.on_request_error.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import io
+import json
+import logging
+import queue
+import threading
+import unittest
+from unittest.mock import Mock
+
+from sdk.utils.log import LogListener, NonBlockingQueueHandler, SamplingFilter, StructuredFormatter, Truncated, configure_logging
+
+
+def _call(fn):
+    try:
+        fn()
+    except Exception as e:
+        return [e]
+    return []
+
+
+def _record(level=logging.INFO, msg="hello %s", args=("world",), **extra):
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestTruncated(unittest.TestCase):
+    def test_long_values_are_cut(self):
+        self.assertEqual(str(Truncated("abc", limit=5)), "abc")
+        self.assertEqual(str(Truncated("x" * 12, limit=5)), "xxxxx... (7 more characters)")
+
+    def test_callables_are_only_called_when_formatted(self):
+        producer = Mock(return_value={"id": 1})
+        logger = logging.getLogger("test.truncated")
+        logger.setLevel(logging.INFO)
+        self.addCleanup(logger.setLevel, logging.NOTSET)
+
+        logger.debug("Payload: %s", Truncated(producer))
+        producer.assert_not_called()
+        with self.assertLogs(logger, level="INFO") as logs:
+            logger.info("Payload: %s", Truncated(producer))
+        self.assertEqual(logs.records[0].getMessage(), "Payload: {'id': 1}")
+
+
+class TestSamplingFilter(unittest.TestCase):
+    def test_keeps_a_fraction_of_info_and_all_warnings(self):
+        sampler = SamplingFilter(0.25)
+        kept = sum(sampler.filter(_record()) for _ in range(4000))
+        self.assertAlmostEqual(kept / 4000, 0.25, delta=0.05)
+        self.assertTrue(all(sampler.filter(_record(logging.WARNING)) for _ in range(100)))
+
+    def test_rate_is_validated(self):
+        with self.assertRaises(ValueError):
+            SamplingFilter(1.5)
+
+
+class TestStructuredFormatter(unittest.TestCase):
+    def test_json_line_with_extra_fields(self):
+        entry = json.loads(StructuredFormatter().format(_record(message_id="m1")))
+        self.assertEqual(entry["message"], "hello world")
+        self.assertEqual((entry["level"], entry["logger"], entry["message_id"]), ("INFO", "test", "m1"))
+
+
+class TestNonBlockingQueueHandler(unittest.TestCase):
+    def test_full_queue_drops_records(self):
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+        for _ in range(5):
+            handler.handle(_record())
+        self.assertEqual((handler.queue.qsize(), handler.dropped), (2, 3))
+
+
+class TestConfigureLogging(unittest.TestCase):
+    def setUp(self):
+        root = logging.getLogger()
+        self.addCleanup(root.setLevel, root.level)
+
+    def test_records_are_written_by_the_listener(self):
+        stream = io.StringIO()
+        listener = configure_logging("INFO", structured=True, stream=stream)
+        logging.getLogger("test.configure").info("sent %d", 3, extra={"endpoint": "messages"})
+        logging.getLogger("test.configure").debug("ignored")
+        listener.stop()
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["endpoint"], "messages")
+        self.assertFalse(any(isinstance(h, NonBlockingQueueHandler) for h in logging.getLogger().handlers))
+
+    def test_stop_waits_for_room_in_a_full_queue(self):
+        picked, release = threading.Event(), threading.Event()
+        written = []
+
+        class SlowHandler(logging.Handler):
+            def emit(self, record):
+                picked.set()
+                release.wait(5)
+                written.append(record.getMessage())
+
+        queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+        listener = LogListener(queue_handler, SlowHandler())
+        listener.start()
+        queue_handler.handle(_record(args=("1",)))
+        picked.wait(5)  # The listener is busy writing the first record
+        queue_handler.handle(_record(args=("2",)))
+        queue_handler.handle(_record(args=("3",)))
+        self.assertTrue(queue_handler.queue.full())
+
+        errors = []
+        stopper = threading.Thread(target=lambda: errors.extend(_call(listener.stop)))
+        stopper.start()
+        release.set()
+        stopper.join(5)
+
+        self.assertFalse(stopper.is_alive())
+        self.assertEqual(errors, [])
+        self.assertEqual(written, ["hello 1", "hello 2", "hello 3"])
+
+    def test_reconfiguring_replaces_the_handler(self):
+        first = configure_logging(stream=io.StringIO())
+        second = configure_logging(stream=io.StringIO())
+        self.addCleanup(second.stop)
+        handlers = [h for h in logging.getLogger().handlers if isinstance(h, NonBlockingQueueHandler)]
+        self.assertEqual(handlers, [second.queue_handler])
+        first.stop()  # Already stopped, no-op
+
+
+if __name__ == "__main__":
+    unittest.main()
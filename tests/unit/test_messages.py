@@ -51,6 +51,44 @@ class TestMessages(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.messages.send_message(recipient_id="123", content="Hello!", sender_phone="")
 
+    def test_send_message_to_number_expects_inline_contact_details(self):
+        """
+        Test sending to inline contact details, with the phone normalized to E.164.
+        """
+        self.mock_client.request.return_value = {
+            "to": {"id": "new-contact", "name": "Bob", "phone": "+34612345678"},
+            "from": "+14155552672",
+            "content": "Hello!",
+            "id": "789",
+            "status": "queued",
+            "createdAt": "2024-01-01T12:00:00Z",
+            "deliveredAt": None
+        }
+
+        response = self.messages.send_message_to_number(
+            recipient_name="Bob", recipient_phone="+34 612 34 56 78", content="Hello!", sender_phone="+14155552672"
+        )
+        self.assertEqual(response["id"], "789")
+        self.mock_client.request.assert_called_once_with(
+            "POST", "messages", json={
+                "to": {"name": "Bob", "phone": "+34612345678"},
+                "from": "+14155552672",
+                "content": "Hello!"
+            }
+        )
+
+    def test_send_message_to_number_expects_value_error_for_invalid_recipient(self):
+        """
+        Test that an invalid phone or missing name is rejected before any request.
+        """
+        with self.assertRaises(ValueError):
+            self.messages.send_message_to_number("Bob", "12345", "Hello!", "+14155552672")
+        with self.assertRaises(ValueError):
+            self.messages.send_message_to_number("", "+34612345678", "Hello!", "+14155552672")
+        with self.assertRaises(ValueError):
+            self.messages.send_message_to_number("Bob", "+34612345678", "", "+14155552672")
+        self.mock_client.request.assert_not_called()
+
     def test_list_messages_expects_correct_pagination(self):
         """
         Test listing messages with pagination.
@@ -85,5 +123,61 @@ class TestMessages(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.messages.get_message(message_id=None)
 
+    def test_send_many_expects_per_item_results_without_stopping(self):
+        """
+        Test that send_many reports each message and continues after a failure.
+        """
+        def mock_request(method, endpoint, json=None):
+            if json["to"].get("id") == "bad":
+                raise RuntimeError("400 Client Error: Bad Request")
+            return {
+                "to": json["to"], "from": json["from"], "content": json["content"], "id": json["to"].get("id", "new"),
+                "status": "queued", "createdAt": "2024-01-01T12:00:00Z", "deliveredAt": None
+            }
+
+        self.mock_client.request.side_effect = mock_request
+        batch = (
+            {"recipient_id": recipient_id, "content": "Hello!", "sender_phone": "+14155552672"}
+            for recipient_id in ["1", "bad", "3", ""]
+        )
+        inline = {"recipient_name": "Bob", "recipient_phone": "+34612345678", "content": "Hi", "sender_phone": "+1"}
+
+        results = list(self.messages.send_many(list(batch) + [inline], concurrency=2, ordered=True))
+        self.assertEqual([result.ok for result in results], [True, False, True, False, True])
+        self.assertEqual(results[4].result["to"], {"name": "Bob", "phone": "+34612345678"})
+        self.assertEqual(results[2].result["id"], "3")
+        self.assertIsInstance(results[1].error, RuntimeError)
+        self.assertIsInstance(results[3].error, ValueError)
+
+    def test_iter_messages_expects_every_message_with_prefetch(self):
+        """
+        Test that iter_messages walks all pages, also when prefetching.
+        """
+        def mock_request(method, endpoint, params):
+            start = (params["page"] - 1) * params["limit"]
+            ids = range(start, min(start + params["limit"], 7))
+            return {"messages": [{"id": str(i)} for i in ids], "page": params["page"], "quantityPerPage": 3}
+
+        self.mock_client.request.side_effect = mock_request
+
+        message_ids = [message["id"] for message in self.messages.iter_messages(limit=3, prefetch=True)]
+        self.assertEqual(message_ids, [str(i) for i in range(7)])
+
+    def test_export_messages_expects_every_page_delivered(self):
+        """
+        Test that export_messages hands every page to the callback and returns the total.
+        """
+        def mock_request(method, endpoint, params):
+            start = (params["page"] - 1) * params["limit"]
+            ids = range(start, min(start + params["limit"], 25))
+            return {"messages": [{"id": str(i)} for i in ids], "page": params["page"], "quantityPerPage": 10}
+
+        self.mock_client.request.side_effect = mock_request
+        pages = {}
+
+        total = self.messages.export_messages(callback=pages.__setitem__, concurrency=3, limit=10)
+        self.assertEqual(total, 25)
+        self.assertEqual(sorted(pages), [1, 2, 3])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,237 @@
+import asyncio
+import queue
+import threading
+import time
+import unittest
+from sdk.utils.pagination import async_export_pages, async_iterate_pages, export_pages, iterate_pages
+
+
+def make_fetcher(total, items_key="items", max_page_size=None):
+    """
+    Returns a fake page fetcher over 'total' records, recording the pages requested.
+    With 'max_page_size', pages are capped to it and report it as 'pageSize'.
+    """
+    calls = []
+
+    def fetch_page(page, limit):
+        calls.append((page, threading.current_thread().name))
+        if max_page_size is not None:
+            limit = min(limit, max_page_size)
+        start = (page - 1) * limit
+        response = {items_key: list(range(start, min(start + limit, total))), "page": page}
+        if max_page_size is not None:
+            response["pageSize"] = limit
+        return response
+
+    return fetch_page, calls
+
+
+class TestIteratePages(unittest.TestCase):
+    def test_iterate_pages_expects_stop_after_short_page(self):
+        """
+        Test that iteration walks every page and stops on the first short page.
+        """
+        fetch_page, calls = make_fetcher(25)
+        pages = list(iterate_pages(fetch_page, "items", limit=10))
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        self.assertEqual([page for page, _ in calls], [1, 2, 3])
+
+    def test_iterate_pages_expects_stop_after_empty_page(self):
+        """
+        Test that an exact multiple of the page size ends with one empty page request.
+        """
+        fetch_page, calls = make_fetcher(20)
+        items = [item for page in iterate_pages(fetch_page, "items", limit=10) for item in page]
+        self.assertEqual(items, list(range(20)))
+        self.assertEqual(len(calls), 3)
+
+    def test_iterate_pages_expects_server_capped_page_size_followed(self):
+        """
+        Test that pages shorter than the limit but as long as the reported page size are not the last.
+        """
+        for prefetch in (False, True):
+            fetch_page, calls = make_fetcher(300, max_page_size=50)
+            items = [item for page in iterate_pages(fetch_page, "items", limit=100, prefetch=prefetch) for item in page]
+            self.assertEqual(items, list(range(300)))
+            self.assertEqual(len(calls), 7)
+
+    def test_iterate_pages_expects_prefetch_on_background_thread(self):
+        """
+        Test that prefetch yields the same records with fetches done off the caller thread.
+        """
+        fetch_page, calls = make_fetcher(35)
+        items = [item for page in iterate_pages(fetch_page, "items", limit=10, prefetch=True) for item in page]
+        self.assertEqual(items, list(range(35)))
+        self.assertTrue(all(thread != threading.current_thread().name for _, thread in calls))
+
+    def test_iterate_pages_expects_prefetch_limited_to_next_page(self):
+        """
+        Test that prefetch never runs more than one page ahead of the consumer.
+        """
+        fetch_page, calls = make_fetcher(1000)
+        iterator = iterate_pages(fetch_page, "items", limit=10, prefetch=True)
+        next(iterator)
+        next(iterator)
+        self.assertLessEqual(len(calls), 3)
+        iterator.close()
+
+    def test_iterate_pages_expects_runtime_error_when_page_ignored(self):
+        """
+        Test that a server always answering page 1 is detected instead of looping forever.
+        """
+        def fetch_page(page, limit):
+            return {"items": list(range(limit))}
+
+        with self.assertRaises(RuntimeError):
+            list(iterate_pages(fetch_page, "items", limit=10))
+
+
+class TestExportPages(unittest.TestCase):
+    def test_export_pages_expects_all_records_with_parallel_fetches(self):
+        """
+        Test that pages are fetched concurrently and every record reaches the callback.
+        """
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+        fetch, calls = make_fetcher(95)
+
+        def slow_fetch(page, limit):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return fetch(page, limit)
+
+        received = {}
+        total = export_pages(slow_fetch, "items", limit=10, concurrency=4,
+                             callback=lambda page, items: received.update({page: items}))
+
+        self.assertEqual(total, 95)
+        self.assertEqual(sorted(item for items in received.values() for item in items), list(range(95)))
+        self.assertEqual(state["peak"], 4)
+        # Requests stop shortly after the short page: at most 'concurrency' extra pages
+        self.assertLessEqual(len(calls), 10 + 4)
+
+    def test_export_pages_expects_queue_output_with_sentinel(self):
+        """
+        Test that a bounded queue receives every page followed by None.
+        """
+        fetch, _ = make_fetcher(30)
+        output = queue.Queue(maxsize=1)
+        pages = []
+
+        def consume():
+            while True:
+                entry = output.get()
+                if entry is None:
+                    return
+                pages.append(entry[0])
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        total = export_pages(fetch, "items", limit=10, concurrency=3, output=output)
+        consumer.join(timeout=5)
+
+        self.assertEqual(total, 30)
+        self.assertEqual(sorted(pages), [1, 2, 3])
+
+    def test_export_pages_expects_value_error_without_destination(self):
+        """
+        Test that exactly one of callback and output is required.
+        """
+        fetch, _ = make_fetcher(10)
+        with self.assertRaises(ValueError):
+            export_pages(fetch, "items", limit=10)
+
+    def test_export_pages_expects_server_capped_page_size_followed(self):
+        """
+        Test that an export against a server capping the page size fetches every record.
+        """
+        fetch_page, _ = make_fetcher(300, max_page_size=50)
+        received = []
+        total = export_pages(fetch_page, "items", limit=100, callback=lambda page, items: received.extend(items))
+        self.assertEqual((total, sorted(received)), (300, list(range(300))))
+
+    def test_export_pages_expects_warning_when_total_differs(self):
+        """
+        Test that an export delivering another number of records than the server's reported
+        total (e.g. records created meanwhile) completes with a warning.
+        """
+        fetch, _ = make_fetcher(25)
+
+        def fetch_page(page, limit):
+            return dict(fetch(page, limit), total=30)
+
+        received = []
+        with self.assertLogs("sdk.utils.pagination", level="WARNING"):
+            total = export_pages(fetch_page, "items", limit=10, callback=lambda page, items: received.extend(items))
+        self.assertEqual((total, len(received)), (25, 25))
+        self.assertEqual(export_pages(lambda page, limit: dict(fetch(page, limit), total=25), "items", limit=10,
+                                      callback=lambda page, items: None), 25)
+
+    def test_export_pages_expects_runtime_error_when_later_page_repeats(self):
+        """
+        Test that a server repeating a page other than the first one stops the export.
+        """
+        fetch, _ = make_fetcher(100)
+
+        def fetch_page(page, limit):
+            return fetch(min(page, 3), limit)  # Pages after the third repeat it
+
+        with self.assertRaises(RuntimeError):
+            export_pages(fetch_page, "items", limit=10, concurrency=2, callback=lambda page, items: None)
+
+    def test_export_pages_expects_runtime_error_when_page_ignored(self):
+        """
+        Test that a server always answering page 1 stops the export.
+        """
+        with self.assertRaises(RuntimeError):
+            export_pages(lambda page, limit: {"items": list(range(limit))}, "items", limit=5,
+                         callback=lambda page, items: None)
+
+
+class TestAsyncPages(unittest.IsolatedAsyncioTestCase):
+    async def test_async_pages_expect_server_capped_page_size_followed(self):
+        """
+        Test the async iterator and export against a server capping the page size.
+        """
+        fetch, _ = make_fetcher(300, max_page_size=50)
+
+        async def fetch_page(page, limit):
+            await asyncio.sleep(0)
+            return fetch(page, limit)
+
+        for prefetch in (False, True):
+            items = [item async for page in async_iterate_pages(fetch_page, "items", 100, prefetch=prefetch)
+                     for item in page]
+            self.assertEqual(items, list(range(300)))
+        received = []
+        total = await async_export_pages(fetch_page, "items", limit=100, callback=lambda page, items: received.extend(items))
+        self.assertEqual((total, sorted(received)), (300, list(range(300))))
+
+
+class TestAsyncExportPages(unittest.IsolatedAsyncioTestCase):
+    async def test_async_export_pages_expects_all_records(self):
+        """
+        Test the async export with a coroutine callback.
+        """
+        fetch, _ = make_fetcher(42)
+
+        async def fetch_page(page, limit):
+            await asyncio.sleep(0)
+            return fetch(page, limit)
+
+        received = []
+
+        async def callback(page, items):
+            received.extend(items)
+
+        total = await async_export_pages(fetch_page, "items", limit=10, concurrency=3, callback=callback)
+        self.assertEqual(total, 42)
+        self.assertEqual(sorted(received), list(range(42)))
+
+
+if __name__ == "__main__":
+    unittest.main()
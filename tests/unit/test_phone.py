@@ -0,0 +1,141 @@
+import threading
+import unittest
+from unittest.mock import patch
+from sdk.utils.phone import PhoneNumberCache, normalize_phone_number, normalize_phone_numbers
+
+
+class TestNormalizePhoneNumber(unittest.TestCase):
+    def test_normalize_phone_number_expects_e164_with_default_region(self):
+        """
+        Test that a national number is formatted using the default region.
+        """
+        self.assertEqual(normalize_phone_number("(415) 555-2671", "US"), "+14155552671")
+
+    def test_normalize_phone_number_expects_value_error_for_invalid_phone(self):
+        """
+        Test that unparsable and invalid numbers raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            normalize_phone_number("not a number")
+        with self.assertRaises(ValueError):
+            normalize_phone_number("12345")
+
+
+class TestPhoneNumberCache(unittest.TestCase):
+    def setUp(self):
+        """
+        Use a small private cache for each test.
+        """
+        self.cache = PhoneNumberCache(maxsize=2)
+
+    def test_normalize_expects_hit_on_second_call(self):
+        """
+        Test that a repeated number is served from the cache.
+        """
+        with patch("sdk.utils.phone.normalize_phone_number", return_value="+14155552671") as mock_normalize:
+            self.cache.normalize("+14155552671")
+            self.cache.normalize("+14155552671")
+        mock_normalize.assert_called_once_with("+14155552671", None)
+        self.assertEqual(self.cache.cache_info(), (1, 1, 2, 1))
+
+    def test_normalize_expects_failures_cached(self):
+        """
+        Test that an invalid number is rejected from the cache without being parsed again.
+        """
+        with self.assertRaises(ValueError):
+            self.cache.normalize("12345")
+        with patch("sdk.utils.phone.normalize_phone_number") as mock_normalize:
+            with self.assertRaises(ValueError):
+                self.cache.normalize("12345")
+        mock_normalize.assert_not_called()
+
+    def test_normalize_expects_region_in_cache_key(self):
+        """
+        Test that the same raw string is cached separately per default region.
+        """
+        self.assertEqual(self.cache.normalize("612345678", "ES"), "+34612345678")
+        with self.assertRaises(ValueError):
+            self.cache.normalize("612345678", None)
+        self.assertEqual(self.cache.cache_info().misses, 2)
+
+    def test_normalize_expects_least_recently_used_evicted(self):
+        """
+        Test that the cache stays within 'maxsize' by evicting the least recently used entry.
+        """
+        self.cache.normalize("+14155552671")
+        self.cache.normalize("+34612345678")
+        self.cache.normalize("+14155552671")
+        self.cache.normalize("+442071838750")
+
+        self.assertEqual(self.cache.cache_info().currsize, 2)
+        self.cache.normalize("+14155552671")
+        self.assertEqual(self.cache.cache_info().hits, 2)
+
+    def test_clear_expects_entries_and_statistics_reset(self):
+        """
+        Test that clear() empties the cache and resets the counters.
+        """
+        self.cache.normalize("+14155552671")
+        self.cache.clear()
+        self.assertEqual(self.cache.cache_info(), (0, 0, 2, 0))
+
+    def test_normalize_expects_consistent_results_across_threads(self):
+        """
+        Test concurrent use of one cache from several threads.
+        """
+        cache = PhoneNumberCache(maxsize=16)
+        numbers = ["+14155552671", "+34612345678", "+442071838750", "12345"] * 50
+        errors = []
+
+        def worker():
+            for number in numbers:
+                try:
+                    cache.normalize(number)
+                except ValueError:
+                    errors.append(number)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 4 * len(numbers))
+        self.assertEqual(set(errors), {"12345"})
+        self.assertEqual(info.currsize, 4)
+
+
+class TestNormalizePhoneNumbers(unittest.TestCase):
+    numbers = ["+14155552671", "12345", "612345678", "+442071838750", "not a number"] * 7
+
+    def test_normalize_phone_numbers_expects_input_order_and_errors(self):
+        """
+        Test batch validation in the calling process, with per-row errors.
+        """
+        results = list(normalize_phone_numbers(self.numbers, "ES", chunk_size=3))
+        self.assertEqual([result.index for result in results], list(range(len(self.numbers))))
+        self.assertEqual(results[2].result, "+34612345678")
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(sum(result.ok for result in results), 21)
+
+    def test_normalize_phone_numbers_expects_same_results_with_workers(self):
+        """
+        Test that a process pool returns exactly the in-process results, in order.
+        """
+        expected = [(r.item, r.result, r.ok) for r in normalize_phone_numbers(self.numbers, "ES")]
+        results = normalize_phone_numbers(iter(self.numbers), "ES", workers=2, chunk_size=4)
+        self.assertEqual([(r.item, r.result, r.ok) for r in results], expected)
+
+    def test_normalize_phone_numbers_expects_value_error_for_invalid_workers(self):
+        """
+        Test that non-positive workers or chunk sizes are rejected when called, before iterating.
+        """
+        with self.assertRaises(ValueError):
+            normalize_phone_numbers(self.numbers, workers=0)
+        with self.assertRaises(ValueError):
+            normalize_phone_numbers(self.numbers, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
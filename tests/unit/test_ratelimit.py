@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from sdk.api_client import APIClient
+from sdk.ratelimit import AdaptiveLimiter, RateLimiter, TokenBucket, endpoint_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock)
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1)
+        self.assertAlmostEqual(bucket.reserve(), 0.2)  # Queued behind the previous reservation
+
+        clock.now = 1.0  # Refilled, but never above the burst
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertGreater(bucket.reserve(), 0.0)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, burst=0.5)
+
+    def test_endpoint_key(self):
+        self.assertEqual(endpoint_key("messages"), "messages")
+        self.assertEqual(endpoint_key("/contacts/123"), "contacts")
+        self.assertEqual(endpoint_key("messages?page=2"), "messages")
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = AdaptiveLimiter(initial=4, min_limit=1, max_limit=8, latency_target=1.0, clock=self.clock)
+
+    def run_requests(self, count, latency, success=True):
+        for _ in range(count):
+            self.assertTrue(self.limiter.acquire(timeout=0))
+            self.limiter.release(latency, success)
+
+    def test_additive_increase_up_to_max(self):
+        self.run_requests(5, 0.1)  # About one round of the current limit
+        self.assertEqual(self.limiter.limit, 5)
+
+        self.run_requests(200, 0.1)
+        self.assertEqual(self.limiter.limit, 8)
+
+    def test_multiplicative_decrease_once_per_interval(self):
+        self.run_requests(3, 0.1, success=False)
+        self.assertEqual(self.limiter.limit, 2)
+
+        self.clock.now += 1.0
+        self.run_requests(1, 2.0)  # Slower than the target
+        self.assertEqual(self.limiter.limit, 1)
+
+        self.clock.now += 1.0
+        self.run_requests(1, 0.1, success=False)
+        self.assertEqual(self.limiter.limit, 1)  # Never below the minimum
+
+    def test_latency_target_from_fastest_request(self):
+        limiter = AdaptiveLimiter(initial=4, latency_tolerance=2.0, clock=self.clock)
+        limiter.acquire()
+        limiter.release(0.1)
+        limiter.acquire()
+        limiter.release(0.3)  # Over twice the fastest latency
+        self.assertEqual(limiter.limit, 2)
+
+    def test_acquire_blocks_until_release(self):
+        limiter = AdaptiveLimiter(initial=1, max_limit=1)
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire(timeout=0.01))
+
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: limiter.acquire() and acquired.set())
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release()
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_acquire_async_hands_over_and_survives_cancellation(self):
+        limiter = AdaptiveLimiter(initial=1, max_limit=1)
+
+        async def scenario():
+            await limiter.acquire_async()
+            cancelled = asyncio.ensure_future(limiter.acquire_async())
+            waiting = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            limiter.release()
+            await asyncio.wait_for(waiting, 1)
+
+        asyncio.run(scenario())
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_acquire_async_cancelled_after_handover_gives_the_slot_back(self):
+        limiter = AdaptiveLimiter(initial=1, max_limit=1)
+
+        async def scenario():
+            await limiter.acquire_async()
+            waiter = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0)
+            limiter.release()
+            await asyncio.sleep(0)  # The slot is handed over; the waiter has not resumed yet
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+
+        asyncio.run(scenario())
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter(initial=0)
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter(initial=20, max_limit=10)
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter(backoff=1.5)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_from_config(self):
+        limiter = RateLimiter.from_config({
+            "default": {"rate": 100},
+            "endpoints": {"messages": {"rate": 10, "burst": 20}},
+            "adaptive": {"initial": 5, "max_limit": 50},
+        })
+        self.assertEqual(limiter.buckets["messages"].burst, 20)
+        self.assertEqual(limiter.default.rate, 100)
+        self.assertEqual(limiter.concurrency.limit, 5)
+        self.assertIsNone(RateLimiter.from_config({}))
+        with self.assertRaises(ValueError):
+            RateLimiter.from_config({"endpoints": {"messages": {"rps": 10}}})
+        with self.assertRaises(ValueError):
+            RateLimiter.from_config({"unknown": 1})
+
+    def test_endpoints_use_their_own_bucket(self):
+        limiter = RateLimiter({"messages": TokenBucket(rate=1, burst=1)})
+
+        with patch("sdk.ratelimit.time.sleep") as sleep:
+            limiter.acquire("messages").release()
+            limiter.acquire("contacts/1").release()  # No bucket, not paced
+            sleep.assert_not_called()
+            limiter.acquire("messages/2").release()
+            sleep.assert_called_once()
+
+    def test_permit_feeds_the_adaptive_limiter(self):
+        limiter = RateLimiter(concurrency=AdaptiveLimiter(initial=2, max_limit=2))
+        permit = limiter.acquire("messages")
+        self.assertEqual(limiter.concurrency.in_flight, 1)
+        permit.release(success=False)
+        permit.release()  # Released once only
+        self.assertEqual(limiter.concurrency.in_flight, 0)
+        self.assertEqual(limiter.concurrency.limit, 1)
+
+        limiter.acquire("messages").discard()
+        self.assertEqual(limiter.concurrency.in_flight, 0)
+
+    def test_api_client_releases_permits(self):
+        rate_limiter = RateLimiter(concurrency=AdaptiveLimiter(initial=2, max_limit=2))
+        client = APIClient(config_path="tests/config_test/test_config.yaml", rate_limiter=rate_limiter)
+        self.addCleanup(client.close)
+        response = Mock(status_code=200, headers={}, content=b'{"id": "1"}')
+
+        with patch.object(client.session, "request", return_value=response):
+            self.assertEqual(client.request("GET", "contacts/1"), {"id": "1"})
+        with patch.object(client.session, "request", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                client.request("GET", "contacts/1")
+        self.assertEqual(rate_limiter.concurrency.in_flight, 0)
+        self.assertEqual(rate_limiter.concurrency.limit, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
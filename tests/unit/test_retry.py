@@ -0,0 +1,155 @@
+import json
+import random
+import unittest
+from email.utils import formatdate
+from unittest.mock import Mock, patch
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from sdk.api_client import APIClient
+from sdk.retry import MIN_ATTEMPT_TIMEOUT, RetryPolicy, parse_retry_after
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=3, backoff_base=1.0, backoff_cap=3.0, deadline=None,
+                                  rng=random.Random(0))
+
+    def test_backoff_is_jittered_and_capped(self):
+        for attempt in range(1, 10):
+            delay = self.policy.backoff(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(3.0, 2 ** (attempt - 1)))
+
+    def test_retry_delay_gives_up_after_max_attempts(self):
+        self.assertIsNotNone(self.policy.retry_delay(1, None, "GET"))
+        self.assertIsNotNone(self.policy.retry_delay(2, None, "GET"))
+        self.assertIsNone(self.policy.retry_delay(3, None, "GET"))
+
+    def test_retry_delay_for_non_idempotent_methods(self):
+        """
+        Test that POST only retries failures that cannot have reached the server, unless opted in.
+        """
+        self.assertIsNone(self.policy.retry_delay(1, None, "POST"))
+        self.assertIsNone(self.policy.retry_delay(1, None, "POST", status=503))
+        self.assertIsNotNone(self.policy.retry_delay(1, None, "POST", connect_error=True))
+        self.assertIsNone(self.policy.retry_delay(1, None, "POST", status=429))
+        self.policy.resend_rejected = True
+        self.assertIsNotNone(self.policy.retry_delay(1, None, "POST", status=429))
+        self.assertIsNotNone(self.policy.retry_delay(1, None, "POST", idempotent=True, status=503))
+        self.assertIsNone(self.policy.retry_delay(1, None, "GET", idempotent=False, status=503))
+
+    def test_retry_delay_ignores_other_statuses(self):
+        self.assertIsNone(self.policy.retry_delay(1, None, "GET", status=404))
+
+    def test_retry_after_and_deadline(self):
+        """
+        Test that Retry-After replaces the backoff, but never beyond the deadline budget.
+        """
+        self.assertEqual(self.policy.retry_delay(1, None, "GET", status=503, retry_after="2"), 2.0)
+
+        policy = RetryPolicy(deadline=5.0)
+        deadline = policy.start()
+        self.assertEqual(policy.retry_delay(1, deadline, "GET", status=503, retry_after="1"), 1.0)
+        self.assertIsNone(policy.retry_delay(1, deadline, "GET", status=503, retry_after="10"))
+
+    def test_no_retry_without_time_for_an_attempt(self):
+        """
+        Test that a retry leaving almost nothing of the deadline is not made, and that an
+        attempt never gets a zero timeout.
+        """
+        policy = RetryPolicy(deadline=5.0)
+        deadline = policy.start()
+        self.assertIsNone(policy.retry_delay(1, deadline, "GET", status=503, retry_after="4.99"))
+
+        self.assertEqual(policy.attempt_timeout(deadline, 2.0), 2.0)
+        self.assertEqual(policy.attempt_timeout(deadline - 5.0, 2.0), MIN_ATTEMPT_TIMEOUT)
+        self.assertEqual(policy.attempt_timeout(None, 2.0), 2.0)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertAlmostEqual(parse_retry_after(formatdate(usegmt=True)), 0.0, delta=1.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_from_config(self):
+        policy = RetryPolicy.from_config({"max_attempts": 5, "methods": ["get"], "statuses": [503]})
+        self.assertEqual(policy.max_attempts, 5)
+        self.assertEqual(policy.methods, frozenset(["GET"]))
+        self.assertEqual(RetryPolicy.from_config({"enabled": False}).max_attempts, 1)
+        with self.assertRaises(ValueError):
+            RetryPolicy.from_config({"unknown": 1})
+        with self.assertRaises(ValueError):
+            RetryPolicy.from_config({"max_attempts": 0})
+
+
+class TestAPIClientRetry(unittest.TestCase):
+    def setUp(self):
+        self.client = APIClient(config_path="tests/config_test/test_config.yaml")
+        self.addCleanup(self.client.close)
+        self.client.retry_policy = RetryPolicy(max_attempts=3, backoff_base=0.01)
+        patcher = patch.object(self.client.session, "request")
+        self.addCleanup(patcher.stop)
+        self.mock_request = patcher.start()
+        sleep_patcher = patch("sdk.api_client.time.sleep")
+        self.addCleanup(sleep_patcher.stop)
+        self.mock_sleep = sleep_patcher.start()
+
+    @staticmethod
+    def _response(status, body=None, headers=None):
+        response = Mock()
+        response.status_code = status
+        response.headers = headers or {}
+        response.content = json.dumps(body).encode()
+        if status >= 400:
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status} Error")
+        return response
+
+    @staticmethod
+    def _connect_error():
+        reason = NewConnectionError(None, "Connection refused")
+        return requests.exceptions.ConnectionError(Mock(reason=reason))
+
+    def test_get_retries_server_errors_with_retry_after(self):
+        self.mock_request.side_effect = [
+            self._response(503, headers={"Retry-After": "1"}),
+            self._response(200, {"id": "1"}),
+        ]
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(self.client.request("GET", "contacts/1"), {"id": "1"})
+        self.assertEqual(self.mock_request.call_count, 2)
+        self.mock_sleep.assert_called_once_with(1.0)
+
+    def test_get_gives_up_after_max_attempts(self):
+        self.mock_request.side_effect = requests.exceptions.ReadTimeout("timed out")
+
+        with self.assertLogs(level="WARNING"), self.assertRaises(requests.exceptions.ReadTimeout):
+            self.client.request("GET", "contacts")
+        self.assertEqual(self.mock_request.call_count, 3)
+
+    def test_post_retries_connect_errors_only(self):
+        """
+        Test that a POST is resent when the connection failed, but not after a read timeout.
+        """
+        self.mock_request.side_effect = [self._connect_error(), self._response(201, {"id": "1"})]
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(self.client.request("POST", "contacts", json={}), {"id": "1"})
+
+        self.mock_request.reset_mock()
+        self.mock_request.side_effect = requests.exceptions.ReadTimeout("timed out")
+        with self.assertLogs(level="ERROR"), self.assertRaises(requests.exceptions.ReadTimeout):
+            self.client.request("POST", "contacts", json={})
+        self.assertEqual(self.mock_request.call_count, 1)
+
+    def test_post_retries_when_opted_in(self):
+        self.mock_request.side_effect = [self._response(502), self._response(201, {"id": "1"})]
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(self.client.request("POST", "messages", json={}, idempotent=True), {"id": "1"})
+        self.assertEqual(self.mock_request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import hashlib
+import hmac
+import unittest
+
+from sdk.resources.messages import Messages
+from sdk.utils.signature import KeyRing, SignatureVerifier, get_verifier, key_fingerprint, verify_signature
+
+
+def reference_signature(message: bytes, secret: str) -> str:
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+class TestSignature(unittest.TestCase):
+    def setUp(self):
+        self.secret = "mySecret"
+        self.body = b'{"id": "msg-1", "status": "delivered"}'
+        self.signature = reference_signature(self.body, self.secret)
+
+    def test_verify_accepts_bytes_memoryview_and_str(self):
+        """
+        Test that the same payload verifies whatever buffer type carries it.
+        """
+        for message in (self.body, bytearray(self.body), memoryview(self.body), self.body.decode()):
+            self.assertTrue(verify_signature(message, self.signature, self.secret))
+
+    def test_verify_rejects_wrong_signature(self):
+        self.assertFalse(verify_signature(self.body, "0" * 64, self.secret))
+        self.assertFalse(verify_signature(self.body + b" ", self.signature, self.secret))
+
+    def test_verify_non_utf8_body_fails_without_raising(self):
+        """
+        Test that a body that is not valid UTF-8 is verified on its bytes instead of raising.
+        """
+        body = b"\xff\xfe not utf-8"
+        self.assertFalse(verify_signature(body, self.signature, self.secret))
+        self.assertTrue(verify_signature(body, reference_signature(body, self.secret), self.secret))
+
+    def test_verify_non_ascii_signature_returns_false(self):
+        self.assertFalse(verify_signature(self.body, "é" * 64, self.secret))
+
+    def test_verify_invalid_types(self):
+        with self.assertRaises(ValueError):
+            verify_signature(123, self.signature, self.secret)
+        with self.assertRaises(ValueError):
+            verify_signature(self.body, self.signature, None)
+
+    def test_verifier_is_reused_per_secret(self):
+        self.assertIs(get_verifier(self.secret), get_verifier(self.secret))
+
+    def test_sign_matches_reference_and_messages(self):
+        """
+        Test that the verifier and Messages.generate_signature produce the standard HMAC.
+        """
+        verifier = SignatureVerifier(self.secret)
+        self.assertEqual(verifier.sign(self.body), self.signature)
+        # The precomputed key state must not be consumed by a previous call
+        self.assertEqual(verifier.sign(self.body), self.signature)
+
+        messages = Messages(client=None, webhook_secret=self.secret)
+        self.assertEqual(messages.generate_signature(self.body.decode()), self.signature)
+        self.assertEqual(messages.generate_signature(memoryview(self.body)), self.signature)
+
+
+class TestKeyRing(unittest.TestCase):
+    def setUp(self):
+        self.body = b'{"id": "msg-1", "status": "delivered"}'
+        self.keyring = KeyRing(["newSecret", "oldSecret"])
+
+    def test_verify_accepts_any_active_key_and_counts_it(self):
+        """
+        Test that both the current and the previous key verify, each counted separately.
+        """
+        self.assertEqual(
+            self.keyring.verify(self.body, reference_signature(self.body, "newSecret")), self.keyring.fingerprint("newSecret")
+        )
+        self.assertEqual(
+            self.keyring.verify(self.body, reference_signature(self.body, "oldSecret")), self.keyring.fingerprint("oldSecret")
+        )
+        self.keyring.verify(self.body, reference_signature(self.body, "newSecret"))
+        self.assertIsNone(self.keyring.verify(self.body, reference_signature(self.body, "otherSecret")))
+
+        self.assertEqual(
+            self.keyring.acceptance_counts(), {self.keyring.fingerprint("newSecret"): 2, self.keyring.fingerprint("oldSecret"): 1}
+        )
+
+    def test_replace_keeps_counts_of_retained_keys(self):
+        """
+        Test that rotating keeps the counter of a key still active and drops retired keys.
+        """
+        self.keyring.verify(self.body, reference_signature(self.body, "newSecret"))
+        self.keyring.replace(["nextSecret", "newSecret"])
+
+        self.assertIsNone(self.keyring.verify(self.body, reference_signature(self.body, "oldSecret")))
+        self.assertEqual(self.keyring.fingerprints, [self.keyring.fingerprint("nextSecret"), self.keyring.fingerprint("newSecret")])
+        self.assertEqual(
+            self.keyring.acceptance_counts(), {self.keyring.fingerprint("nextSecret"): 0, self.keyring.fingerprint("newSecret"): 1}
+        )
+
+    def test_replace_expects_at_least_one_secret(self):
+        with self.assertRaises(ValueError):
+            self.keyring.replace([])
+
+    def test_fingerprints_are_salted_per_key_ring(self):
+        """
+        Test that a fingerprint cannot be matched against the plain hash of a guessed secret.
+        """
+        fingerprint = self.keyring.fingerprint("newSecret")
+        self.assertNotEqual(fingerprint, hashlib.sha256(b"newSecret").hexdigest()[:8])
+        self.assertNotEqual(fingerprint, KeyRing(["newSecret"]).fingerprint("newSecret"))
+        self.assertEqual(key_fingerprint("newSecret", b"salt"), key_fingerprint(b"newSecret", b"salt"))
+        with self.assertRaises(ValueError):
+            key_fingerprint("newSecret", b"")
+
+
+if __name__ == "__main__":
+    unittest.main()